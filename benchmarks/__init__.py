@@ -0,0 +1 @@
+# This package is for measuring the interpreter.
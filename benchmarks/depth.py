@@ -0,0 +1,61 @@
+# Measures how parsing, evaluating and printing with explicit stacks scale
+# with nesting depth, in time and in peak traced memory.
+#
+#   python -m benchmarks.depth [max_depth]
+
+import sys
+import time
+import tracemalloc
+
+from typing import Any, Callable, Tuple
+
+from benchmarks.workloads import negations, nested
+from plox.ast_printer import StackPrinter
+from plox.interpreter import StackInterpreter
+from plox.regex_scanner import RegexScanner
+from plox.stack_parser import StackParser
+
+def measure(run: Callable[[], Any]) -> Tuple[Any, float, int]:
+    # Tracing allocations slows everything down, so time one run and trace
+    # another.
+    start = time.perf_counter()
+    result = run()
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return (result, seconds, peak)
+
+def main() -> None:
+    max_depth = int(sys.argv[1]) if len(sys.argv) > 1 else 300000
+
+    depths = [depth for depth in [1000, 10000, 100000] if depth < max_depth] + [max_depth]
+
+    interpreter = StackInterpreter()
+    printer = StackPrinter()
+
+    print(f'{"shape":>9} {"depth":>9} {"phase":>9} {"seconds":>9} {"peak MiB":>9}')
+
+    for (shape, generate) in [('nested', nested), ('negations', negations)]:
+        for depth in depths:
+            tokens = RegexScanner(generate(depth)).scan_tokens()
+
+            expr, seconds, peak = measure(lambda: StackParser(tokens).parse())
+            assert expr is not None
+            phases = [('parse', seconds, peak)]
+
+            for (phase, run) in [
+                ('evaluate', lambda: interpreter.evaluate(expr)),
+                ('print', lambda: printer.print(expr))
+            ]:
+                _, seconds, peak = measure(run)
+                phases.append((phase, seconds, peak))
+
+            for (phase, seconds, peak) in phases:
+                print(f'{shape:>9} {depth:9,} {phase:>9} {seconds:9.3f} {peak / (1 << 20):9.1f}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+# Compares scanning a large script read into a string against scanning it
+# through a memory map: time to the first token, time to the last, and the
+# peak memory Python allocated along the way. Tokens are counted and dropped,
+# as a streaming parser would, so the source itself dominates memory.
+#
+#   python -m benchmarks.mapped [megabytes]
+
+import os
+import sys
+import time
+import tracemalloc
+
+from tempfile import TemporaryDirectory
+from typing import Callable, Iterator, Tuple
+
+from benchmarks.workloads import token_soup
+from plox.mmap_scanner import MmapScanner
+from plox.regex_scanner import Lexer, pattern
+from plox.token import Token
+
+def read(path: str) -> Iterator[Token]:
+    with open(path) as file:
+        source = file.read()
+
+    yield from Lexer().lex(pattern.finditer(source))
+
+def mapped(path: str) -> Iterator[Token]:
+    with open(path, 'rb') as file:
+        yield from MmapScanner(file).scan_tokens()
+
+def measure(scan: Callable[[str], Iterator[Token]], path: str) -> Tuple[float, float]:
+    start = time.perf_counter()
+    tokens = scan(path)
+
+    next(tokens)
+    first = time.perf_counter() - start
+
+    for _ in tokens: pass
+    last = time.perf_counter() - start
+
+    return (first, last)
+
+def peak(scan: Callable[[str], Iterator[Token]], path: str) -> int:
+    tracemalloc.start()
+
+    for _ in scan(path): pass
+
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return peak
+
+def main() -> None:
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'soup.lox')
+
+        with open(path, 'w') as file:
+            # Repeat one megabyte of soup rather than generate it all.
+            chunk = token_soup(1 << 20) + '\n'
+            for _ in range(megabytes): file.write(chunk)
+
+        print(f'{os.path.getsize(path):,} bytes')
+
+        for (name, scan) in [('read', read), ('mmap', mapped)]:
+            first, last = measure(scan, path)
+            memory = peak(scan, path)
+
+            print(
+                f'{name:>5}: first token {first * 1000:8.1f} ms '
+                f'last token {last:7.2f} s '
+                f'peak {memory / (1 << 20):7.1f} MiB'
+            )
+
+if __name__ == '__main__':
+    main()
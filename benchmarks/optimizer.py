@@ -0,0 +1,64 @@
+# Compares node counts and evaluation time of expressions before and after
+# constant folding.
+#
+#   python -m benchmarks.optimizer [expressions] [operands_per_expression]
+
+import sys
+import time
+
+from typing import Callable, List
+
+import plox.error
+
+from benchmarks.workloads import expression
+from plox.expressions import Expr
+from plox.interpreter import Interpreter
+from plox.optimizer import ConstantFolder, NodeCounter
+from plox.parser import Parser
+from plox.regex_scanner import RegexScanner
+
+repeats = 5
+
+def evaluate_all(interpreter: Interpreter, expressions: List[Expr]) -> None:
+    for expr in expressions:
+        try:
+            interpreter.evaluate(expr)
+        except plox.error.RuntimeError:
+            pass
+
+def best_time(run: Callable[[], None]) -> float:
+    best = float('inf')
+
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    leaves = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    expressions: List[Expr] = []
+
+    for seed in range(count):
+        tokens = RegexScanner(expression(leaves, seed)).scan_tokens()
+        expr = Parser(tokens).parse()
+        assert expr is not None
+        expressions.append(expr)
+
+    folder = ConstantFolder()
+    folded = [folder.fold(expr) for expr in expressions]
+
+    counter = NodeCounter()
+    interpreter = Interpreter()
+
+    for (name, trees) in [('before', expressions), ('after', folded)]:
+        nodes = sum(counter.count(expr) for expr in trees)
+        seconds = best_time(lambda: evaluate_all(interpreter, trees))
+
+        print(f'{name:>6}: {nodes:9,} nodes {seconds:8.3f} s')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+# Compares the ways an Interpreter can print the values of many expressions:
+# a print() per value, a BufferedSink, and a CollectingSink. Values go to a
+# file that is block buffered, like a pipe, and to one that is line buffered,
+# like a terminal.
+#
+#   python -m benchmarks.output [count]
+
+import os
+import sys
+import time
+
+from contextlib import redirect_stdout
+from tempfile import TemporaryDirectory
+from typing import List
+
+from benchmarks.workloads import expression
+from plox.expressions import Expr
+from plox.interpreter import Interpreter
+from plox.parser import Parser
+from plox.regex_scanner import RegexScanner
+from plox.sink import BufferedSink, CollectingSink, Sink
+
+def measure(sink: Sink, expressions: List[Expr]) -> float:
+    interpret = Interpreter(sink=sink).interpret
+
+    start = time.perf_counter()
+
+    for expr in expressions: interpret(expr)
+    sink.flush()
+
+    return time.perf_counter() - start
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+    # Small expressions, so that printing is a large part of each run.
+    sources = [expression(2, seed) for seed in range(100)]
+    parsed = [Parser(RegexScanner(source).scan_tokens()).parse() for source in sources]
+    expressions = [expr for expr in parsed if expr is not None] * (count // len(sources))
+
+    print(f'{len(expressions):,} values')
+
+    with TemporaryDirectory() as directory:
+        for line_buffering in [False, True]:
+            path = os.path.join(directory, 'values.txt')
+
+            with open(path, 'w', buffering=1 if line_buffering else -1) as file:
+                with redirect_stdout(file):
+                    results = [
+                        ('print', measure(Sink(), expressions)),
+                        ('buffered', measure(BufferedSink(), expressions)),
+                        ('collecting', measure(CollectingSink(), expressions))
+                    ]
+
+            title = 'line buffered' if line_buffering else 'block buffered'
+
+            for (name, seconds) in results:
+                print(f'{title:>14} {name:>10}: {seconds:7.3f} s')
+
+if __name__ == '__main__':
+    main()
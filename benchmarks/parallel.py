@@ -0,0 +1,44 @@
+# Measures how running many independent scripts scales with the number of
+# worker processes.
+#
+#   python -m benchmarks.parallel [scripts] [operands_per_script]
+
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.workloads import expression
+from plox.parallel import run_files
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    leaves = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+
+        for seed in range(count):
+            path = os.path.join(directory, f'{seed}.lox')
+
+            with open(path, 'w') as file:
+                file.write(expression(leaves, seed))
+
+            paths.append(path)
+
+        cores = os.cpu_count() or 1
+        baseline = None
+
+        print(f'{count} scripts of {leaves} operands')
+
+        for jobs in range(1, cores + 1):
+            start = time.perf_counter()
+            run_files(paths, jobs)
+            seconds = time.perf_counter() - start
+
+            if baseline is None: baseline = seconds
+
+            print(f'{jobs:3} jobs: {seconds:8.3f} s {baseline / seconds:6.2f}x')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+# Compares the throughput of the parsing engines on the same tokens, in tokens
+# and in expressions parsed per second.
+#
+#   python -m benchmarks.parsers [expressions] [operands_per_expression]
+
+import sys
+import time
+
+from typing import List, Type
+
+from benchmarks.workloads import expression
+from plox.parser import Parser
+from plox.pratt_parser import PrattParser
+from plox.regex_scanner import RegexScanner
+from plox.stack_parser import StackParser
+from plox.token import Tokens
+
+repeats = 5
+
+def best_time(parser_class: Type[Parser], inputs: List[Tokens]) -> float:
+    best = float('inf')
+
+    for _ in range(repeats):
+        start = time.perf_counter()
+
+        for tokens in inputs:
+            parser_class(tokens).parse()
+
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    leaves = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    inputs = [RegexScanner(expression(leaves, seed)).scan_tokens() for seed in range(count)]
+    tokens = sum(len(tokens) for tokens in inputs)
+
+    print(f'{count:,} expressions, {tokens:,} tokens')
+
+    for parser_class in [Parser, StackParser, PrattParser]:
+        seconds = best_time(parser_class, inputs)
+
+        print(
+            f'{parser_class.__name__:>12}: '
+            f'{tokens / seconds:12,.0f} tokens/s '
+            f'{count / seconds:10,.0f} ASTs/s'
+        )
+
+if __name__ == '__main__':
+    main()
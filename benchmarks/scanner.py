@@ -0,0 +1,48 @@
+# Compares the throughput of the scanning engines.
+#
+#   python -m benchmarks.scanner [size_in_bytes]
+
+import sys
+import time
+
+from typing import Callable
+
+from benchmarks.workloads import token_soup
+from plox.lox import load, scanners
+from plox.token import Tokens
+
+repeats = 5
+
+def best_time(scan: Callable[[], Tokens]) -> float:
+    best = float('inf')
+
+    for _ in range(repeats):
+        start = time.perf_counter()
+        scan()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    source = token_soup(size)
+
+    reference = load(scanners['default'])(source).scan_tokens()
+
+    print(f'{len(source)} bytes, {len(reference)} tokens, best of {repeats}')
+
+    for (name, engine_name) in scanners.items():
+        engine = load(engine_name)
+        tokens = engine(source).scan_tokens()
+
+        if tokens != reference:
+            print(f'{name}: tokens differ from the default scanner')
+            sys.exit(1)
+
+        seconds = best_time(lambda: engine(source).scan_tokens())
+        rate = len(tokens) / seconds
+
+        print(f'{name:>8}: {seconds:8.3f} s {rate:12,.0f} tokens/s')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+# Compares loading serialized expressions against scanning and parsing their
+# source again, and reports how large the encoding is.
+#
+#   python -m benchmarks.serialize [expressions] [operands_per_expression]
+
+import sys
+import time
+
+from typing import Callable
+
+from benchmarks.workloads import expression
+from plox.pratt_parser import PrattParser
+from plox.regex_scanner import RegexScanner
+from plox.serialize import dumps, loads
+
+repeats = 5
+
+def best_time(run: Callable[[], None]) -> float:
+    best = float('inf')
+
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    leaves = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+    sources = [expression(leaves, seed) for seed in range(count)]
+    encoded = [dumps(PrattParser(RegexScanner(source).scan_tokens()).parse()) for source in sources] # type: ignore
+
+    def parse() -> None:
+        for source in sources: PrattParser(RegexScanner(source).scan_tokens()).parse()
+
+    def load() -> None:
+        for data in encoded: loads(data)
+
+    source_bytes = sum(len(source.encode()) for source in sources)
+    encoded_bytes = sum(len(data) for data in encoded)
+
+    print(f'source: {source_bytes:12,} bytes, scan and parse {best_time(parse):8.3f} s')
+    print(f'  AST : {encoded_bytes:12,} bytes, load           {best_time(load):8.3f} s')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+# Compares the latency of running a one-line script through a warm plox
+# server against starting plox cold, both as a new client process per script
+# and as requests on one open connection.
+#
+#   python -m benchmarks.server [runs]
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from tempfile import TemporaryDirectory
+from typing import Callable, List
+
+from plox.client import Client
+
+def median_time(run: Callable[[], object], runs: int) -> float:
+    run()
+
+    times = []
+
+    for _ in range(runs):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+
+    return statistics.median(times)
+
+def process(command: List[str], cwd: str) -> Callable[[], object]:
+    return lambda: subprocess.run(command, cwd=cwd, check=True, stdout=subprocess.DEVNULL)
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    os.environ['PYTHONPATH'] = root
+
+    source = '(1 + 2) * 3 == 9\n'
+
+    with TemporaryDirectory() as directory:
+        with open(os.path.join(directory, 'script.lox'), 'w') as file:
+            file.write(source)
+
+        path = os.path.join(directory, 'plox.sock')
+        server = subprocess.Popen([sys.executable, '-m', 'plox.server', f'--socket={path}'])
+
+        try:
+            while not os.path.exists(path): time.sleep(0.01)
+
+            cold = median_time(process([sys.executable, '-m', 'plox.lox', 'script.lox'], directory), runs)
+            client = median_time(process([sys.executable, '-m', 'plox.client', f'--socket={path}', 'script.lox'], directory), runs)
+
+            connection = Client(path)
+            request = median_time(lambda: connection.run(source), runs * 50)
+            connection.close()
+        finally:
+            server.terminate()
+            server.wait()
+
+    print(f'{"cold python -m plox.lox":>26}: {cold * 1000:8.2f} ms')
+    print(f'{"python -m plox.client":>26}: {client * 1000:8.2f} ms')
+    print(f'{"request on open socket":>26}: {request * 1000:8.3f} ms')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+# Measures time to first result for short-lived plox processes: how long
+# `python -m plox.lox script.lox` takes from launch to exit for a one-line
+# script, against a Python process that does nothing. The difference is what
+# plox adds to each invocation, and is checked against a budget.
+#
+#   python -m benchmarks.startup [runs]
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from tempfile import TemporaryDirectory
+from typing import List
+
+# What plox may add to the startup of a bare Python process, in seconds, for
+# a script whose AST is cached. Importing typing, which every plox module
+# uses, takes a good part of it.
+budget = 0.060
+
+def run(command: List[str], cwd: str) -> float:
+    start = time.perf_counter()
+    subprocess.run(command, cwd=cwd, check=True, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+def median_time(command: List[str], cwd: str, runs: int) -> float:
+    # One run first, to warm the file system and the AST and bytecode caches.
+    run(command, cwd)
+    return statistics.median(run(command, cwd) for _ in range(runs))
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    os.environ['PYTHONPATH'] = root
+
+    with TemporaryDirectory() as directory:
+        with open(os.path.join(directory, 'script.lox'), 'w') as file:
+            file.write('(1 + 2) * 3 == 9\n')
+
+        python = [sys.executable, '-c', 'pass']
+        plox = [sys.executable, '-m', 'plox.lox']
+
+        bare = median_time(python, directory, runs)
+
+        print(f'{"python -c pass":>24}: {bare * 1000:7.1f} ms')
+
+        for (name, options) in [
+            ('plox', []),
+            ('plox --no-ast-cache', ['--no-ast-cache']),
+            ('plox --scanner=regex', ['--scanner=regex', '--no-ast-cache'])
+        ]:
+            seconds = median_time(plox + options + ['script.lox'], directory, runs)
+            print(f'{name:>24}: {seconds * 1000:7.1f} ms  (+{(seconds - bare) * 1000:.1f} ms)')
+
+            if name == 'plox': overhead = seconds - bare
+
+    within = overhead <= budget
+    print(f'overhead {overhead * 1000:.1f} ms, budget {budget * 1000:.0f} ms: {"ok" if within else "OVER BUDGET"}')
+
+    if not within: sys.exit(1)
+
+if __name__ == '__main__':
+    main()
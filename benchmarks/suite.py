@@ -0,0 +1,174 @@
+# Times Scanner.scan_tokens, Parser.parse, Interpreter.evaluate and
+# AstPrinter.print separately on seeded workloads, optionally saving the
+# timings as a JSON baseline or comparing them against one. When comparing,
+# a phase that got slower by more than the threshold is flagged, and the
+# suite exits with status 1 if any was.
+#
+#   python -m benchmarks.suite [--save=baseline.json] [--compare=baseline.json] [--threshold=0.10]
+#
+# Baselines are only comparable on the same machine and Python version.
+
+import json
+import platform
+import sys
+import time
+
+from typing import Any, Callable, Dict, List
+
+import plox.error
+
+from benchmarks.workloads import (
+    comment_heavy,
+    literal_stream,
+    nested,
+    operator_chain,
+    string_heavy
+)
+
+from plox.ast_printer import AstPrinter
+from plox.expressions import Expr
+from plox.interpreter import Interpreter
+from plox.parser import Parser
+from plox.scanner import Scanner
+from plox.token import Tokens
+
+repeats = 7
+
+# The recursive parser, interpreter and printer need a frame or more per
+# level of the tree, and a long left-associative chain is as deep as it is
+# long.
+recursion_limit = 20000
+
+# Each workload is a list of sources, so that one slow source cannot hide
+# behind the others and fixed costs per run are part of the picture.
+workloads: Dict[str, Callable[[], List[str]]] = {
+    'literals': lambda: [literal_stream(500, seed) for seed in range(30)],
+    'nested'  : lambda: [nested(400) for _ in range(60)],
+    'chains'  : lambda: [operator_chain(1000, seed) for seed in range(20)],
+    'strings' : lambda: [string_heavy(200, seed) for seed in range(10)],
+    'comments': lambda: [comment_heavy(500, seed) for seed in range(10)]
+}
+
+Results = Dict[str, Dict[str, float]]
+
+def best_time(run: Callable[[], Any]) -> float:
+    best = float('inf')
+
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+def scan_all(sources: List[str]) -> List[Tokens]:
+    return [Scanner(source).scan_tokens() for source in sources]
+
+def parse_all(inputs: List[Tokens]) -> List[Expr]:
+    expressions = []
+
+    for tokens in inputs:
+        expression = Parser(tokens).parse()
+        assert expression is not None
+        expressions.append(expression)
+
+    return expressions
+
+def evaluate_all(expressions: List[Expr]) -> None:
+    interpreter = Interpreter()
+
+    for expression in expressions:
+        try:
+            interpreter.evaluate(expression)
+        except plox.error.RuntimeError:
+            pass
+
+def print_all(expressions: List[Expr]) -> None:
+    printer = AstPrinter()
+
+    for expression in expressions:
+        printer.print(expression)
+
+def measure() -> Results:
+    results: Results = {}
+
+    for (name, generate) in workloads.items():
+        sources = generate()
+        inputs = scan_all(sources)
+        expressions = parse_all(inputs)
+
+        results[name] = {
+            'scan'    : best_time(lambda: scan_all(sources)),
+            'parse'   : best_time(lambda: parse_all(inputs)),
+            'evaluate': best_time(lambda: evaluate_all(expressions)),
+            'print'   : best_time(lambda: print_all(expressions))
+        }
+
+    return results
+
+def compare(results: Results, baseline: Results, threshold: float) -> bool:
+    # Prints each timing against the baseline, and returns whether any
+    # regressed beyond the threshold.
+    regressed = False
+
+    for (name, phases) in results.items():
+        for (phase, seconds) in phases.items():
+            before = baseline.get(name, {}).get(phase)
+
+            if before is None:
+                print(f'{name:>9} {phase:>9} {seconds:9.4f} s  (no baseline)')
+                continue
+
+            change = seconds / before - 1
+            flag = ''
+
+            if change > threshold:
+                flag = '  REGRESSION'
+                regressed = True
+
+            print(f'{name:>9} {phase:>9} {seconds:9.4f} s  {change:+7.1%}{flag}')
+
+    return regressed
+
+def main() -> None:
+    options: Dict[str, str] = {}
+
+    for arg in sys.argv[1:]:
+        name, _, value = arg.lstrip('-').partition('=')
+
+        if name not in ('save', 'compare', 'threshold') or value == '':
+            print('Usage: python -m benchmarks.suite [--save=PATH] [--compare=PATH] [--threshold=FRACTION]')
+            sys.exit(64)
+
+        options[name] = value
+
+    threshold = float(options.get('threshold', '0.10'))
+
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), recursion_limit))
+
+    results = measure()
+    regressed = False
+
+    if 'compare' in options:
+        with open(options['compare']) as file:
+            baseline = json.load(file)
+
+        regressed = compare(results, baseline['results'], threshold)
+    else:
+        for (name, phases) in results.items():
+            for (phase, seconds) in phases.items():
+                print(f'{name:>9} {phase:>9} {seconds:9.4f} s')
+
+    if 'save' in options:
+        with open(options['save'], 'w') as file:
+            json.dump({
+                'python': platform.python_version(),
+                'machine': platform.machine(),
+                'repeats': repeats,
+                'results': results
+            }, file, indent=2)
+
+    if regressed: sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+# Measures how many bytes each scanned token costs, comparing the slotted Token
+# with shared lexemes against the original dict-backed Token whose lexemes
+# were sliced out of the source one by one, and against the columnar
+# TokenBuffer.
+#
+#   python -m benchmarks.token_memory [size_in_bytes]
+
+import sys
+import tracemalloc
+
+from typing import Any
+from unittest.mock import patch
+
+import plox.scanner
+
+from benchmarks.workloads import token_soup
+from plox.token_buffer import BufferScanner
+from plox.token import Literal, TokenType
+
+class DictToken:
+    # The Token class as it was before it grew __slots__.
+
+    def __init__(self, type: TokenType, lexeme: str, literal: Literal, line: int) -> None:
+        self.type = type
+        self.lexeme = lexeme
+        self.literal = literal
+        self.line = line
+
+def bytes_per_token(source: str) -> float:
+    tracemalloc.start()
+
+    tokens: Any = plox.scanner.Scanner(source).scan_tokens()
+    size, _ = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+
+    return size / len(tokens)
+
+def bytes_per_buffered_token(source: str) -> float:
+    tracemalloc.start()
+
+    buffer = BufferScanner(source).scan_buffer()
+    size, _ = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+
+    return size / len(buffer)
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    source = token_soup(size)
+
+    with patch('plox.scanner.Token', DictToken), patch('plox.scanner.lexemes', {}):
+        before = bytes_per_token(source)
+
+    after = bytes_per_token(source)
+    buffered = bytes_per_buffered_token(source)
+
+    print(f'{len(source)} bytes of source')
+    print(f' before: {before:6.1f} bytes/token')
+    print(f'  after: {after:6.1f} bytes/token ({after / before:.0%})')
+    print(f' buffer: {buffered:6.1f} bytes/token ({buffered / before:.0%})')
+
+if __name__ == '__main__':
+    main()
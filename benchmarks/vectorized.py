@@ -0,0 +1,93 @@
+# Compares evaluating one expression over many rows of inputs with the
+# vectorized evaluator against evaluating a tree per row with Interpreter.
+#
+#   python -m benchmarks.vectorized [rows]
+
+import random
+import sys
+import time
+
+from typing import Any, Dict, List
+
+import numpy
+
+import plox.error
+
+from plox.expressions import (
+    Binary,
+    Expr,
+    Grouping,
+    Literal,
+    Unary,
+    Visitor
+)
+
+from plox.interpreter import Interpreter
+from plox.parser import Parser
+from plox.scanner import Scanner
+from plox.vectorized import evaluate
+
+formula = '(0 + 1.5) * -0 - 0 / 0 >= 0 == !(0 < 10)'
+
+class Substitute(Visitor):
+    # Rebuilds an expression with each literal replaced by one row's inputs.
+
+    def __init__(self, values: Dict[int, Any]) -> None:
+        self.values = values
+        self.position = 0
+
+    def visit_binary(self, expr: Binary) -> Any:
+        return Binary(expr.left.accept(self), expr.operator, expr.right.accept(self))
+
+    def visit_grouping(self, expr: Grouping) -> Any:
+        return Grouping(expr.expr.accept(self))
+
+    def visit_literal(self, expr: Literal) -> Any:
+        position = self.position
+        self.position += 1
+        return Literal(self.values.get(position, expr.value))
+
+    def visit_unary(self, expr: Unary) -> Any:
+        return Unary(expr.operator, expr.right.accept(self))
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    expression = Parser(Scanner(formula).scan_tokens()).parse()
+    assert expression is not None
+
+    rng = random.Random(0)
+    bound = [0, 2, 3, 4, 5, 6]
+
+    columns = {
+        position: numpy.array([float(rng.randrange(10)) for _ in range(rows)])
+        for position in bound
+    }
+
+    trees: List[Expr] = [
+        expression.accept(Substitute({position: columns[position][row].item() for position in bound}))
+        for row in range(rows)
+    ]
+
+    interpreter = Interpreter()
+
+    start = time.perf_counter()
+
+    for tree in trees:
+        try:
+            interpreter.evaluate(tree)
+        except plox.error.RuntimeError:
+            pass
+
+    scalar = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = evaluate(expression, columns)
+    vectorized = time.perf_counter() - start
+
+    print(f'{rows:,} rows, {int(result.failed.sum()):,} with errors')
+    print(f'    scalar: {scalar:8.3f} s')
+    print(f'vectorized: {vectorized:8.3f} s {scalar / vectorized:8.1f}x')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+# Seeded generators for large Lox inputs. The same seed and size always yield
+# the same source, so timings are comparable across runs and versions.
+
+import random
+
+from plox.regex_scanner import operators
+from plox.scanner import keywords
+
+def token_soup(size: int, seed: int = 0) -> str:
+    # A stream of every kind of lexeme Lox knows about, with comments and line
+    # breaks sprinkled in. The result is not a valid program, but the scanner
+    # does not care about grammar.
+
+    rng = random.Random(seed)
+
+    words = list(keywords) + ['biscotti', 'remaining', 'hazelnut', '_crumb2']
+    symbols = list(operators) + ['/']
+
+    pieces = []
+    length = 0
+
+    while length < size:
+        roll = rng.random()
+
+        if roll < 0.30:
+            piece = rng.choice(words)
+        elif roll < 0.55:
+            piece = rng.choice(symbols)
+        elif roll < 0.75:
+            piece = str(rng.randrange(100000))
+        elif roll < 0.80:
+            piece = f'{rng.randrange(1000)}.{rng.randrange(1000)}'
+        elif roll < 0.90:
+            piece = '"' + 'munch ' * rng.randrange(1, 6) + '"'
+        elif roll < 0.95:
+            piece = '// Please do not mutate the biscotti.\n'
+        else:
+            piece = '\n'
+
+        pieces.append(piece)
+        length += len(piece) + 1
+
+    return ' '.join(pieces)
+
+def expression(leaves: int, seed: int = 0) -> str:
+    # A random, literal-heavy expression with roughly the given number of
+    # operands. Numbers dominate, but strings, booleans and nil appear often
+    # enough that some subexpressions fail their type checks.
+
+    rng = random.Random(seed)
+
+    binary = ['+', '-', '*', '/', '==', '!=', '<', '<=', '>', '>=']
+
+    def operand() -> str:
+        roll = rng.random()
+
+        if roll < 0.85: return str(rng.randrange(10))
+        if roll < 0.92: return '"biscotti"'
+        if roll < 0.97: return rng.choice(['true', 'false'])
+        return 'nil'
+
+    def build(leaves: int) -> str:
+        if leaves <= 1:
+            if rng.random() < 0.1: return '-' + operand()
+            return operand()
+
+        split = rng.randrange(1, leaves)
+        text = f'{build(split)} {rng.choice(binary)} {build(leaves - split)}'
+
+        if rng.random() < 0.5: return f'({text})'
+        return text
+
+    return build(leaves)
+
+def nested(depth: int) -> str:
+    # An operand inside the given number of parentheses.
+    return '(' * depth + '1' + ')' * depth
+
+def negations(depth: int) -> str:
+    # An operand under the given number of prefix minus signs.
+    return '- ' * depth + '1'
+
+def literal_stream(count: int, seed: int = 0) -> str:
+    # Literals of every kind, chained with equality operators so the result
+    # parses and evaluates.
+
+    rng = random.Random(seed)
+
+    def literal() -> str:
+        roll = rng.random()
+
+        if roll < 0.5: return str(rng.randrange(100000))
+        if roll < 0.7: return f'{rng.randrange(1000)}.{rng.randrange(1000)}'
+        if roll < 0.8: return '"biscotti"'
+        return rng.choice(['true', 'false', 'nil'])
+
+    return ' != '.join(literal() for _ in range(count))
+
+def operator_chain(count: int, seed: int = 0) -> str:
+    # A long chain of arithmetic on numbers, without parentheses, so
+    # precedence alone decides the shape of the tree.
+
+    rng = random.Random(seed)
+
+    arithmetic = ['+', '-', '*', '/']
+    pieces = [str(rng.randrange(1, 100))]
+
+    for _ in range(count - 1):
+        pieces.append(rng.choice(arithmetic))
+        pieces.append(str(rng.randrange(1, 100)))
+
+    return ' '.join(pieces)
+
+def string_heavy(count: int, seed: int = 0) -> str:
+    # Long string literals, some spanning lines, concatenated together.
+
+    rng = random.Random(seed)
+
+    def string() -> str:
+        words = ['munch'] * rng.randrange(5, 40)
+        if rng.random() < 0.2: words.append('\n')
+        return '"' + ' '.join(words) + '"'
+
+    return ' + '.join(string() for _ in range(count))
+
+def comment_heavy(count: int, seed: int = 0) -> str:
+    # Operands separated by whole lines of comments.
+
+    rng = random.Random(seed)
+
+    pieces = []
+
+    for _ in range(count):
+        comments = rng.randrange(1, 4)
+        pieces.append('// Please do not mutate the biscotti.\n' * comments)
+        pieces.append(f'{rng.randrange(100)} +\n')
+
+    pieces.append('0')
+
+    return ''.join(pieces)
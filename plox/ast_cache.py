@@ -0,0 +1,60 @@
+import hashlib
+import os
+
+from typing import Optional
+
+import plox.serialize
+
+from plox.expressions import Expr
+
+# Parsed scripts are cached much like Python caches bytecode: next to the
+# script, in a directory of its own. A cache file holds the SHA-256 digest of
+# the source it was parsed from, followed by the serialized expression, and is
+# only used while the digest still matches.
+directory_name = '__ploxcache__'
+
+def cache_path(path: str) -> str:
+    directory, name = os.path.split(path)
+    return os.path.join(directory, directory_name, f'{name}.plox')
+
+def digest(source: str) -> bytes:
+    return hashlib.sha256(source.encode()).digest()
+
+def load(path: str, source: str) -> Optional[Expr]:
+    # Returns the cached expression for the script's source, or None when
+    # there is no usable one.
+    try:
+        with open(cache_path(path), 'rb') as file:
+            data = file.read()
+    except OSError:
+        return None
+
+    size = hashlib.sha256().digest_size
+
+    if data[:size] != digest(source): return None
+
+    try:
+        return plox.serialize.loads(memoryview(data)[size:])
+    except ValueError:
+        return None
+
+def store(path: str, source: str, expression: Expr) -> None:
+    # Caching is an optimization, so failing to write the cache, say in a
+    # read-only directory, is not an error.
+    cached = cache_path(path)
+    temporary = f'{cached}.{os.getpid()}.tmp'
+
+    try:
+        os.makedirs(os.path.dirname(cached), exist_ok=True)
+
+        with open(temporary, 'wb') as file:
+            file.write(digest(source))
+            file.write(plox.serialize.dumps(expression))
+
+        # Readers see either the old file or the new one, never half of one.
+        os.replace(temporary, cached)
+    except OSError:
+        try:
+            os.remove(temporary)
+        except OSError:
+            pass
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, List, Union, cast
 
 from plox.expressions import (
     Binary,
@@ -35,3 +35,41 @@ class AstPrinter(Visitor):
         readable += ')'
 
         return readable
+
+class StackPrinter(AstPrinter):
+    # Prints the same text as AstPrinter with an explicit stack instead of
+    # recursing, so expressions of any depth can be printed.
+
+    def print(self, expr: Expr) -> Any:
+        pieces: List[str] = []
+
+        # Text still to be written and expressions still to be printed, with
+        # the next one on top.
+        work: List[Union[str, Expr]] = [expr]
+
+        while work:
+            item = work.pop()
+
+            if isinstance(item, str):
+                pieces.append(item)
+                continue
+
+            # Comparing tags is much cheaper than isinstance() against the
+            # abstract classes.
+            tag = item.tag
+
+            if tag == Binary.tag:
+                binary = cast(Binary, item)
+                work.extend([')', binary.right, ' ', binary.left, f'({binary.operator.lexeme} '])
+
+            elif tag == Grouping.tag:
+                work.extend([')', cast(Grouping, item).expr, '(group '])
+
+            elif tag == Literal.tag:
+                pieces.append(self.visit_literal(cast(Literal, item)))
+
+            elif tag == Unary.tag:
+                unary = cast(Unary, item)
+                work.extend([')', unary.right, f'({unary.operator.lexeme} '])
+
+        return ''.join(pieces)
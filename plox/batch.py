@@ -0,0 +1,59 @@
+from typing import Any, Iterable, List
+
+import plox.error
+
+from plox.interpreter import Interpreter, stringify
+from plox.parser import Parser
+from plox.regex_scanner import RegexScanner
+
+class Result:
+    def __init__(self, value: Any, errors: List[plox.error.Diagnostic]) -> None:
+        # The value of the expression, which is nil when there were errors.
+        self.value = value
+
+        # Errors from scanning, parsing or evaluating, in the order they were
+        # reported. Evaluation stops at the first runtime error.
+        self.errors = errors
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    @property
+    def text(self) -> str:
+        # What plox would print for the value.
+        return stringify(self.value)
+
+    def __repr__(self) -> str:
+        return f'Result({self.value!r}, {self.errors!r})'
+
+def evaluate_many(sources: Iterable[str]) -> List[Result]:
+    # Evaluates each source as its own program, printing nothing. One
+    # interpreter serves every source, and each source has a reporter of its
+    # own.
+
+    interpreter = Interpreter()
+    evaluate = interpreter.evaluate
+
+    results: List[Result] = []
+    append = results.append
+
+    for source in sources:
+        reporter = plox.error.Reporter()
+        expression = Parser(RegexScanner(source, reporter).scan_tokens(), reporter=reporter).parse()
+
+        if reporter.had_error:
+            append(Result(None, reporter.diagnostics))
+            continue
+
+        if expression is None:
+            append(Result(None, []))
+            continue
+
+        try:
+            append(Result(evaluate(expression), []))
+        except plox.error.RuntimeError as error:
+            reporter.runtime_error(error)
+            append(Result(None, reporter.diagnostics))
+
+    return results
@@ -0,0 +1,113 @@
+import socket
+import sys
+
+from typing import List, Optional
+
+from plox.protocol import (
+    Message,
+    ProtocolError,
+    decode,
+    decode_size,
+    default_socket,
+    encode,
+    header
+)
+
+# A thin front end to a running plox server, taking the place of plox.lox for
+# short scripts. It prints what the server's run printed and exits with the
+# same codes plox would.
+
+usage = 'Usage: python -m plox.client [--socket=PATH] [script]'
+
+class Client:
+    def __init__(self, path: str) -> None:
+        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.socket.connect(path)
+
+    def run(self, source: str) -> Message:
+        self.socket.sendall(encode({'source': source}))
+
+        size = decode_size(self.receive(header.size))
+        response = decode(self.receive(size))
+
+        if 'error' in response: raise ProtocolError(response['error'])
+
+        return response
+
+    def receive(self, size: int) -> bytes:
+        data = bytearray()
+
+        while len(data) < size:
+            chunk = self.socket.recv(size - len(data))
+            if not chunk: raise ProtocolError('Server closed the connection.')
+            data += chunk
+
+        return bytes(data)
+
+    def close(self) -> None:
+        self.socket.close()
+
+def show(response: Message) -> None:
+    sys.stdout.write(response['output'])
+    sys.stderr.write(response['errors'])
+
+def main(args: Optional[List[str]] = None) -> None:
+    if args is None: args = sys.argv[1:]
+
+    path = default_socket()
+    scripts = []
+
+    for arg in args:
+        if arg.startswith('--socket=') and arg != '--socket=':
+            path = arg[len('--socket='):]
+        elif arg.startswith('--'):
+            print(usage)
+            sys.exit(64)
+        else:
+            scripts.append(arg)
+
+    if len(scripts) > 1:
+        print(usage)
+        sys.exit(64)
+
+    try:
+        client = Client(path)
+    except OSError as error:
+        print(f'Could not connect to a plox server at {path}: {error.strerror}.', file=sys.stderr)
+        sys.exit(69)
+
+    try:
+        if scripts:
+            try:
+                with open(scripts[0]) as file:
+                    source = file.read()
+            except OSError as error:
+                print(f'Could not read {scripts[0]}: {error.strerror}.', file=sys.stderr)
+                sys.exit(66)
+
+            response = client.run(source)
+
+            show(response)
+            sys.stdout.flush()
+
+            if response['exit_code'] != 0: sys.exit(response['exit_code'])
+
+        else:
+            while True:
+                try:
+                    line = input('> ')
+                except EOFError:
+                    print('Received EOF, exiting.')
+                    break
+
+                show(client.run(line))
+
+    except ProtocolError as error:
+        print(f'plox server: {error}', file=sys.stderr)
+        sys.exit(70)
+
+    finally:
+        client.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+import operator as op
+
+from typing import Any, Callable, Dict
+
+import plox.error
+
+from plox.expressions import (
+    Binary,
+    Expr,
+    Grouping,
+    Literal,
+    Unary,
+    Visitor
+)
+
+from plox.token import Token, TokenType as TT
+
+# Evaluates a compiled expression.
+Closure = Callable[[], Any]
+
+# Operators that only accept two numbers.
+numeric: Dict[TT, Callable[[float, float], Any]] = {
+    TT.GREATER      : op.gt,
+    TT.GREATER_EQUAL: op.ge,
+    TT.LESS         : op.lt,
+    TT.LESS_EQUAL   : op.le,
+    TT.MINUS        : op.sub,
+    TT.STAR         : op.mul
+}
+
+def compile_numeric(operator: Token, apply: Callable[[float, float], Any], left: Closure, right: Closure) -> Closure:
+    def evaluate() -> Any:
+        a = left()
+        b = right()
+        if a.__class__ is float and b.__class__ is float: return apply(a, b)
+        raise plox.error.RuntimeError(operator, 'Operands must be numbers.')
+
+    return evaluate
+
+def compile_plus(operator: Token, left: Closure, right: Closure) -> Closure:
+    def evaluate() -> Any:
+        a = left()
+        b = right()
+        if a.__class__ is b.__class__ and (a.__class__ is float or a.__class__ is str): return a + b
+        raise plox.error.RuntimeError(operator, 'Operands must be two numbers or two strings.')
+
+    return evaluate
+
+def compile_slash(operator: Token, left: Closure, right: Closure) -> Closure:
+    def evaluate() -> Any:
+        a = left()
+        b = right()
+
+        if a.__class__ is not float or b.__class__ is not float:
+            raise plox.error.RuntimeError(operator, 'Operands must be numbers.')
+
+        if b == 0:
+            raise plox.error.RuntimeError(operator, 'Division by zero.')
+
+        return a / b
+
+    return evaluate
+
+def compile_negate(operator: Token, right: Closure) -> Closure:
+    def evaluate() -> Any:
+        a = right()
+        if a.__class__ is float: return -a
+        raise plox.error.RuntimeError(operator, 'Operand must be a number.')
+
+    return evaluate
+
+class ClosureCompiler(Visitor):
+    # Translates an expression once into nested Python closures, resolving
+    # each operator and its type checks at compile time. Calling the result
+    # evaluates the expression without visiting the tree, and raises the same
+    # plox.error.RuntimeError that Interpreter would.
+
+    def compile(self, expr: Expr) -> Closure:
+        return expr.accept(self)
+
+    def visit_binary(self, expr: Binary) -> Closure:
+        left = self.compile(expr.left)
+        right = self.compile(expr.right)
+
+        operator = expr.operator
+        token_type = operator.type
+
+        if token_type == TT.BANG_EQUAL:
+            return lambda: left() != right()
+
+        if token_type == TT.EQUAL_EQUAL:
+            return lambda: left() == right()
+
+        if token_type in numeric:
+            return compile_numeric(operator, numeric[token_type], left, right)
+
+        if token_type == TT.PLUS:
+            return compile_plus(operator, left, right)
+
+        if token_type == TT.SLASH:
+            return compile_slash(operator, left, right)
+
+        # Like Interpreter, evaluate both operands of an unknown operator and
+        # produce nil.
+        def unknown() -> None:
+            left()
+            right()
+
+        return unknown
+
+    def visit_grouping(self, expr: Grouping) -> Closure:
+        # A grouping has no behavior of its own.
+        return self.compile(expr.expr)
+
+    def visit_literal(self, expr: Literal) -> Closure:
+        value = expr.value
+        return lambda: value
+
+    def visit_unary(self, expr: Unary) -> Closure:
+        right = self.compile(expr.right)
+
+        operator = expr.operator
+        token_type = operator.type
+
+        if token_type == TT.MINUS:
+            return compile_negate(operator, right)
+
+        if token_type == TT.BANG:
+            # The negation of Lox's truthiness: only false and nil are falsey.
+            def bang() -> bool:
+                value = right()
+                return value is None or value is False
+
+            return bang
+
+        def unknown() -> None:
+            right()
+
+        return unknown
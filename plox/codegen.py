@@ -0,0 +1,185 @@
+import math
+
+from functools import lru_cache
+from types import CodeType
+from typing import Any, Callable, Dict, List
+
+import plox.error
+
+from plox.expressions import (
+    Binary,
+    Expr,
+    Grouping,
+    Literal,
+    Unary,
+    Visitor
+)
+
+from plox.token import Token, TokenType as TT
+
+# The comparison and arithmetic operators that only accept two numbers, and
+# the Python operator that implements each.
+numeric: Dict[TT, str] = {
+    TT.GREATER      : '>',
+    TT.GREATER_EQUAL: '>=',
+    TT.LESS         : '<',
+    TT.LESS_EQUAL   : '<=',
+    TT.MINUS        : '-',
+    TT.STAR         : '*'
+}
+
+@lru_cache(maxsize=1024)
+def compile_source(source: str) -> CodeType:
+    # Expressions with the same shape and literals generate the same source,
+    # whatever lines their operators are on, so they share one code object.
+    return compile(source, '<lox>', 'exec')
+
+class CodeGenerator(Visitor):
+    # Translates an expression into the source of a Python function that
+    # evaluates it, with the type and division-by-zero checks written inline.
+    # Operator tokens are passed to the function as globals named _k0, _k1 and
+    # so on, so that a runtime error reports the line of the operator that
+    # caused it, exactly as Interpreter would.
+    #
+    # Each operator becomes a flat statement that stores its value in a
+    # temporary, preceded by its checks, rather than a nested expression, so
+    # that long chains of operators do not exceed the nesting limits of
+    # Python's parser. Visiting a node returns the operand that holds its
+    # value: a temporary or a literal.
+
+    def __init__(self) -> None:
+        self.tokens: List[Token] = []
+        self.constants: List[Any] = []
+        self.lines: List[str] = []
+        self.temporaries = 0
+
+    def generate(self, expr: Expr) -> str:
+        self.tokens = []
+        self.constants = []
+        self.lines = []
+        self.temporaries = 0
+
+        result = expr.accept(self)
+
+        body = ''.join(f'    {line}\n' for line in self.lines)
+        return f'def evaluate():\n{body}    return {result}\n'
+
+    def compile(self, expr: Expr) -> Callable[[], Any]:
+        code = compile_source(self.generate(expr))
+
+        namespace: Dict[str, Any] = {'_error': plox.error.RuntimeError}
+
+        for (index, token) in enumerate(self.tokens):
+            namespace[f'_k{index}'] = token
+
+        for (index, constant) in enumerate(self.constants):
+            namespace[f'_c{index}'] = constant
+
+        exec(code, namespace)
+
+        return namespace['evaluate']
+
+    def visit_binary(self, expr: Binary) -> str:
+        # Both operands are evaluated, left first, before either is checked.
+        a = expr.left.accept(self)
+        b = expr.right.accept(self)
+
+        token_type = expr.operator.type
+        result = self.temporary()
+
+        if token_type == TT.BANG_EQUAL:
+            self.lines.append(f'{result} = {a} != {b}')
+            return result
+
+        if token_type == TT.EQUAL_EQUAL:
+            self.lines.append(f'{result} = {a} == {b}')
+            return result
+
+        if token_type in numeric:
+            self.check_numbers(expr.operator, a, b)
+            self.lines.append(f'{result} = {a} {numeric[token_type]} {b}')
+            return result
+
+        if token_type == TT.PLUS:
+            token = self.token(expr.operator)
+
+            self.lines.append(
+                f'if {a}.__class__ is not {b}.__class__ or '
+                f'({a}.__class__ is not float and {a}.__class__ is not str): '
+                f"raise _error({token}, 'Operands must be two numbers or two strings.')"
+            )
+
+            self.lines.append(f'{result} = {a} + {b}')
+            return result
+
+        if token_type == TT.SLASH:
+            token = self.check_numbers(expr.operator, a, b)
+
+            self.lines.append(f"if {b} == 0: raise _error({token}, 'Division by zero.')")
+            self.lines.append(f'{result} = {a} / {b}')
+            return result
+
+        # Like Interpreter, evaluate both operands of an unknown operator and
+        # produce nil.
+        self.lines.append(f'{result} = None')
+        return result
+
+    def visit_grouping(self, expr: Grouping) -> str:
+        # Every operator's value is in a temporary of its own already.
+        return expr.expr.accept(self)
+
+    def visit_literal(self, expr: Literal) -> str:
+        value = expr.value
+
+        # Infinity has no literal spelling in Python.
+        if isinstance(value, float) and not math.isfinite(value):
+            self.constants.append(value)
+            return f'_c{len(self.constants) - 1}'
+
+        # Parenthesized, so that checks can look up the literal's class.
+        return f'({value!r})'
+
+    def visit_unary(self, expr: Unary) -> str:
+        a = expr.right.accept(self)
+
+        token_type = expr.operator.type
+        result = self.temporary()
+
+        if token_type == TT.MINUS:
+            token = self.token(expr.operator)
+
+            self.lines.append(f"if {a}.__class__ is not float: raise _error({token}, 'Operand must be a number.')")
+            self.lines.append(f'{result} = -{a}')
+            return result
+
+        if token_type == TT.BANG:
+            # The negation of Lox's truthiness: only false and nil are falsey.
+            # Python warns about comparing the identity of a literal, so a
+            # literal operand goes through the temporary first.
+            if a.startswith('('):
+                self.lines.append(f'{result} = {a}')
+                a = result
+
+            self.lines.append(f'{result} = {a} is None or {a} is False')
+            return result
+
+        self.lines.append(f'{result} = None')
+        return result
+
+    def check_numbers(self, operator: Token, a: str, b: str) -> str:
+        token = self.token(operator)
+
+        self.lines.append(
+            f'if {a}.__class__ is not float or {b}.__class__ is not float: '
+            f"raise _error({token}, 'Operands must be numbers.')"
+        )
+
+        return token
+
+    def token(self, token: Token) -> str:
+        self.tokens.append(token)
+        return f'_k{len(self.tokens) - 1}'
+
+    def temporary(self) -> str:
+        self.temporaries += 1
+        return f'_t{self.temporaries - 1}'
@@ -1,30 +1,107 @@
 import builtins
-import sys
+
+from typing import List, Optional
 
 import plox.token
 
-had_error = False
-had_runtime_error = False
+from plox.sink import Sink
+
+class Diagnostic:
+    def __init__(self, line: int, where: str, message: str, runtime: bool = False) -> None:
+        self.line = line
+        self.where = where
+        self.message = message
+
+        # Whether the error was raised while evaluating, rather than found
+        # while scanning or parsing.
+        self.runtime = runtime
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Diagnostic): return False
+
+        return (
+            self.line == other.line and
+            self.where == other.where and
+            self.message == other.message and
+            self.runtime == other.runtime
+        )
+
+    def __repr__(self) -> str:
+        runtime = ', runtime=True' if self.runtime else ''
+        return f'Diagnostic({self.line}, {self.where!r}, {self.message!r}{runtime})'
+
+    def __str__(self) -> str:
+        # The error as plox prints it.
+        if self.runtime: return f'{self.message}\n[line {self.line}]'
+        return f'[line {self.line}] Error{self.where}: {self.message}'
 
 class RuntimeError(builtins.RuntimeError):
     def __init__(self, token: plox.token.Token, message: str):
         self.token = token
         self.message = message
 
-def error(line: int, message: str) -> None:
-    report(line, '', message)
+class Reporter:
+    # The errors of one run, collected in the order they are reported rather
+    # than printed right away. Each run owns its reporter and hands it to its
+    # scanner, parser and interpreter, so runs on other threads, or
+    # interleaved on one, never see each other's errors.
+
+    def __init__(self) -> None:
+        self.diagnostics: List[Diagnostic] = []
+
+        self.had_error = False
+        self.had_runtime_error = False
+
+        # How many of the diagnostics flush() has printed already.
+        self.flushed = 0
+
+    @property
+    def exit_code(self) -> int:
+        # What plox exits with after the run.
+        if self.had_error: return 65
+        if self.had_runtime_error: return 70
+        return 0
+
+    def error(self, line: int, message: str) -> None:
+        self.report(line, '', message)
+
+    def parse_error(self, token: plox.token.Token, message: str) -> None:
+        if token.type == plox.token.TokenType.EOF:
+            self.report(token.line, ' at end', message)
+        else:
+            self.report(token.line, f" at '{token.lexeme}'", message)
+
+    def report(self, line: int, where: str, message: str) -> None:
+        self.diagnostics.append(Diagnostic(line, where, message))
+        self.had_error = True
+
+    def runtime_error(self, error: RuntimeError) -> None:
+        self.diagnostics.append(Diagnostic(error.token.line, '', error.message, runtime=True))
+        self.had_runtime_error = True
+
+    def clear(self) -> None:
+        # Forgets every error, for reporting the errors of a source again
+        # after it changes.
+        self.diagnostics.clear()
+
+        self.had_error = False
+        self.had_runtime_error = False
+        self.flushed = 0
+
+    def extend(self, other: 'Reporter') -> None:
+        # Adds the errors of another reporter after this one's.
+        self.diagnostics.extend(other.diagnostics)
+
+        self.had_error = self.had_error or other.had_error
+        self.had_runtime_error = self.had_runtime_error or other.had_runtime_error
 
-def runtime_error(error: RuntimeError) -> None:
-    print(f"{error.message}\n[line {error.token.line}]", file=sys.stderr)
-    had_runtime_error = True
+    def flush(self, sink: Optional[Sink] = None) -> None:
+        # Prints the errors reported since the last flush to the sink, or
+        # straight to standard output and standard error without one.
+        if sink is None: sink = Sink()
 
-def parse_error(token: plox.token.Token, message: str) -> None:
-    if token.type == plox.token.TokenType.EOF:
-        report(token.line, ' at end', message)
-    else:
-        report(token.line, f" at '{token.lexeme}'", message)
+        for diagnostic in self.diagnostics[self.flushed:]:
+            if diagnostic.runtime: sink.print_error(str(diagnostic))
+            else: sink.print(str(diagnostic))
 
-def report(line: int, where: str, message: str) -> None:
-    print(f'[line {line}] Error{where}: {message}')
-    global had_error
-    had_error = True
+        self.flushed = len(self.diagnostics)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Callable, List
 
 import plox.token as token
 
@@ -20,69 +20,122 @@ class Visitor(ABC):
     def visit_unary(self, expr: 'Unary') -> Any:
         pass
 
+    def dispatch_table(self) -> List[Callable[[Any], Any]]:
+        return [
+            self.visit_binary,
+            self.visit_grouping,
+            self.visit_literal,
+            self.visit_unary
+        ]
+
 class Expr(ABC):
+    __slots__ = ()
+
+    # The index of the class in Visitor.dispatch_table().
+    tag: int
+
     @abstractmethod
     def accept(self, visitor: Visitor) -> Any:
         pass
 
 class Binary(Expr):
+    __slots__ = ('left', 'operator', 'right', 'cached_hash')
+
+    tag = 0
+
     def __init__(self, left: Expr, operator: token.Token, right: Expr) -> None:
         self.left = left
         self.operator = operator
         self.right = right
+        self.cached_hash = hash(('Binary', left, operator, right))
 
     def accept(self, visitor: Visitor) -> Any:
          return visitor.visit_binary(self)
 
     def __eq__(self, other: object) -> bool:
+        if self is other: return True
         if not isinstance(other, Binary): return False
+        if self.cached_hash != other.cached_hash: return False
 
-        return all([
-            self.left == other.left,
-            self.operator == other.operator,
+        return (
+            self.left == other.left and
+            self.operator == other.operator and
             self.right == other.right
-        ])
+        )
+
+    def __hash__(self) -> int:
+        return self.cached_hash
 
 class Grouping(Expr):
+    __slots__ = ('expr', 'cached_hash')
+
+    tag = 1
+
     def __init__(self, expr: Expr) -> None:
         self.expr = expr
+        self.cached_hash = hash(('Grouping', expr))
 
     def accept(self, visitor: Visitor) -> Any:
          return visitor.visit_grouping(self)
 
     def __eq__(self, other: object) -> bool:
+        if self is other: return True
         if not isinstance(other, Grouping): return False
+        if self.cached_hash != other.cached_hash: return False
 
-        return all([
+        return (
             self.expr == other.expr
-        ])
+        )
+
+    def __hash__(self) -> int:
+        return self.cached_hash
 
 class Literal(Expr):
+    __slots__ = ('value', 'cached_hash')
+
+    tag = 2
+
     def __init__(self, value: token.Literal) -> None:
         self.value = value
+        self.cached_hash = hash(('Literal', value))
 
     def accept(self, visitor: Visitor) -> Any:
          return visitor.visit_literal(self)
 
     def __eq__(self, other: object) -> bool:
+        if self is other: return True
         if not isinstance(other, Literal): return False
+        if self.cached_hash != other.cached_hash: return False
 
-        return all([
+        return (
             self.value == other.value
-        ])
+        )
+
+    def __hash__(self) -> int:
+        return self.cached_hash
 
 class Unary(Expr):
+    __slots__ = ('operator', 'right', 'cached_hash')
+
+    tag = 3
+
     def __init__(self, operator: token.Token, right: Expr) -> None:
         self.operator = operator
         self.right = right
+        self.cached_hash = hash(('Unary', operator, right))
 
     def accept(self, visitor: Visitor) -> Any:
          return visitor.visit_unary(self)
 
     def __eq__(self, other: object) -> bool:
+        if self is other: return True
         if not isinstance(other, Unary): return False
+        if self.cached_hash != other.cached_hash: return False
 
-        return all([
-            self.operator == other.operator,
+        return (
+            self.operator == other.operator and
             self.right == other.right
-        ])
+        )
+
+    def __hash__(self) -> int:
+        return self.cached_hash
@@ -20,13 +20,32 @@ def main() -> None:
     # sys.argv[0] is the script name, which we drop.
     args = sys.argv[1:]
 
+    # With --check, compare the module on disk to what would be generated
+    # instead of overwriting it.
+    check = args[:1] == ['--check']
+    if check: args = args[1:]
+
     if len(args) != 1:
-        print('Usage: generate_ast <output_directory>')
+        print('Usage: generate_ast [--check] <output_directory>')
         sys.exit(64)
 
     output_directory = args[0]
     output_path = f'{output_directory}/{module_name}.py'
 
+    source = generate()
+
+    if check:
+        with open(output_path) as file:
+            if file.read() != source:
+                print(f'{output_path} is out of date.')
+                sys.exit(1)
+
+        return
+
+    with open(output_path, 'w') as file:
+        file.write(source)
+
+def generate() -> str:
     lines: List[str] = []
 
     write_imports(lines)
@@ -38,19 +57,18 @@ def main() -> None:
     write_expression_base(lines)
     lines.append('\n')
 
-    for (name, attributes) in expressions.items():
-        write_expression(lines, name, attributes)
+    for (tag, (name, attributes)) in enumerate(expressions.items()):
+        write_expression(lines, name, tag, attributes)
         lines.append('\n')
 
     lines.pop()
 
-    with open(output_path, 'w') as file:
-        file.writelines(lines)
+    return ''.join(lines)
 
 def write_imports(lines: List[str]) -> None:
     lines.extend([
         'from abc import ABC, abstractmethod\n',
-        'from typing import Any\n',
+        'from typing import Any, Callable, List\n',
         '\n',
         'import plox.token as token\n'
     ])
@@ -66,22 +84,50 @@ def write_visitor_base(lines: List[str], names: List[str]) -> None:
             '\n'
         ])
 
-    # Remove last newline that separates the visitor methods. Line breaks
-    # between definitions should be enforced by the top-level function.
+    # Write dispatch_table(). Indexing it with an expression's tag reaches the
+    # right visit method in one step instead of going through accept().
+    lines.extend([
+        f'{indent}def dispatch_table(self) -> List[Callable[[Any], Any]]:\n',
+        f'{indent}{indent}return [\n'
+    ])
+
+    for name in names:
+        lines.append(f'{indent}{indent}{indent}self.visit_{name.lower()}')
+        lines.append(',\n')
+
+    # Pop the trailing comma and newline in the list and replace the newline.
     lines.pop()
+    lines.append('\n')
+
+    lines.append(f'{indent}{indent}]\n')
 
 def write_expression_base(lines: List[str]) -> None:
     lines.extend([
         'class Expr(ABC):\n',
+        f'{indent}__slots__ = ()\n',
+        '\n',
+        f'{indent}# The index of the class in Visitor.dispatch_table().\n',
+        f'{indent}tag: int\n',
+        '\n',
         f'{indent}@abstractmethod\n',
         f'{indent}def accept(self, visitor: Visitor) -> Any:\n',
         f'{indent}{indent}pass\n'
     ])
 
-def write_expression(lines: List[str], name: str, attributes: Attributes) -> None:
+def write_expression(lines: List[str], name: str, tag: int, attributes: Attributes) -> None:
     # Write expression class definition.
     lines.append(f'class {name}({base_name}):\n')
 
+    # Write __slots__. Expressions are numerous and never gain attributes
+    # after construction. The last slot caches the structural hash.
+    slots = [f"'{attribute}'" for (attribute, _) in attributes] + ["'cached_hash'"]
+    lines.append(f'{indent}__slots__ = ({", ".join(slots)})\n')
+    lines.append('\n')
+
+    # Write the dispatch tag.
+    lines.append(f'{indent}tag = {tag}\n')
+    lines.append('\n')
+
     # Write __init__().
     lines.append(f'{indent}def __init__(self,')
     for (attribute, attribute_type) in attributes:
@@ -97,6 +143,11 @@ def write_expression(lines: List[str], name: str, attributes: Attributes) -> Non
     for (attribute, _) in attributes:
         lines.append(f'{indent}{indent}self.{attribute} = {attribute}\n')
 
+    # Compute the structural hash once. Subexpressions have cached theirs
+    # already, so this never recurses.
+    hashed = ', '.join([f"'{name}'"] + [attribute for (attribute, _) in attributes])
+    lines.append(f'{indent}{indent}self.cached_hash = hash(({hashed}))\n')
+
     lines.append('\n')
 
     # Write accept().
@@ -109,21 +160,31 @@ def write_expression(lines: List[str], name: str, attributes: Attributes) -> Non
     # Write __eq__().
     lines.extend([
         f'{indent}def __eq__(self, other: object) -> bool:\n',
+        f'{indent}{indent}if self is other: return True\n',
         f'{indent}{indent}if not isinstance(other, {name}): return False\n',
+        f'{indent}{indent}if self.cached_hash != other.cached_hash: return False\n',
         '\n'
-        f'{indent}{indent}return all([\n'
+        f'{indent}{indent}return (\n'
     ])
 
+    # Compare attributes one at a time, stopping at the first difference.
     for (attribute, _) in attributes:
         lines.append(f'{indent}{indent}{indent}self.{attribute} == other.{attribute}')
-        lines.append(',\n')
+        lines.append(' and\n')
 
-    # Pop the trailing comma and newline in the argument list to all() and
-    # replace the newline.
+    # Pop the trailing conjunction and newline and replace the newline.
     lines.pop()
     lines.append('\n')
 
-    lines.append(f'{indent}{indent}])\n')
+    lines.append(f'{indent}{indent})\n')
+
+    lines.append('\n')
+
+    # Write __hash__().
+    lines.extend([
+        f'{indent}def __hash__(self) -> int:\n',
+        f'{indent}{indent}return self.cached_hash\n'
+    ])
 
 if __name__ == '__main__':
     main()
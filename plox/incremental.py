@@ -0,0 +1,508 @@
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, Iterator, List, Match, Optional, Tuple, cast
+
+from plox.error import Diagnostic, Reporter
+from plox.expressions import Binary, Expr
+from plox.parser import Parser
+from plox.regex_scanner import Lexer, pattern
+
+from plox.token import (
+    Token,
+    TokenType as TT,
+    Tokens
+)
+
+class Span:
+    # The expression a grammar rule produced when it started at a token, and
+    # the number of tokens up to the token after the expression. That token
+    # is the last one the rule looked at. Spans hold their tokens themselves
+    # rather than indexes, so spans after an edit stay good without being
+    # moved.
+    #
+    # A span knows the spans of the rules it called, and the spans of the
+    # rules that called it, so an edit can find every span that looked at the
+    # tokens it replaced.
+
+    __slots__ = ('rule', 'start', 'end', 'length', 'expr', 'callers', 'callees', 'stale')
+
+    def __init__(
+        self,
+        rule: str,
+        start: Token,
+        end: Token,
+        length: int,
+        expr: Expr,
+        callees: List['Span']
+    ) -> None:
+        self.rule = rule
+        self.start = start
+        self.end = end
+        self.length = length
+        self.expr = expr
+
+        self.callers: List[Span] = []
+        self.callees = callees
+
+        # Whether an edit has discarded the span.
+        self.stale = False
+
+        for callee in callees: callee.callers.append(self)
+
+class Spans:
+    # The spans of every rule at every token, kept for reuse across parses.
+    #
+    # Binary operator rules parse chains of operands, and also keep a link
+    # for each operator of the chain: a span from the start of the chain to
+    # the end of the operand after the operator. Each link calls the one
+    # before it, so an edit in a chain keeps the links before it, and the
+    # chain is parsed again from the last of them rather than from its start.
+
+    def __init__(self) -> None:
+        # Keyed by the rule and the id of the token it started at. The span
+        # holds on to the token, so the id is not reused while it is here.
+        self.spans: Dict[Tuple[str, int], Span] = {}
+
+        # The links of the chain each rule parsed from each token, in order,
+        # keyed like the spans.
+        self.links: Dict[Tuple[str, int], List[Span]] = {}
+
+        # The spans and links that start or end at each token, by the
+        # token's id, and then by their own.
+        self.touching: Dict[int, Dict[int, Span]] = {}
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+    def get(self, rule: str, start: Token) -> Optional[Span]:
+        return self.spans.get((rule, id(start)))
+
+    def last_link(self, rule: str, start: Token) -> Optional[Span]:
+        links = self.links.get((rule, id(start)))
+        return links[-1] if links else None
+
+    def add(self, span: Span) -> None:
+        self.spans[(span.rule, id(span.start))] = span
+        self.touch(span)
+
+    def link(self, span: Span) -> None:
+        self.links.setdefault((span.rule, id(span.start)), []).append(span)
+        self.touch(span)
+
+    def touch(self, span: Span) -> None:
+        self.touching.setdefault(id(span.start), {})[id(span)] = span
+        self.touching.setdefault(id(span.end), {})[id(span)] = span
+
+    def discard(self, tokens: Iterable[Token]) -> None:
+        # Forgets the spans that looked at any of the tokens. A rule that
+        # looked at a token either started there, or called a rule that
+        # started or ended there, so these are the spans touching the tokens
+        # and everything that called them, directly or not.
+        stale: List[Span] = []
+        chains = set()
+
+        for token in tokens:
+            stale.extend(self.touching.pop(id(token), {}).values())
+
+        while stale:
+            span = stale.pop()
+            if span.stale: continue
+
+            span.stale = True
+
+            key = (span.rule, id(span.start))
+
+            if self.spans.get(key) is span: del self.spans[key]
+            else: chains.add(key)
+
+            for token in (span.start, span.end):
+                touching = self.touching.get(id(token))
+                if touching is None: continue
+
+                touching.pop(id(span), None)
+                if not touching: del self.touching[id(token)]
+
+            # The rules it called may still be good, but no longer have this
+            # caller.
+            for callee in span.callees:
+                if span in callee.callers: callee.callers.remove(span)
+
+            stale.extend(span.callers)
+
+        # A link calls the one before it, so the links that are gone are the
+        # last ones of their chain.
+        for key in chains:
+            links = self.links.get(key)
+            if links is None: continue
+
+            while links and links[-1].stale: links.pop()
+            if not links: del self.links[key]
+
+class IncrementalParser(Parser):
+    # A Parser that remembers what each rule produced at each position, and
+    # reuses what it remembers instead of parsing the same tokens again.
+
+    def __init__(self, tokens: Tokens, spans: Spans, reporter: Optional[Reporter] = None) -> None:
+        super().__init__(tokens, reporter=reporter)
+
+        self.spans = spans
+
+        # The spans of the rules each rule in progress has called so far.
+        self.calls: List[List[Span]] = []
+
+    def memoized(self, rule: str, parse: Callable[[], Expr]) -> Expr:
+        tokens = cast(Tokens, self.tokens)
+
+        start = self.current
+        span = self.spans.get(rule, tokens[start])
+
+        if span is None:
+            self.calls.append([])
+
+            try:
+                expr = parse()
+            finally:
+                callees = self.calls.pop()
+
+            span = Span(rule, tokens[start], tokens[self.current], self.current - start, expr, callees)
+            self.spans.add(span)
+        else:
+            self.current += span.length
+
+        if self.calls: self.calls[-1].append(span)
+
+        return span.expr
+
+    def called(self, rule: Callable[[], Expr]) -> Span:
+        # Parses with a memoized rule, and returns its span.
+        self.calls.append([])
+
+        try:
+            rule()
+        finally:
+            spans = self.calls.pop()
+
+        return spans[-1]
+
+    def chain(self, rule: str, operand: Callable[[], Expr], *operators: TT) -> Expr:
+        return self.memoized(rule, lambda: self.links(rule, operand, operators))
+
+    def links(self, rule: str, operand: Callable[[], Expr], operators: Tuple[TT, ...]) -> Expr:
+        # Parses a chain of operands joined by left-associative operators, as
+        # the rule does in Parser, starting after the last link of the chain
+        # that is still good.
+        tokens = cast(Tokens, self.tokens)
+
+        first = self.current
+        start = tokens[first]
+
+        link = self.spans.last_link(rule, start)
+
+        if link is None:
+            link = self.called(operand)
+        else:
+            self.current += link.length
+
+        while self.match(*operators):
+            operator = self.previous()
+            right = self.called(operand)
+
+            expr = self.node(Binary(link.expr, operator, right.expr))
+
+            link = Span(rule, start, tokens[self.current], self.current - first, expr, [link, right])
+            self.spans.link(link)
+
+        # The rule's own span calls only the last link, which calls the rest.
+        self.calls[-1].append(link)
+
+        return link.expr
+
+    def equality(self) -> Expr:
+        return self.chain('equality', self.comparison, TT.BANG_EQUAL, TT.EQUAL_EQUAL)
+
+    def comparison(self) -> Expr:
+        return self.chain('comparison', self.term, TT.GREATER, TT.GREATER_EQUAL, TT.LESS, TT.LESS_EQUAL)
+
+    def term(self) -> Expr:
+        return self.chain('term', self.factor, TT.MINUS, TT.PLUS)
+
+    def factor(self) -> Expr:
+        return self.chain('factor', self.unary, TT.SLASH, TT.STAR)
+
+    def unary(self) -> Expr:
+        return self.memoized('unary', super().unary)
+
+    def primary(self) -> Expr:
+        return self.memoized('primary', super().primary)
+
+class Shift:
+    # How many lines the tokens sharing it are short by.
+
+    __slots__ = ('lines',)
+
+    def __init__(self) -> None:
+        self.lines = 0
+
+class DocumentToken(Token):
+    # A token whose line is stored short by a shift it shares with other
+    # tokens, so that moving all of them down a few lines is one addition.
+
+    __slots__ = ('stored', 'shift')
+
+    def __init__(self, token: Token, shift: Shift) -> None:
+        self.shift = shift
+        super().__init__(token.type, token.lexeme, token.literal, token.line)
+
+    @property
+    def line(self) -> int:
+        return self.stored + self.shift.lines
+
+    @line.setter
+    def line(self, line: int) -> None:
+        self.stored = line - self.shift.lines
+
+def move(tokens: Tokens, source: Shift, target: Shift) -> None:
+    # Moves tokens from one shift to another without moving their lines.
+    lines = source.lines - target.lines
+
+    for token in cast(List[DocumentToken], tokens):
+        token.stored += lines
+        token.shift = target
+
+def scan(
+    source: str,
+    position: int,
+    line: int,
+    reporter: Reporter,
+    errors: List[Tuple[int, Diagnostic]]
+) -> Iterator[Tuple[Token, int, int]]:
+    # Scans from a position between lexemes, yielding each token with the
+    # offsets of its first character and of the character after it. Errors
+    # go to the reporter, and to the errors with the offsets of the
+    # characters they were found at.
+
+    lexer = Lexer(reporter)
+    lexer.line = line
+
+    matches = pattern.finditer(source, position)
+    last: Optional[Match[str]] = None
+
+    diagnostics = reporter.diagnostics
+    reported = len(diagnostics)
+
+    def collect() -> None:
+        # Errors are reported while the lexer looks at a match, before it
+        # asks for the next one.
+        nonlocal reported
+
+        if last is not None:
+            errors.extend((last.start(), diagnostic) for diagnostic in diagnostics[reported:])
+
+        reported = len(diagnostics)
+
+    def track() -> Iterator[Match[str]]:
+        nonlocal last
+
+        for match in matches:
+            collect()
+            last = match
+            yield match
+
+        collect()
+
+    # The lexer yields a token as soon as it has seen the match for it, so the
+    # last match seen is the token's.
+    for token in lexer.lex(track()):
+        assert last is not None
+        yield (token, last.start(), last.end())
+
+class Document:
+    # A source together with its tokens and expression, kept up to date as
+    # the source is edited. An edit rescans from the token before it until
+    # the new tokens line up with the old ones again, and reparsing reuses
+    # every subexpression whose tokens the edit did not touch.
+    #
+    # The offsets of the tokens after the last edit are stored short by the
+    # delta, the characters that edit and the ones before it added, like the
+    # far side of a gap buffer. Their lines are stored short by the lines
+    # those edits added, kept in a shift they all share. Only the tokens
+    # between the last edit and the next one are brought up to date, so an
+    # edit costs what it changes and how far it is from the last edit, not
+    # the length of the document.
+    #
+    # The reporter holds the errors of the source as it is now, the same
+    # ones that scanning and parsing it afresh would report.
+
+    def __init__(self, source: str, reporter: Optional[Reporter] = None) -> None:
+        self.source = ''
+
+        self.tokens: Tokens = []
+        self.starts: List[int] = []
+        self.ends: List[int] = []
+
+        # The index of the first token whose offsets are short by the delta
+        # and whose line is short by the far shift.
+        self.mark = 0
+        self.delta = 0
+
+        self.near = Shift()
+        self.far = Shift()
+
+        self.reporter = Reporter() if reporter is None else reporter
+
+        # The errors found while scanning, with the offsets they were found
+        # at.
+        self.errors: List[Tuple[int, Diagnostic]] = []
+
+        self.spans = Spans()
+        self.expression: Optional[Expr] = None
+
+        self.edit(0, 0, source)
+
+    @property
+    def diagnostics(self) -> List[Diagnostic]:
+        return self.reporter.diagnostics
+
+    def offset(self, offsets: List[int], index: int) -> int:
+        # The offset at an index of starts or ends.
+        if index < self.mark: return offsets[index]
+        return offsets[index] + self.delta
+
+    def find(self, offsets: List[int], offset: int, low: int) -> int:
+        # The first index from low on whose offset is not less than the
+        # offset, as bisect_left would find if every offset were up to date.
+        if low < self.mark:
+            index = bisect_left(offsets, offset, low, self.mark)
+            if index < self.mark: return index
+
+            low = self.mark
+
+        return bisect_left(offsets, offset - self.delta, low)
+
+    def settle(self, mark: int) -> None:
+        # Moves the mark, bringing the offsets and lines it passes over up to
+        # date, or storing them short by the delta and the far shift.
+        for offsets in (self.starts, self.ends):
+            if mark > self.mark:
+                offsets[self.mark : mark] = [offset + self.delta for offset in offsets[self.mark : mark]]
+            elif mark < self.mark:
+                offsets[mark : self.mark] = [offset - self.delta for offset in offsets[mark : self.mark]]
+
+        if mark > self.mark:
+            move(self.tokens[self.mark : mark], self.far, self.near)
+        elif mark < self.mark:
+            move(self.tokens[mark : self.mark], self.near, self.far)
+
+        self.mark = mark
+
+    def edit(self, offset: int, removed: int, inserted: str) -> Optional[Expr]:
+        # Replaces the removed characters at the offset with the inserted text,
+        # and returns the new expression.
+
+        source = self.source
+        removed_text = source[offset : offset + removed]
+
+        self.source = source[:offset] + inserted + source[offset + removed:]
+
+        shift = len(inserted) - removed
+        line_shift = inserted.count('\n') - removed_text.count('\n')
+
+        # A token that ends right before the edit might grow into it, and
+        # lexemes look at most two characters ahead, e.g. '1.' followed by an
+        # inserted '5'. Keep only the tokens that end earlier than that, and
+        # resume scanning after the last of them, where no lexeme, comment or
+        # string is in progress.
+        kept = self.find(self.ends, offset - 1, 0)
+
+        # The EOF token is always rebuilt.
+        kept = min(kept, len(self.tokens) - 1) if self.tokens else 0
+
+        position = self.offset(self.ends, kept - 1) if kept > 0 else 0
+        line = self.tokens[kept - 1].line if kept > 0 else 1
+
+        # The errors before the rescan stay as they are. The ones after it
+        # are reported again below, after the errors the rescan finds.
+        errors = self.errors
+        first = bisect_left(errors, position, key=lambda error: error[0])
+
+        reporter = self.reporter
+        reporter.clear()
+
+        for (_, diagnostic) in errors[:first]:
+            reporter.report(diagnostic.line, diagnostic.where, diagnostic.message)
+
+        tokens: Tokens = []
+        starts: List[int] = []
+        ends: List[int] = []
+        found: List[Tuple[int, Diagnostic]] = []
+
+        # The index of the first old token that survives the edit unchanged.
+        resumed = len(self.tokens)
+
+        edit_end = offset + len(inserted)
+
+        for (token, start, end) in scan(self.source, position, line, reporter, found):
+            # Past the edit, stop as soon as a new token matches an old one at
+            # the same place. From there on, scanning would repeat the old
+            # tokens exactly.
+            if start >= edit_end:
+                old = self.find(self.starts, start - shift, kept)
+
+                if (
+                    old < len(self.tokens) - 1 and
+                    self.offset(self.starts, old) == start - shift and
+                    self.tokens[old].type is token.type and
+                    self.tokens[old].lexeme == token.lexeme
+                ):
+                    resumed = old
+                    break
+
+            tokens.append(DocumentToken(token, self.near))
+            starts.append(start)
+            ends.append(end)
+
+        if resumed == len(self.tokens):
+            eof = Token(TT.EOF, '', None, line + self.source.count('\n', position))
+
+            tokens.append(DocumentToken(eof, self.near))
+            starts.append(len(self.source))
+            ends.append(len(self.source))
+
+            last = len(errors)
+        else:
+            last = bisect_left(errors, self.offset(self.starts, resumed), first, key=lambda error: error[0])
+
+        # The errors after the rescan move with the tokens after it.
+        moved = [
+            (error_offset + shift, Diagnostic(diagnostic.line + line_shift, diagnostic.where, diagnostic.message))
+            for (error_offset, diagnostic) in errors[last:]
+        ]
+
+        for (_, diagnostic) in moved:
+            reporter.report(diagnostic.line, diagnostic.where, diagnostic.message)
+
+        errors[first:] = found + moved
+
+        # The old tokens from resumed on move by the shift. Bring the tokens
+        # before them up to date, replace the ones in between, and fold the
+        # shift into the delta and the far shift.
+        self.settle(resumed)
+
+        self.starts[kept:resumed] = starts
+        self.ends[kept:resumed] = ends
+
+        self.mark = kept + len(starts)
+        self.delta += shift
+        self.far.lines += line_shift
+
+        # Spans that looked at a replaced token are gone, and the rest stay
+        # good where they are. An edit can add tokens without replacing any,
+        # and then the spans that looked across the gap are gone. They all
+        # looked at the token after it.
+        replaced = max(resumed, kept + 1) if tokens else resumed
+
+        self.spans.discard(self.tokens[kept:replaced])
+        self.tokens[kept:resumed] = tokens
+
+        self.expression = IncrementalParser(self.tokens, self.spans, reporter).parse()
+
+        return self.expression
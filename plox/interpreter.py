@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, List, Optional, Tuple, cast
 
 import plox.error
 
@@ -11,6 +11,8 @@ from plox.expressions import (
     Visitor
 )
 
+from plox.sink import Sink
+
 import plox.token as token
 from plox.token import Token, TokenType as TT
 
@@ -51,77 +53,119 @@ def check_number_operands(operator: Token, left: Any, right: Any) -> None:
     if isinstance(left, float) and isinstance(right, float): return
     raise plox.error.RuntimeError(operator, 'Operands must be numbers.')
 
-class Interpreter(Visitor):
-    # The evaluate function returns a token.Literal when we visit a unary
-    # expression, and then we start smushing them together in an unsafe manner.
-    # token.Literal is a sum type, but I don't have any value-level pattern
-    # matching abilities, so we proceed with unsafe smushing and isinstance().
+def binary(operator: Token, left: Any, right: Any) -> Any:
+    # Applies a binary operator to operands that have been evaluated already.
 
-    def interpret(self, expression: Expr) -> None:
-        try:
-            value = self.evaluate(expression)
-            print(stringify(value))
-        except plox.error.RuntimeError as error:
-            plox.error.runtime_error(error)
+    token_type = operator.type
 
-    def visit_binary(self, expr: Binary) -> Any:
-        left = self.evaluate(expr.left)
-        right = self.evaluate(expr.right)
+    if token_type == TT.BANG_EQUAL:
+        return not is_equal(left, right)
 
-        token_type = expr.operator.type
+    if token_type == TT.EQUAL_EQUAL:
+        return is_equal(left, right)
 
-        if token_type == TT.BANG_EQUAL:
-            return not is_equal(left, right)
+    if token_type == TT.GREATER:
+        check_number_operands(operator, left, right)
+        return left > right
 
-        if token_type == TT.EQUAL_EQUAL:
-            return is_equal(left, right)
+    if token_type == TT.GREATER_EQUAL:
+        check_number_operands(operator, left, right)
+        return left >= right
 
-        if token_type == TT.GREATER:
-            check_number_operands(expr.operator, left, right)
-            return left > right
+    if token_type == TT.LESS:
+        check_number_operands(operator, left, right)
+        return left < right
 
-        if token_type == TT.GREATER_EQUAL:
-            check_number_operands(expr.operator, left, right)
-            return left >= right
+    if token_type == TT.LESS_EQUAL:
+        check_number_operands(operator, left, right)
+        return left <= right
 
-        if token_type == TT.LESS:
-            check_number_operands(expr.operator, left, right)
-            return left < right
+    if token_type == TT.MINUS:
+        check_number_operands(operator, left, right)
+        return left - right
 
-        if token_type == TT.LESS_EQUAL:
-            check_number_operands(expr.operator, left, right)
-            return left <= right
+    if token_type == TT.PLUS:
+        are_numbers = isinstance(left, float) and isinstance(right, float)
+        are_strings = isinstance(left, str) and isinstance(right, str)
 
-        if token_type == TT.MINUS:
-            check_number_operands(expr.operator, left, right)
-            return left - right
+        if are_numbers or are_strings:
+            return left + right
 
-        if token_type == TT.PLUS:
-            are_numbers = isinstance(left, float) and isinstance(right, float)
-            are_strings = isinstance(left, str) and isinstance(right, str)
+        raise plox.error.RuntimeError(
+            operator,
+            'Operands must be two numbers or two strings.'
+        )
 
-            if are_numbers or are_strings:
-                return left + right
+    if token_type == TT.SLASH:
+        check_number_operands(operator, left, right)
 
+        if right == 0:
             raise plox.error.RuntimeError(
-                expr.operator,
-                'Operands must be two numbers or two strings.'
+                operator,
+                'Division by zero.'
             )
 
-        if token_type == TT.SLASH:
-            check_number_operands(expr.operator, left, right)
+        return left / right
+
+    if token_type == TT.STAR:
+        check_number_operands(operator, left, right)
+        return left * right
+
+def unary(operator: Token, right: Any) -> Any:
+    token_type = operator.type
 
-            if right == 0:
-                raise plox.error.RuntimeError(
-                    expr.operator,
-                    'Division by zero.'
-                )
+    if token_type == TT.MINUS:
+        check_number_operand(operator, right)
+        return -right
 
-            return left / right
+    if token_type == TT.BANG:
+        return not is_truthy(right)
+
+class Interpreter(Visitor):
+    # The evaluate function returns a token.Literal when we visit a unary
+    # expression, and then we start smushing them together in an unsafe manner.
+    # token.Literal is a sum type, but I don't have any value-level pattern
+    # matching abilities, so we proceed with unsafe smushing and isinstance().
 
-        if token_type == TT.STAR:
-            check_number_operands(expr.operator, left, right)
-            return left * right
+    def __init__(
+        self,
+        reporter: Optional[plox.error.Reporter] = None,
+        sink: Optional[Sink] = None
+    ) -> None:
+        # Dispatching on the expression's tag skips the call to accept().
+        self.visitors = self.dispatch_table()
+
+        # Where runtime errors are reported. Without one, the interpreter
+        # keeps its own.
+        self.reporter = plox.error.Reporter() if reporter is None else reporter
+
+        # Where values are printed. Without one, they are printed right away.
+        self.sink = Sink() if sink is None else sink
+
+    def interpret(
+        self,
+        expression: Expr,
+        reporter: Optional[plox.error.Reporter] = None,
+        sink: Optional[Sink] = None
+    ) -> Optional[str]:
+        # Returns what was printed, or None after a runtime error. A reporter
+        # or sink given here is used instead of the interpreter's own for
+        # this expression alone, so one interpreter can serve runs on many
+        # threads.
+        if reporter is None: reporter = self.reporter
+        if sink is None: sink = self.sink
+
+        try:
+            value = self.evaluate(expression)
+            text = stringify(value)
+            sink.print(text)
+            return text
+        except plox.error.RuntimeError as error:
+            reporter.runtime_error(error)
+            return None
+
+    def visit_binary(self, expr: Binary) -> Any:
+        return binary(expr.operator, self.evaluate(expr.left), self.evaluate(expr.right))
 
     def visit_grouping(self, expr: Grouping) -> Any:
         return self.evaluate(expr.expr)
@@ -130,16 +174,53 @@ class Interpreter(Visitor):
         return expr.value
 
     def visit_unary(self, expr: Unary) -> Any:
-        right = self.evaluate(expr.right)
-
-        token_type = expr.operator.type
+        return unary(expr.operator, self.evaluate(expr.right))
 
-        if token_type == TT.MINUS:
-            check_number_operand(expr.operator, right)
-            return -right
+    def evaluate(self, expr: Expr) -> Any:
+        return self.visitors[expr.tag](expr)
 
-        if token_type == TT.BANG:
-            return not is_truthy(right)
+class StackInterpreter(Interpreter):
+    # Evaluates with an explicit stack instead of recursing, so expressions of
+    # any depth evaluate without reaching Python's recursion limit. Operands
+    # are still evaluated left to right, so runtime errors are the same.
 
     def evaluate(self, expr: Expr) -> Any:
-        return expr.accept(self)
+        values: List[Any] = []
+
+        # Expressions to visit, each paired with whether its operands have
+        # been evaluated already and are waiting on the value stack.
+        work: List[Tuple[Expr, bool]] = [(expr, False)]
+
+        while work:
+            expr, ready = work.pop()
+            tag = expr.tag
+
+            # Comparing tags is much cheaper than isinstance() against the
+            # abstract classes.
+            if tag == Literal.tag:
+                values.append(cast(Literal, expr).value)
+
+            elif tag == Grouping.tag:
+                work.append((cast(Grouping, expr).expr, False))
+
+            elif tag == Binary.tag:
+                expr = cast(Binary, expr)
+
+                if ready:
+                    right = values.pop()
+                    values.append(binary(expr.operator, values.pop(), right))
+                else:
+                    work.append((expr, True))
+                    work.append((expr.right, False))
+                    work.append((expr.left, False))
+
+            elif tag == Unary.tag:
+                expr = cast(Unary, expr)
+
+                if ready:
+                    values.append(unary(expr.operator, values.pop()))
+                else:
+                    work.append((expr, True))
+                    work.append((expr.right, False))
+
+        return values.pop()
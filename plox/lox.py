@@ -1,37 +1,285 @@
+import atexit
+import importlib
+import os
 import sys
 
-import plox.ast_printer
+from contextlib import ExitStack, contextmanager, nullcontext
+from typing import TYPE_CHECKING, Any, ContextManager, Dict, Iterator, List, Optional
+
 import plox.error
-import plox.interpreter
-import plox.parser
-import plox.scanner
-import plox.token
+import plox.run_cache
+import plox.sink
+
+# Starting plox is a large part of running a short script, so only what every
+# run needs is imported up front. The rest is imported by the functions that
+# use it, the first time they do.
+if TYPE_CHECKING:
+    import plox.interpreter
+    import plox.profiler
+    import plox.stats
+    import plox.token
+
+# Engines are named by module and class, and imported when first used.
+scanners: Dict[str, str] = {
+    'default': 'plox.scanner.Scanner',
+    'regex'  : 'plox.regex_scanner.RegexScanner'
+}
+
+parsers: Dict[str, str] = {
+    'default': 'plox.parser.Parser',
+    'stack'  : 'plox.stack_parser.StackParser',
+    'pratt'  : 'plox.pratt_parser.PrattParser'
+}
+
+def load(name: str) -> Any:
+    # Returns the class with the given dotted name, importing its module if
+    # need be.
+    module, _, attribute = name.rpartition('.')
+    return getattr(importlib.import_module(module), attribute)
+
+# Built by get_interpreter() when the first expression is evaluated, unless an
+# option has chosen another interpreter by then.
+interpreter: Optional['plox.interpreter.Interpreter'] = None
+
+# The scanning engine used by run(). Both engines produce identical tokens and
+# errors, so the choice only affects speed.
+scanner_name = 'default'
+
+# The parsing engine used by run() and run_tokens(). All engines produce
+# identical trees and errors. The Pratt engine is the fastest, and the stack
+# engine handles nesting of any depth and comes with an interpreter that does
+# too.
+parser_name = 'default'
+
+# Whether run_file() scans the script a chunk at a time instead of reading it
+# whole. Streaming always uses the regex engine.
+stream = False
+
+# Remembers the tokens, expression and printed value of recently run sources.
+cache = plox.run_cache.RunCache()
+
+# Where runs print their values and errors. Output is written in large blocks
+# across runs, and only written early before an error, so that it comes out
+# in order, before the REPL prompts, and when plox exits. Code that runs
+# sources without lox() flushes it itself.
+output = plox.sink.BufferedSink()
+
+# Whether run_file() scans the script through a memory map of its file, so
+# that it is never read into memory whole. Like streaming, mapping always uses
+# the regex engine.
+mapped = False
+
+# Whether run_file() keeps parsed scripts in a __ploxcache__ directory next to
+# them, and loads them from there instead of scanning and parsing again.
+ast_cache = True
 
-interpreter = plox.interpreter.Interpreter()
+# How many processes run scripts when more than one is given. None means one
+# per CPU.
+jobs: Optional[int] = None
+
+# Where the time of the runs went, when profiling, and whether the profile is
+# reported as 'text' or 'json' on exit.
+profile: Optional['plox.profiler.Profile'] = None
+profile_format = 'text'
+
+# Whether each run reports its throughput as 'text' or 'json', if at all,
+# whether the report includes peak memory, and the figures of the run in
+# progress.
+stats_format: Optional[str] = None
+stats_memory = False
+stats: Optional['plox.stats.RunStats'] = None
+
+usage = 'Usage: plox [--scanner=default|regex] [--parser=default|stack|pratt] [--stream] [--mmap] [--no-ast-cache] [--profile=text|json] [--stats=text|json[,memory]] [--cache-size=N] [--jobs=N] [script...]'
 
 def lox() -> None:
     # sys.argv[0] is the script name, which we drop.
 
     args = sys.argv[1:]
 
-    if len(args) > 1:
-        print('Usage: plox [script]')
-        sys.exit(64)
+    # Whatever is still buffered is written on the way out, however plox
+    # exits.
+    atexit.register(output.flush)
+
+    options = [arg for arg in args if arg.startswith('--')]
+    args = [arg for arg in args if not arg.startswith('--')]
+
+    for option in options:
+        set_option(option)
+
+    try:
+        if len(args) > 1:
+            run_files(args, options)
+
+        elif len(args) == 1:
+            run_file(args[0])
+
+        else:
+            run_prompt()
+    finally:
+        if profile is not None: report_profile(profile)
+
+def set_option(option: str) -> None:
+    global scanner_name, parser_name, interpreter, stream, mapped, ast_cache, profile_format, stats_format, stats_memory, jobs
+
+    name, _, value = option[2:].partition('=')
 
-    elif len(args) == 1:
-        run_file(args[0])
+    if name == 'scanner' and value in scanners:
+        scanner_name = value
+
+    elif name == 'parser' and value in parsers:
+        parser_name = value
+
+        # The profiling interpreter evaluates with a stack of its own.
+        if value == 'stack' and profile is None:
+            from plox.interpreter import StackInterpreter
+            interpreter = StackInterpreter()
+
+    elif name == 'stream' and value == '':
+        stream = True
+
+    elif name == 'mmap' and value == '':
+        mapped = True
+
+    elif name == 'no-ast-cache' and value == '':
+        ast_cache = False
+
+    elif name == 'profile' and value in ('text', 'json'):
+        start_profile()
+        profile_format = value
+
+    elif name == 'stats' and value.removesuffix(',memory') in ('text', 'json'):
+        stats_format = value.removesuffix(',memory')
+        stats_memory = value.endswith(',memory')
+
+    elif name == 'cache-size' and value.isdigit():
+        cache.capacity = int(value)
+
+    elif name == 'jobs' and value.isdigit() and int(value) > 0:
+        jobs = int(value)
 
     else:
-        run_prompt()
+        print(usage)
+        sys.exit(64)
+
+def start_profile() -> 'plox.profiler.Profile':
+    # Profiles the runs from here on afresh.
+    global profile, interpreter
+
+    from plox.profiler import Profile, ProfilingInterpreter
+
+    profile = Profile()
+    interpreter = ProfilingInterpreter(profile)
+
+    return profile
 
 def run_file(path: str) -> None:
-    with open(path) as file:
-        run(file.read())
-        if (plox.error.had_error): sys.exit(65)
-        if (plox.error.had_runtime_error): sys.exit(70)
+    reporter = plox.error.Reporter()
+
+    with measured():
+        try:
+            if mapped or stream:
+                # The source is never read whole, so take its size from the
+                # file.
+                if stats is not None: stats.bytes = os.path.getsize(path)
+
+            if mapped:
+                from plox.mmap_scanner import MmapScanner
+
+                with open(path, 'rb') as binary:
+                    run_tokens(MmapScanner(binary, reporter).scan_tokens(), reporter)
+            else:
+                with open(path) as file:
+                    if stream:
+                        from plox.stream_scanner import StreamScanner
+                        run_tokens(StreamScanner(file, reporter=reporter).scan_tokens(), reporter)
+
+                    elif ast_cache: run_cached(path, file.read(), reporter)
+                    else: run_source(file.read(), reporter)
+        finally:
+            report(reporter)
+
+    if reporter.exit_code != 0: sys.exit(reporter.exit_code)
+
+def run_files(paths: List[str], options: List[str]) -> None:
+    # Each script runs in a worker process with its own error state. Output
+    # is printed script by script in the order given, the scripts' profiles
+    # are merged into this one, and plox exits with the most severe of the
+    # scripts' exit codes.
+    from plox.parallel import run_files as run_in_parallel
+
+    outcomes = run_in_parallel(paths, jobs, options)
+
+    for outcome in outcomes:
+        sys.stdout.write(outcome.output)
+        sys.stderr.write(outcome.errors)
+
+        if outcome.exit_code != 0:
+            print(f'{outcome.path}: exit code {outcome.exit_code}', file=sys.stderr)
+
+        if profile is not None and outcome.profile is not None:
+            profile.merge(outcome.profile)
+
+    exit_code = max(outcome.exit_code for outcome in outcomes)
+    if exit_code != 0: sys.exit(exit_code)
+
+def report_profile(profile: 'plox.profiler.Profile') -> None:
+    report = profile.json() if profile_format == 'json' else profile.text()
+    output.print_error(report)
+
+def phase(name: str) -> ContextManager[None]:
+    # Phases are only timed when profiling or reporting stats.
+    if profile is None and stats is None: return nullcontext()
+    return timed(name)
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    with ExitStack() as stack:
+        if profile is not None: stack.enter_context(profile.phase(name))
+        if stats is not None: stack.enter_context(stats.phase(name))
+
+        yield
+
+@contextmanager
+def measured(sink: Optional[plox.sink.Sink] = None) -> Iterator[None]:
+    # Collects stats for the run inside the block and reports them after it,
+    # to the sink or to the output of plox. A run inside another run is part
+    # of it.
+    global stats
+
+    if stats_format is None or stats is not None:
+        yield
+        return
+
+    from plox.stats import RunStats
+
+    stats = RunStats(stats_memory)
+
+    try:
+        yield
+    finally:
+        stats.stop()
+
+        report = stats.json() if stats_format == 'json' else stats.text()
+        (output if sink is None else sink).print_error(report)
+
+        stats = None
+
+def get_interpreter() -> 'plox.interpreter.Interpreter':
+    # The interpreter is kept from one run to the next. Runs hand it their
+    # reporter and the output of plox with each expression rather than
+    # setting them on it, so runs on other threads never see them.
+    global interpreter
+
+    if interpreter is None:
+        from plox.interpreter import Interpreter
+        interpreter = Interpreter()
+
+    return interpreter
 
 def run_prompt() -> None:
     while True:
+        output.flush()
+
         try:
             line = input('> ')
         except EOFError:
@@ -40,15 +288,118 @@ def run_prompt() -> None:
         else:
             run(line)
 
-def run(source: str) -> None:
-    scanner = plox.scanner.Scanner(source)
-    tokens = scanner.scan_tokens()
-    parser = plox.parser.Parser(tokens)
-    expression = parser.parse()
+def run(source: str, sink: Optional[plox.sink.Sink] = None) -> plox.error.Reporter:
+    # Runs a source with a reporter of its own, prints its values and errors
+    # to the sink, or to the output of plox without one, and returns the
+    # reporter.
+    if sink is None: sink = output
+
+    reporter = plox.error.Reporter()
+
+    with measured(sink):
+        try:
+            run_source(source, reporter, sink)
+        finally:
+            report(reporter, sink)
+
+    return reporter
+
+def report(reporter: plox.error.Reporter, sink: Optional[plox.sink.Sink] = None) -> None:
+    # Prints the errors of a run after everything it printed before them.
+    # Runtime errors write out what was printed before them, and the rest
+    # stays buffered.
+    reporter.flush(output if sink is None else sink)
+
+def run_source(source: str, reporter: plox.error.Reporter, sink: Optional[plox.sink.Sink] = None) -> None:
+    if sink is None: sink = output
+    if stats is not None: stats.count_source(source)
+
+    entry = cache.get(source)
+
+    if entry is None:
+        with phase('scan'):
+            scanner = load(scanners[scanner_name])(source, reporter)
+            tokens = scanner.scan_tokens()
+
+        with phase('parse'):
+            parser = load(parsers[parser_name])(tokens, reporter=reporter)
+            expression = parser.parse()
+
+        if stats is not None:
+            stats.tokens = len(tokens)
+            stats.count_nodes(expression)
+
+        if reporter.had_error: return
+
+        entry = cache.put(source, tokens, expression)
+
+    if entry.expression is None: return
+
+    if entry.text is not None:
+        sink.print(entry.text)
+        return
+
+    with phase('evaluate'):
+        entry.text = get_interpreter().interpret(entry.expression, reporter, sink)
+
+def run_cached(path: str, source: str, reporter: plox.error.Reporter) -> None:
+    from plox.ast_cache import load as load_cached, store
+
+    if stats is not None: stats.count_source(source)
+
+    with phase('load'):
+        expression = load_cached(path, source)
+
+    if expression is None:
+        with phase('scan'):
+            scanner = load(scanners[scanner_name])(source, reporter)
+            tokens = scanner.scan_tokens()
+
+        with phase('parse'):
+            parser = load(parsers[parser_name])(tokens, reporter=reporter)
+            expression = parser.parse()
+
+        if stats is not None: stats.tokens = len(tokens)
+
+        # Scripts with errors are not cached, so their errors are reported
+        # again every time they run.
+        if reporter.had_error or expression is None: return
+
+        with phase('store'):
+            store(path, source, expression)
+
+    if stats is not None: stats.count_nodes(expression)
+
+    with phase('evaluate'):
+        get_interpreter().interpret(expression, reporter, output)
+
+def run_tokens(tokens: Iterator['plox.token.Token'], reporter: plox.error.Reporter) -> None:
+    # Runs a source whose tokens are scanned as the parser asks for them, so
+    # scanning and parsing are timed as one phase.
+    if stats is not None: tokens = stats.count_tokens(tokens)
+
+    with phase('scan and parse'):
+        # Parse errors are held back until the whole source is scanned, so
+        # that they come after every scan error, as they do when the source
+        # is scanned before it is parsed.
+        parse_reporter = plox.error.Reporter()
+
+        parser = load(parsers[parser_name])(tokens, reporter=parse_reporter)
+        expression = parser.parse()
+
+        # The parser stops after one expression. Scan the rest of the source
+        # anyway so that its errors are reported, discarding the tokens.
+        for _ in tokens: pass
+
+        reporter.extend(parse_reporter)
+
+    if stats is not None: stats.count_nodes(expression)
 
-    if plox.error.had_error: return
+    if reporter.had_error: return
 
-    if expression is not None: interpreter.interpret(expression)
+    if expression is not None:
+        with phase('evaluate'):
+            get_interpreter().interpret(expression, reporter, output)
 
 if __name__ == '__main__':
     lox()
@@ -0,0 +1,62 @@
+import mmap
+import re
+
+from typing import BinaryIO, Iterator, Optional
+
+from plox.error import Reporter
+
+from plox.regex_scanner import BaseLexer, alternatives, master, operators
+from plox.scanner import keywords
+
+from plox.token import (
+    Token,
+    TokenType as TT
+)
+
+# The master pattern of plox.regex_scanner over the UTF-8 bytes of a source.
+#
+# Scripts read as text go through universal newlines, which turns '\r\n' and
+# a lone '\r' into '\n'. Bytes do not, so comments also end at '\r', and line
+# counts and string literals treat both the same way '\n' is treated. An
+# unexpected character is matched with all of its UTF-8 continuation bytes.
+pattern = re.compile(master({
+    **alternatives,
+    'comment'   : r'//[^\r\n]*',
+    'unexpected': r'[\xc0-\xff][\x80-\xbf]*|.'
+}).encode(), re.DOTALL)
+
+byte_operators = {text.encode(): type for (text, type) in operators.items()}
+byte_keywords = {text.encode(): type for (text, type) in keywords.items()}
+
+class MmapScanner(BaseLexer[bytes]):
+    # Scans a script through a memory map of its file instead of reading it
+    # into a string first. Only the lexemes that tokens keep are decoded, and
+    # tokens are yielded as they are found, so scanning starts right away and
+    # the source is never held in memory twice. The tokens and errors are
+    # those of the other scanners on the same script read as text.
+
+    operators = byte_operators
+    keywords = byte_keywords
+
+    def __init__(self, file: BinaryIO, reporter: Optional[Reporter] = None) -> None:
+        super().__init__(reporter)
+
+        self.file = file
+
+    def scan_tokens(self) -> Iterator[Token]:
+        # An empty file cannot be mapped, but it has no lexemes either.
+        if self.file.seek(0, 2) > 0:
+            with mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) as source:
+                yield from self.lex(pattern.finditer(source))
+
+        yield Token(TT.EOF, '', None, self.line)
+
+    def count_lines(self, text: bytes) -> int:
+        if b'\r' not in text: return text.count(b'\n')
+        return text.count(b'\n') + text.count(b'\r') - text.count(b'\r\n')
+
+    def decode(self, text: bytes) -> str:
+        # Decodes text as reading the script in text mode would have.
+        string = text.decode()
+        if '\r' in string: string = string.replace('\r\n', '\n').replace('\r', '\n')
+        return string
@@ -0,0 +1,49 @@
+from typing import Any, Dict, Hashable
+
+from plox.expressions import (
+    Binary,
+    Expr,
+    Grouping,
+    Literal,
+    Unary,
+    Visitor
+)
+
+class NodeTable(Visitor):
+    # Hash-conses expressions. Interning an expression whose subexpressions
+    # were interned in the same table returns the one node with that
+    # structure, so identical subtrees are shared and comparing two interned
+    # trees succeeds on identity, before __eq__ looks at any children.
+    #
+    # Interned nodes are shared and must be treated as immutable.
+
+    def __init__(self) -> None:
+        self.nodes: Dict[Hashable, Expr] = {}
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def intern(self, expr: Expr) -> Expr:
+        return self.nodes.setdefault(expr.accept(self), expr)
+
+    # The visit methods compute the key an expression is interned under.
+    # Subexpressions are interned already, so they are keyed by identity. The
+    # table keeps them alive, so their identities are never reused.
+
+    def visit_binary(self, expr: Binary) -> Any:
+        return (Binary, id(expr.left), expr.operator, id(expr.right))
+
+    def visit_grouping(self, expr: Grouping) -> Any:
+        return (Grouping, id(expr.expr))
+
+    def visit_literal(self, expr: Literal) -> Any:
+        value = expr.value
+
+        # Literal.__eq__ compares values as Python does, so true equals 1 and
+        # 0 equals -0. They print differently, so sharing must tell them
+        # apart.
+        if isinstance(value, float): return (Literal, float, value.hex())
+        return (Literal, value.__class__, value)
+
+    def visit_unary(self, expr: Unary) -> Any:
+        return (Unary, expr.operator, id(expr.right))
@@ -0,0 +1,81 @@
+from typing import cast
+
+import plox.error
+
+from plox.expressions import (
+    Binary,
+    Expr,
+    Grouping,
+    Literal,
+    Unary,
+    Visitor
+)
+
+from plox.interpreter import Interpreter
+
+class ConstantFolder(Visitor):
+    # Rewrites an expression so that every subtree whose operands are all
+    # literals becomes a single literal, and drops groupings, which only
+    # matter to the parser. A subtree that would raise a runtime error is left
+    # alone so that the error, and the line of its operator, surface when the
+    # expression is evaluated.
+
+    def __init__(self) -> None:
+        self.interpreter = Interpreter()
+
+    def fold(self, expr: Expr) -> Expr:
+        return expr.accept(self)
+
+    def visit_binary(self, expr: Binary) -> Expr:
+        left = self.fold(expr.left)
+        right = self.fold(expr.right)
+
+        return self.evaluate(Binary(left, expr.operator, right), left, right)
+
+    def visit_grouping(self, expr: Grouping) -> Expr:
+        return self.fold(expr.expr)
+
+    def visit_literal(self, expr: Literal) -> Expr:
+        return expr
+
+    def visit_unary(self, expr: Unary) -> Expr:
+        right = self.fold(expr.right)
+
+        return self.evaluate(Unary(expr.operator, right), right)
+
+    def evaluate(self, expr: Expr, *operands: Expr) -> Expr:
+        if not all(isinstance(operand, Literal) for operand in operands):
+            return expr
+
+        try:
+            return Literal(self.interpreter.evaluate(expr))
+        except plox.error.RuntimeError:
+            return expr
+
+class NodeCounter:
+    # Counts the nodes of an expression with a stack of its own rather than
+    # by recursion, so that trees of any depth can be counted, e.g. those of
+    # the stack parser.
+
+    def count(self, expr: Expr) -> int:
+        count = 0
+        work = [expr]
+
+        while work:
+            item = work.pop()
+            count += 1
+
+            tag = item.tag
+
+            if tag == Binary.tag:
+                binary = cast(Binary, item)
+                work.append(binary.left)
+                work.append(binary.right)
+
+            elif tag == Grouping.tag:
+                work.append(cast(Grouping, item).expr)
+
+            elif tag == Unary.tag:
+                work.append(cast(Unary, item).right)
+
+        return count
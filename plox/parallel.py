@@ -0,0 +1,83 @@
+import os
+import sys
+
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from typing import TYPE_CHECKING, List, Optional, Sequence
+
+import plox.lox
+
+if TYPE_CHECKING:
+    import plox.profiler
+
+class Outcome:
+    def __init__(
+        self,
+        path: str,
+        output: str,
+        errors: str,
+        exit_code: int,
+        profile: Optional['plox.profiler.Profile'] = None
+    ) -> None:
+        self.path = path
+
+        # What the script printed to standard output and standard error.
+        self.output = output
+        self.errors = errors
+
+        # What plox would have exited with had it run the script alone.
+        self.exit_code = exit_code
+
+        # Where the script's run spent its time, when profiling.
+        self.profile = profile
+
+    def __repr__(self) -> str:
+        return f'Outcome({self.path!r}, {self.output!r}, {self.errors!r}, {self.exit_code})'
+
+def initialize(options: Sequence[str]) -> None:
+    # Workers may not inherit the parent's plox.lox settings, so the options
+    # are applied again in each one.
+    for option in options:
+        plox.lox.set_option(option)
+
+def run_script(path: str) -> Outcome:
+    # A worker may run several scripts, so each gets a profile of its own to
+    # send back with its outcome.
+    profile = plox.lox.start_profile() if plox.lox.profile is not None else None
+
+    output = StringIO()
+    errors = StringIO()
+    exit_code = 0
+
+    with redirect_stdout(output), redirect_stderr(errors):
+        try:
+            plox.lox.run_file(path)
+        except SystemExit as exit:
+            exit_code = exit.code if isinstance(exit.code, int) else 1
+        except OSError as error:
+            print(f'Could not read {path}: {error.strerror}.', file=sys.stderr)
+            exit_code = 66
+        except Exception as error:
+            # Anything else is a fault in plox, not in the script, but it
+            # fails only this script rather than the whole batch.
+            print(f'Could not run {path}: {error}.', file=sys.stderr)
+            exit_code = 70
+        finally:
+            # Capture what plox.lox has buffered, too.
+            plox.lox.output.flush()
+
+    return Outcome(path, output.getvalue(), errors.getvalue(), exit_code, profile)
+
+def run_files(paths: Sequence[str], jobs: Optional[int] = None, options: Sequence[str] = ()) -> List[Outcome]:
+    # Runs each script in its own process-pool task. Outcomes come back in
+    # the order of the paths, however the work was scheduled.
+
+    if jobs is None: jobs = os.cpu_count() or 1
+
+    # Hand out scripts in small batches to amortize the cost of talking to
+    # the workers, without starving any of them at the end.
+    chunk_size = max(1, min(16, len(paths) // (jobs * 4)))
+
+    with ProcessPoolExecutor(jobs, initializer=initialize, initargs=(tuple(options),)) as executor:
+        return list(executor.map(run_script, paths, chunksize=chunk_size))
@@ -1,6 +1,8 @@
-from typing import Optional
+from collections import deque
+from collections.abc import Iterator as IteratorType
+from typing import Deque, Iterator, Optional, Union
 
-import plox.error
+from plox.error import Reporter
 
 from plox.expressions import (
     Binary,
@@ -10,23 +12,63 @@ from plox.expressions import (
     Unary
 )
 
+from plox.node_table import NodeTable
+
 from plox.token import (
     Token,
     TokenType as TT,
     Tokens
 )
 
+from plox.token_buffer import TokenBuffer
+
 class ParseError(Exception):
     pass
 
-def error(token: Token, message: str) -> ParseError:
-    plox.error.parse_error(token, message)
-    return ParseError()
+class TokenStream:
+    # Presents an iterator of tokens as the indexable sequence the parser
+    # expects. The parser only ever looks at the current and the previous
+    # token, so only those two are remembered.
+
+    def __init__(self, tokens: Iterator[Token]) -> None:
+        self.tokens = tokens
+        self.window: Deque[Token] = deque(maxlen=2)
+
+        # The index of the first token in the window.
+        self.start = 0
+
+    def __getitem__(self, index: int) -> Token:
+        while index >= self.start + len(self.window):
+            if len(self.window) == self.window.maxlen: self.start += 1
+            self.window.append(next(self.tokens))
+
+        if index < self.start:
+            raise IndexError('token has left the lookahead window')
+
+        return self.window[index - self.start]
 
 class Parser:
-    def __init__(self, tokens: Tokens) -> None:
+    def __init__(
+        self,
+        tokens: Union[Tokens, TokenBuffer, Iterator[Token]],
+        nodes: Optional[NodeTable] = None,
+        reporter: Optional[Reporter] = None
+    ) -> None:
         self.current = 0
-        self.tokens = tokens
+
+        # Where errors are reported. Without one, the parser keeps its own.
+        self.reporter = Reporter() if reporter is None else reporter
+
+        # When given a table, every expression built is interned in it, so
+        # identical subtrees are shared.
+        self.nodes = nodes
+
+        self.tokens: Union[Tokens, TokenBuffer, TokenStream]
+
+        if isinstance(tokens, IteratorType):
+            self.tokens = TokenStream(tokens)
+        else:
+            self.tokens = tokens
 
     def parse(self) -> Optional[Expr]:
         try:
@@ -43,7 +85,7 @@ class Parser:
         while self.match(TT.BANG_EQUAL, TT.EQUAL_EQUAL):
             operator = self.previous()
             right = self.comparison()
-            expr = Binary(expr, operator, right)
+            expr = self.node(Binary(expr, operator, right))
 
         return expr
 
@@ -53,7 +95,7 @@ class Parser:
         while self.match(TT.GREATER, TT.GREATER_EQUAL, TT.LESS, TT.LESS_EQUAL):
             operator = self.previous()
             right = self.term()
-            expr = Binary(expr, operator, right)
+            expr = self.node(Binary(expr, operator, right))
 
         return expr
 
@@ -63,7 +105,7 @@ class Parser:
         while self.match(TT.MINUS, TT.PLUS):
             operator = self.previous()
             right = self.factor()
-            expr = Binary(expr, operator, right)
+            expr = self.node(Binary(expr, operator, right))
 
         return expr
 
@@ -73,7 +115,7 @@ class Parser:
         while self.match(TT.SLASH, TT.STAR):
             operator = self.previous()
             right = self.unary()
-            expr = Binary(expr, operator, right)
+            expr = self.node(Binary(expr, operator, right))
 
         return expr
 
@@ -81,24 +123,28 @@ class Parser:
         if self.match(TT.BANG, TT.MINUS):
             operator = self.previous()
             right = self.unary()
-            return Unary(operator, right)
+            return self.node(Unary(operator, right))
 
         return self.primary()
 
     def primary(self) -> Expr:
-        if self.match(TT.FALSE): return Literal(False)
-        if self.match(TT.TRUE): return Literal(True)
-        if self.match(TT.NIL): return Literal(None)
+        if self.match(TT.FALSE): return self.node(Literal(False))
+        if self.match(TT.TRUE): return self.node(Literal(True))
+        if self.match(TT.NIL): return self.node(Literal(None))
 
         if self.match(TT.NUMBER, TT.STRING):
-            return Literal(self.previous().literal)
+            return self.node(Literal(self.previous().literal))
 
         if self.match(TT.LEFT_PAREN):
             expr = self.expression()
             self.consume(TT.RIGHT_PAREN, "Expect ')' after expression.")
-            return Grouping(expr)
+            return self.node(Grouping(expr))
+
+        raise self.error(self.peek(), 'Expect expression.')
 
-        raise error(self.peek(), 'Expect expression.')
+    def node(self, expr: Expr) -> Expr:
+        if self.nodes is None: return expr
+        return self.nodes.intern(expr)
 
     def is_at_end(self) -> bool:
         return self.peek().type == TT.EOF
@@ -127,7 +173,11 @@ class Parser:
 
     def consume(self, type: TT, message: str) -> Token:
         if self.check(type): return self.advance()
-        raise error(self.peek(), message)
+        raise self.error(self.peek(), message)
+
+    def error(self, token: Token, message: str) -> ParseError:
+        self.reporter.parse_error(token, message)
+        return ParseError()
 
     def synchronize(self) -> None:
         # We call synchronize() when the parser enters panic mode. We consumed
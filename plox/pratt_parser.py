@@ -0,0 +1,67 @@
+from plox.expressions import (
+    Binary,
+    Expr,
+    Grouping,
+    Literal,
+    Unary
+)
+
+from plox.parser import Parser
+from plox.stack_parser import literals, precedences as binding_powers
+from plox.token import TokenType as TT
+
+class PrattParser(Parser):
+    # Parses the same grammar as Parser, into the same trees and with the same
+    # errors, with one loop driven by binding_powers instead of a method per
+    # precedence level. A flat '1 + 2' takes three calls instead of a dozen,
+    # and each token is looked at once rather than once per candidate type.
+    #
+    # The parser reads tokens by index and only ever steps over tokens that
+    # are not EOF, so it never needs is_at_end().
+
+    def expression(self, minimum: int = 1) -> Expr:
+        # Parses an expression whose binary operators all bind at least as
+        # tightly as the minimum.
+        tokens = self.tokens
+        left = self.prefix()
+
+        while True:
+            operator = tokens[self.current]
+            power = binding_powers.get(operator.type)
+
+            if power is None or power < minimum: return left
+
+            self.current += 1
+
+            # Operands of a left-associative operator only contain operators
+            # that bind more tightly.
+            right = self.expression(power + 1)
+            left = self.node(Binary(left, operator, right))
+
+    def prefix(self) -> Expr:
+        token = self.tokens[self.current]
+        token_type = token.type
+
+        if token_type is TT.NUMBER or token_type is TT.STRING:
+            self.current += 1
+            return self.node(Literal(token.literal))
+
+        if token_type is TT.MINUS or token_type is TT.BANG:
+            self.current += 1
+            return self.node(Unary(token, self.prefix()))
+
+        if token_type in literals:
+            self.current += 1
+            return self.node(Literal(literals[token_type]))
+
+        if token_type is TT.LEFT_PAREN:
+            self.current += 1
+            expr = self.expression()
+
+            if self.tokens[self.current].type is not TT.RIGHT_PAREN:
+                raise self.error(self.tokens[self.current], "Expect ')' after expression.")
+
+            self.current += 1
+            return self.node(Grouping(expr))
+
+        raise self.error(token, 'Expect expression.')
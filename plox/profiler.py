@@ -0,0 +1,236 @@
+import json
+import time
+
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple, cast
+
+import plox.error
+
+from plox.expressions import Binary, Expr, Grouping, Literal, Unary
+
+from plox.interpreter import Interpreter, binary, unary
+from plox.sink import Sink
+from plox.token import Token, TokenType as TT
+
+class Timing:
+    def __init__(self) -> None:
+        self.count = 0
+        self.seconds = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'count': self.count, 'seconds': self.seconds}
+
+    def add(self, other: 'Timing') -> None:
+        self.count += other.count
+        self.seconds += other.seconds
+
+class Profile:
+    # Where a run spent its time. Phases are the steps of plox.lox.run().
+    # Node timings include the time spent evaluating the node's operands,
+    # while operator timings only cover applying the operator to operands
+    # that have been evaluated already.
+
+    def __init__(self) -> None:
+        self.phases: Dict[str, Timing] = {}
+        self.nodes: Dict[str, Timing] = {}
+        self.operators: Dict[str, Timing] = {}
+
+        # How many times each operator failed its type check, and why.
+        self.failures: Dict[Tuple[str, str], int] = {}
+
+        # How many divisions failed because the divisor was zero. Their
+        # operands passed the type check.
+        self.divisions_by_zero = 0
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        timing = self.phases.setdefault(name, Timing())
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            timing.count += 1
+            timing.seconds += time.perf_counter() - start
+
+    def merge(self, other: 'Profile') -> None:
+        # Adds the timings and failures of another profile to this one, e.g.
+        # those of a script run in a worker process.
+        for (timings, other_timings) in [
+            (self.phases, other.phases),
+            (self.nodes, other.nodes),
+            (self.operators, other.operators)
+        ]:
+            for (name, timing) in other_timings.items():
+                timings.setdefault(name, Timing()).add(timing)
+
+        for (key, count) in other.failures.items():
+            self.failures[key] = self.failures.get(key, 0) + count
+
+        self.divisions_by_zero += other.divisions_by_zero
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'phases': {name: timing.to_dict() for (name, timing) in self.phases.items()},
+            'nodes': {name: timing.to_dict() for (name, timing) in self.nodes.items()},
+            'operators': {name: timing.to_dict() for (name, timing) in self.operators.items()},
+            'failures': [
+                {'operator': operator, 'message': message, 'count': count}
+                for ((operator, message), count) in self.failures.items()
+            ],
+            'divisions_by_zero': self.divisions_by_zero
+        }
+
+    def json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    def text(self) -> str:
+        lines = []
+
+        for (title, timings) in [
+            ('phase', self.phases),
+            ('node', self.nodes),
+            ('operator', self.operators)
+        ]:
+            lines.append(f'{title:<16} {"count":>12} {"seconds":>12}')
+
+            # Phases are listed in the order they ran, and the rest from the
+            # most time taken down.
+            ordered = list(timings.items())
+
+            if title != 'phase':
+                ordered.sort(key=lambda item: item[1].seconds, reverse=True)
+
+            for (name, timing) in ordered:
+                lines.append(f'{name:<16} {timing.count:12,} {timing.seconds:12.6f}')
+
+            lines.append('')
+
+        lines.append(f'{"failure":<16} {"count":>12}  message')
+
+        for ((operator, message), count) in self.failures.items():
+            lines.append(f'{operator:<16} {count:12,}  {message}')
+
+        lines.append('')
+        lines.append(f'{"division by zero":<16} {self.divisions_by_zero:12,}')
+
+        return '\n'.join(lines)
+
+def divides_by_zero(operator: Token, operands: Tuple[Any, ...]) -> bool:
+    # Whether applying the operator fails for a zero divisor. Operands that
+    # are not both numbers fail the type check before the divisor is looked
+    # at.
+    if operator.type != TT.SLASH: return False
+
+    left, right = operands
+    return isinstance(left, float) and isinstance(right, float) and right == 0
+
+class ProfilingInterpreter(Interpreter):
+    # An Interpreter that records into a Profile how often each kind of node
+    # and each operator is evaluated, how long that takes, and which type
+    # checks fail. The plain Interpreter carries none of this bookkeeping, so
+    # runs that are not profiled pay nothing for it.
+
+    def __init__(
+        self,
+        profile: Profile,
+        reporter: Optional[plox.error.Reporter] = None,
+        sink: Optional[Sink] = None
+    ) -> None:
+        super().__init__(reporter, sink)
+
+        self.profile = profile
+
+    def evaluate(self, expr: Expr) -> Any:
+        # Evaluates with an explicit stack, as StackInterpreter does, so that
+        # profiling works at any depth. A node's time runs from when it is
+        # first visited until its value is on the value stack.
+        values: List[Any] = []
+
+        # Expressions to visit, each paired with when its visit started, or
+        # None if it has not started yet.
+        work: List[Tuple[Expr, Optional[float]]] = [(expr, None)]
+
+        try:
+            while work:
+                expr, start = work.pop()
+                tag = expr.tag
+
+                if start is None:
+                    start = time.perf_counter()
+
+                    if tag == Literal.tag:
+                        values.append(cast(Literal, expr).value)
+                        self.time(expr, start)
+                        continue
+
+                    work.append((expr, start))
+
+                    if tag == Grouping.tag:
+                        work.append((cast(Grouping, expr).expr, None))
+
+                    elif tag == Binary.tag:
+                        work.append((cast(Binary, expr).right, None))
+                        work.append((cast(Binary, expr).left, None))
+
+                    elif tag == Unary.tag:
+                        work.append((cast(Unary, expr).right, None))
+
+                    continue
+
+                if tag == Binary.tag:
+                    right = values.pop()
+                    values.append(self.apply(cast(Binary, expr).operator, (values.pop(), right)))
+
+                elif tag == Unary.tag:
+                    values.append(self.apply(cast(Unary, expr).operator, (values.pop(),)))
+
+                self.time(expr, start)
+        except plox.error.RuntimeError:
+            # The node that failed and every node around it end here, too.
+            now = time.perf_counter()
+
+            for (pending, started) in work + [(expr, start)]:
+                if started is not None: self.time(pending, started, now)
+
+            raise
+
+        return values.pop()
+
+    def time(self, expr: Expr, start: float, end: Optional[float] = None) -> None:
+        name = expr.__class__.__name__
+        timing = self.profile.nodes.get(name)
+
+        if timing is None:
+            timing = self.profile.nodes[name] = Timing()
+
+        if end is None: end = time.perf_counter()
+
+        timing.count += 1
+        timing.seconds += end - start
+
+    def apply(self, operator: Token, operands: Tuple[Any, ...]) -> Any:
+        name = operator.type.name
+        timing = self.profile.operators.get(name)
+
+        if timing is None:
+            timing = self.profile.operators[name] = Timing()
+
+        start = time.perf_counter()
+
+        try:
+            if len(operands) == 2:
+                return binary(operator, *operands)
+            else:
+                return unary(operator, *operands)
+        except plox.error.RuntimeError as error:
+            if divides_by_zero(operator, operands):
+                self.profile.divisions_by_zero += 1
+            else:
+                key = (name, error.message)
+                self.profile.failures[key] = self.profile.failures.get(key, 0) + 1
+
+            raise
+        finally:
+            timing.count += 1
+            timing.seconds += time.perf_counter() - start
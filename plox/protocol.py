@@ -0,0 +1,53 @@
+import json
+import os
+import struct
+
+from typing import Any, Dict
+
+# Messages between the plox server and its clients are JSON objects, each
+# framed by its length in bytes as a 4-byte big-endian unsigned integer.
+#
+# A client sends {"source": ...} and the server answers with what running
+# that source printed and the exit code plox would have exited with:
+# {"output": ..., "errors": ..., "exit_code": ...}.
+
+header = struct.Struct('>I')
+
+# Larger frames are refused rather than buffered.
+max_size = 1 << 26
+
+Message = Dict[str, Any]
+
+class ProtocolError(Exception):
+    pass
+
+def encode(message: Message) -> bytes:
+    payload = json.dumps(message).encode()
+    return header.pack(len(payload)) + payload
+
+def decode_size(data: bytes) -> int:
+    (size,) = header.unpack(data)
+
+    if size > max_size:
+        raise ProtocolError(f'Frame of {size} bytes is larger than {max_size}.')
+
+    return size
+
+def decode(payload: bytes) -> Message:
+    try:
+        message = json.loads(payload)
+    except ValueError as error:
+        raise ProtocolError('Frame is not JSON.') from error
+
+    if not isinstance(message, dict):
+        raise ProtocolError('Frame is not a JSON object.')
+
+    return message
+
+def default_socket() -> str:
+    # One server per user, unless PLOX_SOCKET says otherwise.
+    path = os.environ.get('PLOX_SOCKET')
+    if path: return path
+
+    directory = os.environ.get('XDG_RUNTIME_DIR') or '/tmp'
+    return os.path.join(directory, f'plox-{os.getuid()}.sock')
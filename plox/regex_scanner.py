@@ -0,0 +1,164 @@
+import re
+
+from abc import ABC, abstractmethod
+from typing import AnyStr, Dict, Generic, Iterable, Iterator, Match, Optional
+
+from plox.error import Reporter
+
+from plox.scanner import keywords
+
+from plox.token import (
+    Token,
+    TokenType as TT,
+    Tokens,
+    lexemes
+)
+
+# Every lexeme in the Lox grammar, and everything between lexemes, is matched
+# by exactly one of these alternatives. Alternatives are tried in order, so
+# comments must come before the slash operator and terminated strings before
+# unterminated ones. The final alternative swallows any character that is not
+# in Lox's grammar so that the scan never stalls.
+alternatives = {
+    'space'       : r'[ \r\t\n]+',
+    'operator'    : r'[!=<>]=?|[(){},.\-+;*]',
+    'word'        : r'[A-Za-z_][A-Za-z0-9_]*',
+    'number'      : r'[0-9]+(?:\.[0-9]+)?',
+    'comment'     : r'//[^\n]*',
+    'slash'       : r'/',
+    'string'      : r'"[^"]*"',
+    'unterminated': r'"[^"]*',
+    'unexpected'  : r'.'
+}
+
+def master(alternatives: Dict[str, str]) -> str:
+    # The master pattern: a group for each alternative, named after it.
+    return '|'.join(f'(?P<{name}>{regex})' for (name, regex) in alternatives.items())
+
+pattern = re.compile(master(alternatives), re.DOTALL)
+
+operators = {
+    '(' : TT.LEFT_PAREN,
+    ')' : TT.RIGHT_PAREN,
+    '{' : TT.LEFT_BRACE,
+    '}' : TT.RIGHT_BRACE,
+    ',' : TT.COMMA,
+    '.' : TT.DOT,
+    '-' : TT.MINUS,
+    '+' : TT.PLUS,
+    ';' : TT.SEMICOLON,
+    '*' : TT.STAR,
+    '!' : TT.BANG,
+    '!=': TT.BANG_EQUAL,
+    '=' : TT.EQUAL,
+    '==': TT.EQUAL_EQUAL,
+    '<' : TT.LESS,
+    '<=': TT.LESS_EQUAL,
+    '>' : TT.GREATER,
+    '>=': TT.GREATER_EQUAL
+}
+
+class BaseLexer(ABC, Generic[AnyStr]):
+    # Turns matches of a master pattern into tokens, keeping track of the line
+    # number. Where the matches come from is up to the subclass, and so is
+    # whether they match str or bytes. The subclass gives the tables that
+    # operators and keywords are looked up in, how lines are counted, and how
+    # the lexemes that tokens keep are decoded.
+
+    operators: Dict[AnyStr, TT]
+    keywords: Dict[AnyStr, TT]
+
+    def __init__(self, reporter: Optional[Reporter] = None) -> None:
+        self.line = 1
+
+        # Where errors are reported. Without one, the lexer keeps its own.
+        self.reporter = Reporter() if reporter is None else reporter
+
+    @abstractmethod
+    def count_lines(self, text: AnyStr) -> int:
+        pass
+
+    @abstractmethod
+    def decode(self, text: AnyStr) -> str:
+        pass
+
+    def lex(self, matches: Iterable[Match[AnyStr]]) -> Iterator[Token]:
+        line = self.line
+        error = self.reporter.error
+
+        operators = self.operators
+        keywords = self.keywords
+        count_lines = self.count_lines
+        decode = self.decode
+
+        for match in matches:
+            kind = match.lastgroup
+            text = match.group()
+
+            if kind == 'space':
+                line += count_lines(text)
+
+            elif kind == 'operator':
+                type = operators[text]
+                yield Token(type, lexemes[type], None, line)
+
+            elif kind == 'word':
+                keyword = keywords.get(text)
+                if keyword is None: yield Token(TT.IDENTIFIER, decode(text), None, line)
+                else: yield Token(keyword, lexemes[keyword], None, line)
+
+            elif kind == 'number':
+                yield Token(TT.NUMBER, decode(text), float(text), line)
+
+            elif kind == 'comment':
+                pass
+
+            elif kind == 'slash':
+                yield Token(TT.SLASH, lexemes[TT.SLASH], None, line)
+
+            elif kind == 'string':
+                # Newline characters are preserved, and the token is reported
+                # on the line of the closing quotation mark.
+                line += count_lines(text)
+                lexeme = decode(text)
+                yield Token(TT.STRING, lexeme, lexeme[1:-1], line)
+
+            elif kind == 'unterminated':
+                line += count_lines(text)
+                error(line, 'Unterminated string.')
+
+            else:
+                error(line, f"Unexpected character '{decode(text)}'.")
+
+        self.line = line
+
+class Lexer(BaseLexer[str]):
+    # Lexes matches of pattern, over str.
+
+    operators = operators
+    keywords = keywords
+
+    def count_lines(self, text: str) -> int:
+        return text.count('\n')
+
+    def decode(self, text: str) -> str:
+        return text
+
+class RegexScanner(Lexer):
+    # A drop-in replacement for plox.scanner.Scanner. Instead of dispatching
+    # on one character at a time, it consumes a whole lexeme (or a whole run of
+    # whitespace) per step of a compiled master pattern. The tokens, their line
+    # numbers and the errors reported are identical to those of Scanner.
+
+    def __init__(self, source: str, reporter: Optional[Reporter] = None) -> None:
+        super().__init__(reporter)
+
+        self.source = source
+
+        self.tokens: Tokens = []
+
+    def scan_tokens(self) -> Tokens:
+        self.tokens.extend(self.lex(pattern.finditer(self.source)))
+        self.tokens.append(Token(TT.EOF, '', None, self.line))
+
+        return self.tokens
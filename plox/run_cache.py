@@ -0,0 +1,83 @@
+import threading
+
+from collections import OrderedDict
+from typing import Optional
+
+from plox.expressions import Expr
+from plox.token import Tokens
+
+def normalize(source: str) -> str:
+    # Spaces, tabs and carriage returns at either end of the source change
+    # neither the tokens nor their lines. Newlines would change the line of
+    # the EOF token, so they are kept.
+    return source.strip(' \t\r')
+
+class Entry:
+    def __init__(self, tokens: Tokens, expression: Optional[Expr]) -> None:
+        self.tokens = tokens
+        self.expression = expression
+
+        # The stringified value of the expression, once it has been evaluated
+        # without a runtime error. Expressions are pure, so it never changes.
+        self.text: Optional[str] = None
+
+class RunCache:
+    # A least-recently-used cache of the work done for each source run. Only
+    # sources that scan and parse without errors are cached, so that
+    # erroneous sources report their errors every time they are run.
+    #
+    # Runs on several threads share the cache, so reordering and evicting
+    # entries happens under a lock.
+
+    def __init__(self, capacity: int = 256) -> None:
+        # A capacity of zero disables the cache.
+        self.capacity = capacity
+
+        self.entries: 'OrderedDict[str, Entry]' = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, source: str) -> Optional[Entry]:
+        if self.capacity <= 0: return None
+
+        key = normalize(source)
+
+        with self.lock:
+            entry = self.entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self.entries.move_to_end(key)
+
+        return entry
+
+    def put(self, source: str, tokens: Tokens, expression: Optional[Expr]) -> Entry:
+        entry = Entry(tokens, expression)
+
+        if self.capacity <= 0: return entry
+
+        key = normalize(source)
+
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+
+            while len(self.entries) > self.capacity:
+                self.entries.popitem(last=False)
+
+        return entry
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
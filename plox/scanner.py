@@ -1,12 +1,15 @@
 import string
 
-import plox.error as error
+from typing import Optional
+
+from plox.error import Reporter
 
 from plox.token import (
     Literal,
     Token,
     TokenType as TT,
-    Tokens
+    Tokens,
+    lexemes
 )
 
 def is_digit(char: str) -> bool:
@@ -38,9 +41,12 @@ keywords = {
 }
 
 class Scanner:
-    def __init__(self, source: str) -> None:
+    def __init__(self, source: str, reporter: Optional[Reporter] = None) -> None:
         self.source = source
 
+        # Where errors are reported. Without one, the scanner keeps its own.
+        self.reporter = Reporter() if reporter is None else reporter
+
         self.tokens: Tokens = []
 
         # The index of the first character of the lexeme being scanned.
@@ -97,7 +103,7 @@ class Scanner:
         elif is_alpha(c): self.identifier()
 
         # Character is not in Lox's grammar.
-        else: error.error(self.line, f"Unexpected character '{c}'.")
+        else: self.reporter.error(self.line, f"Unexpected character '{c}'.")
 
     def is_at_end(self) -> bool:
         return self.current >= len(self.source)
@@ -121,7 +127,8 @@ class Scanner:
         return True
 
     def add_token(self, type: TT, literal: Literal = None) -> None:
-        text = self.source[self.start : self.current]
+        text = lexemes.get(type)
+        if text is None: text = self.source[self.start : self.current]
         self.tokens.append(Token(type, text, literal, self.line))
 
     def add_token_if(self, char: str, match: TT, no_match: TT) -> None:
@@ -143,7 +150,7 @@ class Scanner:
             self.advance()
 
         if self.is_at_end():
-            error.error(self.line, 'Unterminated string.')
+            self.reporter.error(self.line, 'Unterminated string.')
             return
 
         # The closing quotation mark.
@@ -0,0 +1,201 @@
+import math
+import struct
+
+from typing import Dict, List, Tuple, Union
+
+from plox.expressions import (
+    Binary,
+    Expr,
+    Grouping,
+    Literal,
+    Unary
+)
+
+from plox.token import (
+    Token,
+    TokenType as TT,
+    lexemes
+)
+
+# A compact binary encoding of expression trees.
+#
+# The encoding starts with a header: the magic bytes and the format version.
+# Nodes follow in post-order, children before their parent, so a loader
+# rebuilds the tree with one stack of finished subtrees and no recursion.
+# Each node is an opcode byte followed by its payload:
+#
+#   NIL, TRUE, FALSE, GROUPING   nothing
+#   NUMBER                       a little-endian double
+#   SMALL                        one byte, for the whole numbers 0 to 255
+#   STRING                       a 4-byte length and that many UTF-8 bytes
+#   BINARY, UNARY                the operator's token type
+#   LINE                         a 4-byte line for the operators that follow
+#
+# Operators always have the same lexeme for their type, so only the type is
+# stored, and lines only where they change. The loader shares one Token
+# between every operator of the same type on the same line.
+#
+# Change the version whenever the encoding or TokenType values change.
+
+magic = b'PLOX'
+version = 1
+
+header = struct.Struct('<4sB')
+
+NIL, TRUE, FALSE, NUMBER, SMALL, STRING, GROUPING, BINARY, UNARY, LINE = range(10)
+
+number = struct.Struct('<d')
+length = struct.Struct('<I')
+line = struct.Struct('<I')
+
+types: Dict[int, TT] = {token_type.value: token_type for token_type in TT}
+
+def is_small(value: float) -> bool:
+    # Negative zero is whole and in range, but a byte would lose its sign.
+    return value.is_integer() and 0 <= value <= 255 and math.copysign(1.0, value) > 0
+
+def dumps(expr: Expr) -> bytes:
+    out = bytearray(header.pack(magic, version))
+
+    # The line of the operators written since the last LINE, if any.
+    current_line = 0
+
+    # Expressions still to be written, each paired with whether its children
+    # have been written already.
+    work: List[Tuple[Expr, bool]] = [(expr, False)]
+
+    while work:
+        expr, ready = work.pop()
+
+        if isinstance(expr, Literal):
+            value = expr.value
+
+            if value is None: out.append(NIL)
+            elif value is True: out.append(TRUE)
+            elif value is False: out.append(FALSE)
+
+            elif isinstance(value, float) and is_small(value):
+                out.append(SMALL)
+                out.append(int(value))
+
+            elif isinstance(value, float):
+                out.append(NUMBER)
+                out += number.pack(value)
+
+            elif isinstance(value, str):
+                encoded = value.encode()
+                out.append(STRING)
+                out += length.pack(len(encoded))
+                out += encoded
+
+            else:
+                raise ValueError(f'Cannot serialize the literal {value!r}.')
+
+        elif ready:
+            if isinstance(expr, Grouping):
+                out.append(GROUPING)
+                continue
+
+            assert isinstance(expr, (Binary, Unary))
+            token = expr.operator
+
+            if token.line != current_line:
+                current_line = token.line
+                out.append(LINE)
+                out += line.pack(current_line)
+
+            out.append(BINARY if isinstance(expr, Binary) else UNARY)
+            out.append(token.type.value)
+
+        else:
+            work.append((expr, True))
+
+            if isinstance(expr, Grouping):
+                work.append((expr.expr, False))
+            elif isinstance(expr, Binary):
+                work.append((expr.right, False))
+                work.append((expr.left, False))
+            elif isinstance(expr, Unary):
+                work.append((expr.right, False))
+
+    return bytes(out)
+
+def loads(data: Union[bytes, bytearray, memoryview]) -> Expr:
+    # Raises ValueError when the data is not a complete encoding of one
+    # expression in the current format.
+
+    data = memoryview(data)
+
+    if len(data) < header.size or header.unpack_from(data) != (magic, version):
+        raise ValueError('Not a serialized expression in this format.')
+
+    # Subtrees built so far, with the most recent on top.
+    built: List[Expr] = []
+    tokens: Dict[Tuple[int, int], Token] = {}
+
+    # Literals that are the same value are the same node.
+    nil, true, false = Literal(None), Literal(True), Literal(False)
+
+    position = header.size
+    end = len(data)
+
+    current_line = 0
+
+    try:
+        while position < end:
+            opcode = data[position]
+            position += 1
+
+            if opcode == NUMBER:
+                built.append(Literal(number.unpack_from(data, position)[0]))
+                position += number.size
+
+            elif opcode == SMALL:
+                built.append(Literal(float(data[position])))
+                position += 1
+
+            elif opcode == BINARY or opcode == UNARY:
+                key = (data[position], current_line)
+                position += 1
+
+                token = tokens.get(key)
+
+                if token is None:
+                    token_type = types[key[0]]
+                    token = tokens[key] = Token(token_type, lexemes[token_type], None, current_line)
+
+                right = built.pop()
+
+                if opcode == BINARY: built.append(Binary(built.pop(), token, right))
+                else: built.append(Unary(token, right))
+
+            elif opcode == GROUPING:
+                built.append(Grouping(built.pop()))
+
+            elif opcode == STRING:
+                size = length.unpack_from(data, position)[0]
+                position += length.size
+
+                if position + size > end: raise ValueError('Truncated string.')
+
+                built.append(Literal(str(data[position : position + size], 'utf-8')))
+                position += size
+
+            elif opcode == LINE:
+                current_line = line.unpack_from(data, position)[0]
+                position += line.size
+
+            elif opcode == NIL: built.append(nil)
+            elif opcode == TRUE: built.append(true)
+            elif opcode == FALSE: built.append(false)
+
+            else:
+                raise ValueError(f'Unknown opcode {opcode}.')
+
+    except (IndexError, KeyError, struct.error, UnicodeDecodeError) as error:
+        raise ValueError('Corrupt serialized expression.') from error
+
+    if len(built) != 1:
+        raise ValueError('Corrupt serialized expression.')
+
+    return built[0]
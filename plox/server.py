@@ -0,0 +1,143 @@
+import asyncio
+import errno
+import os
+import socket
+import stat
+import sys
+
+from typing import List, Optional
+
+import plox.lox
+
+from plox.sink import CollectingSink
+
+from plox.protocol import (
+    Message,
+    ProtocolError,
+    decode,
+    decode_size,
+    default_socket,
+    encode,
+    header
+)
+
+usage = 'Usage: python -m plox.server [--socket=PATH] [plox options...]'
+
+def evaluate(source: str) -> Message:
+    # Runs a source as plox.lox.run() would, collecting what it prints. The
+    # scanner, parser, interpreter and run cache of plox.lox stay warm from
+    # one request to the next.
+    #
+    # Each request has a sink and a reporter of its own, and nothing global
+    # is redirected, so requests can run on several threads at once.
+    sink = CollectingSink()
+    reporter = plox.lox.run(source, sink)
+
+    output = ''.join(text + '\n' for text in sink.output)
+    errors = ''.join(text + '\n' for text in sink.errors)
+
+    return {'output': output, 'errors': errors, 'exit_code': reporter.exit_code}
+
+async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    # Answers requests from one client until it disconnects. Sources run on
+    # the loop's executor, so a slow one keeps neither other clients nor the
+    # loop waiting.
+    loop = asyncio.get_running_loop()
+
+    try:
+        while True:
+            try:
+                size = decode_size(await reader.readexactly(header.size))
+                request = decode(await reader.readexactly(size))
+            except asyncio.IncompleteReadError:
+                return
+
+            source = request.get('source')
+
+            if isinstance(source, str):
+                response = await loop.run_in_executor(None, evaluate, source)
+            else:
+                response = {'error': 'Expected a "source" string.'}
+
+            writer.write(encode(response))
+            await writer.drain()
+
+    except ProtocolError as error:
+        writer.write(encode({'error': str(error)}))
+        await writer.drain()
+
+    except ConnectionError:
+        pass
+
+    finally:
+        writer.close()
+
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+def is_stale(path: str) -> bool:
+    # Whether the path is a socket file left behind by a server that is gone.
+    # Raises FileExistsError if anything else is there, so that it is never
+    # removed: a file that is not a socket, or a socket a server still
+    # listens on.
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return False
+
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(errno.EEXIST, 'File exists and is not a socket', path)
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+        except ConnectionRefusedError:
+            return True
+
+    raise FileExistsError(errno.EADDRINUSE, 'Another server is listening', path)
+
+async def start(path: str) -> asyncio.AbstractServer:
+    # A socket file left behind by a server that is gone would keep the new
+    # one from binding.
+    if is_stale(path): os.remove(path)
+
+    return await asyncio.start_unix_server(handle, path)
+
+async def serve(path: str) -> None:
+    server = await start(path)
+
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        if os.path.exists(path): os.remove(path)
+
+def main(args: Optional[List[str]] = None) -> None:
+    if args is None: args = sys.argv[1:]
+
+    path = default_socket()
+
+    for arg in args:
+        if not arg.startswith('--'):
+            print(usage)
+            sys.exit(64)
+
+        name, _, value = arg[2:].partition('=')
+
+        if name == 'socket' and value != '':
+            path = value
+        else:
+            plox.lox.set_option(arg)
+
+    try:
+        asyncio.run(serve(path))
+    except KeyboardInterrupt:
+        pass
+    except OSError as error:
+        print(f'Could not listen on {path}: {error.strerror}.', file=sys.stderr)
+        sys.exit(73)
+
+if __name__ == '__main__':
+    main()
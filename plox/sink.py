@@ -0,0 +1,114 @@
+import sys
+import threading
+
+from typing import List, Optional, TextIO, Tuple
+
+class Sink:
+    # Where plox prints values and errors, one line at a time. Values and
+    # errors found while scanning and parsing are printed, and runtime errors
+    # are printed as errors.
+    #
+    # This sink prints each line as it comes to whatever sys.stdout and
+    # sys.stderr are at the time, as print() does.
+
+    def print(self, text: str) -> None:
+        print(text)
+
+    def print_error(self, text: str) -> None:
+        print(text, file=sys.stderr)
+
+    def flush(self) -> None:
+        pass
+
+class BufferedSink(Sink):
+    # Gathers printed lines and writes them in blocks of at least size
+    # characters, instead of making a write per line. Nothing reaches the
+    # file until the buffer fills or the sink is flushed.
+    #
+    # Errors are not buffered, but the lines printed before an error are
+    # written before it, so the two streams interleave just as they would
+    # without buffering.
+    #
+    # Without files of their own, lines go to sys.stdout and errors to
+    # sys.stderr as they are when written, so redirecting either still
+    # works.
+    #
+    # Threads may share a sink. Each line is buffered and written whole, and
+    # none is lost or written twice.
+
+    def __init__(
+        self,
+        size: int = 1 << 16,
+        file: Optional[TextIO] = None,
+        error_file: Optional[TextIO] = None
+    ) -> None:
+        self.size = size
+
+        self.file = file
+        self.error_file = error_file
+
+        self.lines: List[str] = []
+
+        # The number of characters in the lines, counting their newlines.
+        self.buffered = 0
+
+        self.lock = threading.RLock()
+
+    def print(self, text: str) -> None:
+        with self.lock:
+            self.lines.append(text)
+            self.buffered += len(text) + 1
+
+            if self.buffered >= self.size: self.write()
+
+    def print_error(self, text: str) -> None:
+        with self.lock:
+            self.flush()
+
+            error_file = sys.stderr if self.error_file is None else self.error_file
+
+            error_file.write(text + '\n')
+            error_file.flush()
+
+    def write(self) -> None:
+        # Writes the buffered lines without flushing the file.
+        with self.lock:
+            if not self.lines: return
+
+            file = sys.stdout if self.file is None else self.file
+
+            # The empty line gives the last line its newline.
+            self.lines.append('')
+            file.write('\n'.join(self.lines))
+
+            self.lines.clear()
+            self.buffered = 0
+
+    def flush(self) -> None:
+        with self.lock:
+            self.write()
+
+            file = sys.stdout if self.file is None else self.file
+            file.flush()
+
+class CollectingSink(Sink):
+    # Keeps the lines that would have been printed instead of printing them,
+    # for using plox as a library. Values and errors are kept in one list, in
+    # the order they were printed, each tagged with whether it is an error.
+
+    def __init__(self) -> None:
+        self.entries: List[Tuple[str, bool]] = []
+
+    @property
+    def output(self) -> List[str]:
+        return [text for (text, error) in self.entries if not error]
+
+    @property
+    def errors(self) -> List[str]:
+        return [text for (text, error) in self.entries if error]
+
+    def print(self, text: str) -> None:
+        self.entries.append((text, False))
+
+    def print_error(self, text: str) -> None:
+        self.entries.append((text, True))
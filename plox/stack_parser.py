@@ -0,0 +1,114 @@
+from typing import Dict, List, Optional, Tuple
+
+from plox.expressions import (
+    Binary,
+    Expr,
+    Grouping,
+    Literal,
+    Unary
+)
+
+from plox.parser import Parser
+from plox.token import Token, TokenType as TT
+
+# How tightly each binary operator binds, following the grammar rules from
+# equality down to factor. Unary operators bind tighter than all of them.
+# PrattParser uses the same table as its binding powers.
+precedences: Dict[TT, int] = {
+    TT.BANG_EQUAL   : 1,
+    TT.EQUAL_EQUAL  : 1,
+    TT.GREATER      : 2,
+    TT.GREATER_EQUAL: 2,
+    TT.LESS         : 2,
+    TT.LESS_EQUAL   : 2,
+    TT.MINUS        : 3,
+    TT.PLUS         : 3,
+    TT.SLASH        : 4,
+    TT.STAR         : 4
+}
+
+unary_precedence = 5
+
+# An operator waiting for its right operand, with its precedence.
+Pending = Tuple[Token, int]
+
+literals = {TT.FALSE: False, TT.TRUE: True, TT.NIL: None}
+
+class StackParser(Parser):
+    # Parses the same grammar as Parser, into the same trees and with the same
+    # errors, but keeps pending operators and operands on explicit stacks
+    # instead of the Python call stack. Nesting depth is limited only by
+    # memory.
+    #
+    # Operators wait on the stack until an operator that binds no tighter
+    # arrives, which makes binary operators left-associative. An open
+    # parenthesis waits on the stack as None.
+
+    def expression(self) -> Expr:
+        operands: List[Expr] = []
+        operators: List[Optional[Pending]] = []
+
+        while True:
+            # Expect an operand, preceded by any number of prefix operators and
+            # open parentheses.
+            while True:
+                if self.match(TT.BANG, TT.MINUS):
+                    operators.append((self.previous(), unary_precedence))
+                elif self.match(TT.LEFT_PAREN):
+                    operators.append(None)
+                else:
+                    break
+
+            operands.append(self.primary())
+
+            # Then either a binary operator, which waits for its right
+            # operand, or the end of as many groupings as are closed here.
+            while True:
+                precedence = precedences.get(self.peek().type)
+
+                if precedence is not None:
+                    self.reduce(operands, operators, precedence)
+                    operators.append((self.advance(), precedence))
+                    break
+
+                self.reduce(operands, operators, 0)
+
+                if not operators: return operands.pop()
+
+                self.consume(TT.RIGHT_PAREN, "Expect ')' after expression.")
+
+                operators.pop()
+                operands.append(self.node(Grouping(operands.pop())))
+
+    def primary(self) -> Expr:
+        # Only the operands that contain no further expressions.
+        token_type = self.peek().type
+
+        if token_type in literals:
+            self.advance()
+            return self.node(Literal(literals[token_type]))
+
+        if self.match(TT.NUMBER, TT.STRING):
+            return self.node(Literal(self.previous().literal))
+
+        raise self.error(self.peek(), 'Expect expression.')
+
+    def reduce(self, operands: List[Expr], operators: List[Optional[Pending]], precedence: int) -> None:
+        # Applies the waiting operators that bind at least as tightly as the
+        # given precedence, stopping at an open parenthesis.
+        while operators:
+            pending = operators[-1]
+
+            if pending is None: return
+
+            operator, binding = pending
+
+            if binding < precedence: return
+
+            operators.pop()
+            right = operands.pop()
+
+            if binding == unary_precedence:
+                operands.append(self.node(Unary(operator, right)))
+            else:
+                operands.append(self.node(Binary(operands.pop(), operator, right)))
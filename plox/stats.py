@@ -0,0 +1,120 @@
+import json
+import time
+import tracemalloc
+
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from plox.expressions import Expr
+from plox.optimizer import NodeCounter
+from plox.token import Token
+
+class PhaseStats:
+    def __init__(self) -> None:
+        self.wall = 0.0
+        self.cpu = 0.0
+
+        # The most memory allocated at once during the phase, over what was
+        # allocated when it started, if memory is measured.
+        self.peak: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'wall': self.wall, 'cpu': self.cpu, 'peak': self.peak}
+
+class RunStats:
+    # Throughput figures for one run of a source. Counts are None for work
+    # the run did not do, e.g. scanning a script whose AST was cached.
+
+    def __init__(self, memory: bool = False) -> None:
+        self.bytes: Optional[int] = None
+        self.tokens: Optional[int] = None
+        self.nodes: Optional[int] = None
+
+        self.phases: Dict[str, PhaseStats] = {}
+
+        # Whether phases measure their peak memory. Tracing allocations slows
+        # every one of them down, which distorts the times, so memory is only
+        # measured when asked for.
+        self.memory = memory
+
+        # Whether the first phase started tracemalloc, rather than finding it
+        # running already.
+        self.tracing = False
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        stats = self.phases.setdefault(name, PhaseStats())
+
+        if self.memory:
+            # Memory is measured with tracemalloc, which is started on first
+            # use and left running until the run ends, since starting it only
+            # traces later allocations.
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self.tracing = True
+
+            tracemalloc.reset_peak()
+            current, _ = tracemalloc.get_traced_memory()
+
+        wall = time.perf_counter()
+        cpu = time.process_time()
+
+        try:
+            yield
+        finally:
+            stats.wall += time.perf_counter() - wall
+            stats.cpu += time.process_time() - cpu
+
+            if self.memory:
+                _, peak = tracemalloc.get_traced_memory()
+                stats.peak = max(stats.peak or 0, peak - current)
+
+    def stop(self) -> None:
+        # Stops tracemalloc at the end of the run, if the run started it.
+        # Tracing slows every allocation down.
+        if self.tracing: tracemalloc.stop()
+        self.tracing = False
+
+    def count_source(self, source: str) -> None:
+        self.bytes = len(source.encode())
+
+    def count_tokens(self, tokens: Iterator[Token]) -> Iterator[Token]:
+        # Counts tokens as they are scanned, for sources that are scanned as
+        # they are parsed.
+        self.tokens = 0
+
+        for token in tokens:
+            self.tokens += 1
+            yield token
+
+    def count_nodes(self, expression: Optional[Expr]) -> None:
+        self.nodes = 0 if expression is None else NodeCounter().count(expression)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'bytes': self.bytes,
+            'tokens': self.tokens,
+            'nodes': self.nodes,
+            'phases': {name: stats.to_dict() for (name, stats) in self.phases.items()}
+        }
+
+    def json(self) -> str:
+        # One line per run, so a log of runs can be read line by line.
+        return json.dumps(self.to_dict())
+
+    def text(self) -> str:
+        def count(value: Optional[int]) -> str:
+            return '-' if value is None else f'{value:,}'
+
+        def kibibytes(value: Optional[int]) -> str:
+            return '-' if value is None else f'{value / 1024:.1f}'
+
+        lines = [
+            f'bytes {count(self.bytes)}, tokens {count(self.tokens)}, nodes {count(self.nodes)}',
+            f'{"phase":<16} {"wall s":>10} {"cpu s":>10} {"peak KiB":>10}'
+        ]
+
+        for (name, stats) in self.phases.items():
+            lines.append(f'{name:<16} {stats.wall:10.6f} {stats.cpu:10.6f} {kibibytes(stats.peak):>10}')
+
+        return '\n'.join(lines)
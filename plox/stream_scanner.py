@@ -0,0 +1,85 @@
+import re
+
+from typing import Dict, Iterator, Match, Optional, Pattern, TextIO
+
+from plox.error import Reporter
+
+from plox.regex_scanner import Lexer, pattern
+
+from plox.token import (
+    Token,
+    TokenType as TT
+)
+
+# Matching a lexeme never needs to look more than two characters past its end,
+# e.g. to decide whether '1' is followed by the fractional part '.5'.
+lookahead = 2
+
+# For the kinds of match that can run on for any length, the characters that
+# can end them. A chunk without any of these cannot change the match.
+closers: Dict[str, Pattern[str]] = {
+    'space'       : re.compile(r'[^ \r\t\n]'),
+    'word'        : re.compile(r'[^A-Za-z0-9_]'),
+    'number'      : re.compile(r'[^0-9.]'),
+    'comment'     : re.compile(r'\n'),
+    'unterminated': re.compile(r'"')
+}
+
+class StreamScanner(Lexer):
+    # Scans a file object a chunk at a time and yields tokens as they are
+    # found, so that only the unconsumed tail of the current chunk and the
+    # lexeme being matched are held in memory.
+
+    def __init__(self, file: TextIO, chunk_size: int = 1 << 16, reporter: Optional[Reporter] = None) -> None:
+        super().__init__(reporter)
+
+        self.file = file
+        self.chunk_size = chunk_size
+
+    def scan_tokens(self) -> Iterator[Token]:
+        yield from self.lex(self.matches())
+        yield Token(TT.EOF, '', None, self.line)
+
+    def matches(self) -> Iterator[Match[str]]:
+        buffer = ''
+        position = 0
+        at_end = False
+
+        while True:
+            match = pattern.match(buffer, position)
+
+            # A match that runs into the end of the buffer may belong to a
+            # lexeme, run of whitespace or comment that straddles a chunk
+            # boundary, so read more and try again.
+            if not at_end and (match is None or match.end() + lookahead > len(buffer)):
+                chunks = [buffer[position:]]
+
+                # Matching again is only worth it once a chunk arrives that
+                # could end the match, so until then chunks are gathered and
+                # joined once. Rejoining after every chunk would copy and
+                # match a long string or comment over and over.
+                closer = None if match is None else closers.get(match.lastgroup or '')
+
+                while True:
+                    chunk = self.file.read(self.chunk_size)
+
+                    if chunk == '':
+                        at_end = True
+                        break
+
+                    chunks.append(chunk)
+
+                    if closer is None or closer.search(chunk): break
+
+                buffer = ''.join(chunks)
+                position = 0
+
+                continue
+
+            # The pattern matches any character, so there is no match only
+            # when the buffer is exhausted.
+            if match is None: return
+
+            yield match
+
+            position = match.end()
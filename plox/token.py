@@ -1,6 +1,6 @@
 from enum import Enum
 
-from typing import List, Union
+from typing import Dict, List, Union
 
 class TokenType(Enum):
     # Single-character tokens.
@@ -52,9 +52,54 @@ class TokenType(Enum):
     # End-of-file.
     EOF = 39
 
+# Every token of these types has the same lexeme. Scanners share these strings
+# between tokens instead of slicing a fresh copy out of the source each time.
+lexemes: Dict[TokenType, str] = {
+    TokenType.LEFT_PAREN   : '(',
+    TokenType.RIGHT_PAREN  : ')',
+    TokenType.LEFT_BRACE   : '{',
+    TokenType.RIGHT_BRACE  : '}',
+    TokenType.COMMA        : ',',
+    TokenType.DOT          : '.',
+    TokenType.MINUS        : '-',
+    TokenType.PLUS         : '+',
+    TokenType.SEMICOLON    : ';',
+    TokenType.SLASH        : '/',
+    TokenType.STAR         : '*',
+    TokenType.BANG         : '!',
+    TokenType.BANG_EQUAL   : '!=',
+    TokenType.EQUAL        : '=',
+    TokenType.EQUAL_EQUAL  : '==',
+    TokenType.GREATER      : '>',
+    TokenType.GREATER_EQUAL: '>=',
+    TokenType.LESS         : '<',
+    TokenType.LESS_EQUAL   : '<=',
+    TokenType.AND          : 'and',
+    TokenType.CLASS        : 'class',
+    TokenType.ELSE         : 'else',
+    TokenType.FALSE        : 'false',
+    TokenType.FUN          : 'fun',
+    TokenType.FOR          : 'for',
+    TokenType.IF           : 'if',
+    TokenType.NIL          : 'nil',
+    TokenType.OR           : 'or',
+    TokenType.PRINT        : 'print',
+    TokenType.RETURN       : 'return',
+    TokenType.SUPER        : 'super',
+    TokenType.THIS         : 'this',
+    TokenType.TRUE         : 'true',
+    TokenType.VAR          : 'var',
+    TokenType.WHILE        : 'while',
+    TokenType.EOF          : ''
+}
+
 Literal = Union[bool, float, str, None]
 
 class Token:
+    # There are a great many tokens, so they do without a per-instance
+    # __dict__.
+    __slots__ = ('type', 'lexeme', 'literal', 'line')
+
     def __init__(self, type: TokenType, lexeme: str, literal: Literal, line: int) -> None:
         self.type = type
         self.lexeme = lexeme
@@ -64,12 +109,18 @@ class Token:
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Token): return False
 
-        return all([
-            self.type == other.type,
-            self.lexeme == other.lexeme,
-            self.literal == other.literal,
-            self.line == other.line
-        ])
+        return (
+            self.type is other.type and
+            self.line == other.line and
+            self.lexeme == other.lexeme and
+            self.literal == other.literal
+        )
+
+    def __hash__(self) -> int:
+        # Expressions cache hashes that include their tokens', and a token in
+        # an incremental document moves to another line when lines are added
+        # above it, so the line is left out.
+        return hash((self.type, self.lexeme, self.literal))
 
     def __repr__(self) -> str:
         return (
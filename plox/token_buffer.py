@@ -0,0 +1,113 @@
+from array import array
+from typing import Dict, Iterator, Optional, Tuple
+
+from plox.error import Reporter
+from plox.scanner import Scanner
+
+from plox.token import (
+    Literal,
+    Token,
+    TokenType as TT,
+    lexemes
+)
+
+# Token types indexed by their value, which is what the buffer stores.
+types_by_value: Dict[int, TT] = {type.value: type for type in TT}
+
+class TokenBuffer:
+    # Stores tokens column by column in parallel arrays instead of as one
+    # Python object per token. Lexemes and literals are not stored at all but
+    # sliced out of the source on demand. Indexing materializes a Token, so the
+    # buffer can stand in for a list of tokens wherever only indexing is used,
+    # as in Parser.
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+
+        self.types = array('B')
+        self.lines = array('I')
+
+        # The source offsets of the first character of each lexeme and of the
+        # character after it.
+        self.starts = array('Q')
+        self.ends = array('Q')
+
+        # The parser asks for the current and the previous token over and over
+        # while it decides what to do with them, so remember the last two
+        # tokens handed out, the older one first.
+        self.older: Tuple[int, Optional[Token]] = (-1, None)
+        self.newer: Tuple[int, Optional[Token]] = (-1, None)
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def __getitem__(self, index: int) -> Token:
+        if index < 0: index += len(self.types)
+
+        newer_index, newer_token = self.newer
+        if index == newer_index and newer_token is not None: return newer_token
+
+        older_index, older_token = self.older
+        if index == older_index and older_token is not None: return older_token
+
+        token = Token(self.type(index), self.lexeme(index), self.literal(index), self.lines[index])
+
+        self.older = self.newer
+        self.newer = (index, token)
+
+        return token
+
+    def __iter__(self) -> Iterator[Token]:
+        for index in range(len(self.types)):
+            yield self[index]
+
+    def add(self, type: TT, start: int, end: int, line: int) -> None:
+        self.types.append(type.value)
+        self.lines.append(line)
+        self.starts.append(start)
+        self.ends.append(end)
+
+    def type(self, index: int) -> TT:
+        return types_by_value[self.types[index]]
+
+    def line(self, index: int) -> int:
+        return self.lines[index]
+
+    def lexeme(self, index: int) -> str:
+        text = lexemes.get(self.type(index))
+        if text is None: text = self.source[self.starts[index] : self.ends[index]]
+        return text
+
+    def literal(self, index: int) -> Literal:
+        type = self.type(index)
+
+        if type == TT.NUMBER:
+            return float(self.source[self.starts[index] : self.ends[index]])
+
+        if type == TT.STRING:
+            # Trim the surrounding quotes.
+            return self.source[self.starts[index] + 1 : self.ends[index] - 1]
+
+        return None
+
+class BufferScanner(Scanner):
+    # A Scanner that records each token in a TokenBuffer rather than appending
+    # a Token to a list.
+
+    def __init__(self, source: str, reporter: Optional[Reporter] = None) -> None:
+        super().__init__(source, reporter)
+
+        self.buffer = TokenBuffer(source)
+
+    def scan_buffer(self) -> TokenBuffer:
+        while not self.is_at_end():
+            # We are at the beginning of a new lexeme.
+            self.start = self.current
+            self.scan_token()
+
+        self.buffer.add(TT.EOF, self.current, self.current, self.line)
+
+        return self.buffer
+
+    def add_token(self, type: TT, literal: Literal = None) -> None:
+        self.buffer.add(type, self.start, self.current, self.line)
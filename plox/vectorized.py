@@ -0,0 +1,227 @@
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+# NumPy is an optional dependency, listed in requirements.txt. Without it,
+# everything else in plox works, but VectorEvaluator cannot be created.
+try:
+    import numpy # type: ignore[import-not-found]
+except ImportError:
+    numpy = None # type: ignore[assignment]
+
+import plox.error
+
+from plox.expressions import (
+    Binary,
+    Expr,
+    Grouping,
+    Literal,
+    Unary,
+    Visitor
+)
+
+from plox.interpreter import binary, unary
+from plox.token import Token, TokenType as TT
+
+# Binary operators with a NumPy counterpart that only accept two numbers.
+numeric: Dict[TT, str] = {
+    TT.GREATER      : 'greater',
+    TT.GREATER_EQUAL: 'greater_equal',
+    TT.LESS         : 'less',
+    TT.LESS_EQUAL   : 'less_equal',
+    TT.MINUS        : 'subtract',
+    TT.STAR         : 'multiply',
+    TT.SLASH        : 'divide'
+}
+
+comparisons = {TT.GREATER, TT.GREATER_EQUAL, TT.LESS, TT.LESS_EQUAL}
+
+def to_column(values: Any, rows: int) -> Any:
+    # Lox numbers are floats, so every numeric array becomes float64. Arrays
+    # of anything else hold Lox values as Python objects.
+
+    if not isinstance(values, numpy.ndarray):
+        # NumPy would turn a list mixing strings and numbers into strings.
+        array = numpy.empty(len(values), dtype=object)
+        array[:] = [float(value) if value.__class__ is int else value for value in values]
+
+        types = {value.__class__ for value in array}
+
+        if types == {bool}: return to_column(array.astype(bool), rows)
+        if types == {float}: return to_column(array.astype(numpy.float64), rows)
+
+        return to_column(array, rows)
+
+    array = values
+
+    if array.shape != (rows,):
+        raise ValueError(f'Expected a column of {rows} rows, got shape {array.shape}.')
+
+    if array.dtype == bool: return array
+    if array.dtype.kind in 'iuf': return array.astype(numpy.float64)
+
+    return array.astype(object)
+
+class VectorResult:
+    def __init__(self, values: Any, errors: Any, failed: Any) -> None:
+        # The value of the expression for each row. Rows with an error hold an
+        # arbitrary placeholder.
+        self.values = values
+
+        # The runtime error each row raised, or None.
+        self.errors = errors
+
+        # Whether each row raised a runtime error.
+        self.failed = failed
+
+    def value(self, row: int) -> Any:
+        # The value as the scalar interpreter would produce it.
+        return self.values[row].item() if self.values.dtype != object else self.values[row]
+
+class VectorEvaluator(Visitor):
+    # Evaluates one expression over many rows at once. Literal operands can be
+    # bound to columns of inputs by their position, counting literals from
+    # left to right in the source; unbound literals hold for every row.
+    #
+    # Numbers and booleans are computed with whole-array NumPy operations.
+    # Columns of strings, nil or mixed types fall back to evaluating row by
+    # row. Each row reports the same runtime error as the scalar interpreter:
+    # the first one raised in evaluation order.
+
+    def __init__(self, columns: Mapping[int, Any], rows: Optional[int] = None) -> None:
+        if numpy is None:
+            raise ImportError('Vectorized evaluation requires NumPy.')
+
+        if rows is None:
+            rows = len(next(iter(columns.values()))) if columns else 1
+
+        self.rows = rows
+        self.columns = {index: to_column(values, rows) for (index, values) in columns.items()}
+
+        self.errors = numpy.full(rows, None, dtype=object)
+        self.failed = numpy.zeros(rows, dtype=bool)
+
+        # The position of the next literal to be visited.
+        self.position = 0
+
+    def evaluate(self, expr: Expr) -> VectorResult:
+        self.errors = numpy.full(self.rows, None, dtype=object)
+        self.failed = numpy.zeros(self.rows, dtype=bool)
+        self.position = 0
+
+        return VectorResult(expr.accept(self), self.errors, self.failed)
+
+    def visit_binary(self, expr: Binary) -> Any:
+        left = expr.left.accept(self)
+        right = expr.right.accept(self)
+
+        operator = expr.operator
+        token_type = operator.type
+
+        if left.dtype == object or right.dtype == object:
+            return self.by_row(lambda a, b: binary(operator, a, b), left, right)
+
+        if token_type == TT.EQUAL_EQUAL:
+            return left == right
+
+        if token_type == TT.BANG_EQUAL:
+            return left != right
+
+        are_numbers = left.dtype == numpy.float64 and right.dtype == numpy.float64
+
+        if token_type == TT.PLUS:
+            if are_numbers: return left + right
+
+            self.fail(operator, 'Operands must be two numbers or two strings.')
+            return numpy.zeros(self.rows)
+
+        if token_type in numeric:
+            if not are_numbers:
+                self.fail(operator, 'Operands must be numbers.')
+                dtype = bool if token_type in comparisons else numpy.float64
+                return numpy.zeros(self.rows, dtype=dtype)
+
+            if token_type == TT.SLASH:
+                self.fail(operator, 'Division by zero.', right == 0)
+
+            with numpy.errstate(divide='ignore', invalid='ignore'):
+                return getattr(numpy, numeric[token_type])(left, right)
+
+        return numpy.full(self.rows, None, dtype=object)
+
+    def visit_grouping(self, expr: Grouping) -> Any:
+        return expr.expr.accept(self)
+
+    def visit_literal(self, expr: Literal) -> Any:
+        position = self.position
+        self.position += 1
+
+        if position in self.columns: return self.columns[position]
+
+        value = expr.value
+
+        if isinstance(value, bool): return numpy.full(self.rows, value, dtype=bool)
+        if isinstance(value, float): return numpy.full(self.rows, value, dtype=numpy.float64)
+
+        return numpy.full(self.rows, value, dtype=object)
+
+    def visit_unary(self, expr: Unary) -> Any:
+        right = expr.right.accept(self)
+
+        operator = expr.operator
+        token_type = operator.type
+
+        if right.dtype == object:
+            return self.by_row(lambda a: unary(operator, a), right)
+
+        if token_type == TT.MINUS:
+            if right.dtype == numpy.float64: return -right
+
+            self.fail(operator, 'Operand must be a number.')
+            return numpy.zeros(self.rows)
+
+        if token_type == TT.BANG:
+            # Every number is truthy.
+            if right.dtype == numpy.float64: return numpy.zeros(self.rows, dtype=bool)
+            return ~right
+
+        return numpy.full(self.rows, None, dtype=object)
+
+    def fail(self, operator: Token, message: str, where: Any = True) -> None:
+        # Rows that failed earlier keep their first error.
+        rows = numpy.logical_and(where, ~self.failed)
+
+        self.errors[rows] = plox.error.RuntimeError(operator, message)
+        self.failed |= rows
+
+    def by_row(self, apply: Callable[..., Any], *operands: Any) -> Any:
+        values: List[Any] = [None] * self.rows
+        failed = self.failed
+
+        for (row, arguments) in enumerate(zip(*(operand.tolist() for operand in operands))):
+            if failed[row]: continue
+
+            try:
+                values[row] = apply(*arguments)
+            except plox.error.RuntimeError as error:
+                self.errors[row] = error
+                failed[row] = True
+
+        return self.pack(values)
+
+    def pack(self, values: List[Any]) -> Any:
+        # Go back to a fast representation when every row that did not fail
+        # has a value of the same type.
+        types = {value.__class__ for (value, failed) in zip(values, self.failed) if not failed}
+
+        if types <= {float}:
+            return numpy.array([0.0 if value is None else value for value in values], dtype=numpy.float64)
+
+        if types == {bool}:
+            return numpy.array([bool(value) for value in values], dtype=bool)
+
+        array = numpy.empty(self.rows, dtype=object)
+        array[:] = values
+
+        return array
+
+def evaluate(expr: Expr, columns: Mapping[int, Any], rows: Optional[int] = None) -> VectorResult:
+    return VectorEvaluator(columns, rows).evaluate(expr)
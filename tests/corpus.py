@@ -0,0 +1,117 @@
+from typing import Any, Callable, Optional
+from unittest import TestCase
+
+import plox.error
+
+from plox.error import Reporter
+from plox.expressions import Expr
+from plox.interpreter import Interpreter
+from plox.parser import Parser
+from plox.scanner import Scanner
+from plox.token import Tokens
+
+# The expressions every engine is checked on against the reference engines,
+# Parser and Interpreter. Tests of an engine's own edge cases live with the
+# engine's tests.
+
+# Expressions that evaluate without errors.
+values = [
+    '1',
+    '1 == 2 != 3',
+    '!-1',
+    '!0',
+    '-1 - -2 * 3 / 4 + 5',
+    '1 + 2 * 3 - 4 / 5',
+    '1 - 2 - 3 / 4 / 5',
+    '(1 + 2) * -3 >= -(4 / 5)',
+    '1 + 2 < 3 * 4 == !(5 >= 6) != nil',
+    '(((1 + 2)) * (3 - -(4)))',
+    '"bis" + "cotti" == "biscotti"',
+    '1 != nil',
+    '!nil == !!true',
+    'true == false != nil',
+    '1 < 2 == 2 <= 2',
+    '3 > 4 != 3 >= 4',
+    '1' * 400 + ' > 0'
+]
+
+# Expressions that parse but fail at runtime, with the error's message.
+errors = [
+    ('1 - "biscotti"', 'Operands must be numbers.'),
+    ('1 + "biscotti"', 'Operands must be two numbers or two strings.'),
+    ('true + true', 'Operands must be two numbers or two strings.'),
+    ('(1 + true) * 2', 'Operands must be two numbers or two strings.'),
+    ('-"biscotti"', 'Operand must be a number.'),
+    ('1 / (2 - 2)', 'Division by zero.'),
+    ('1 / 0 + "crumb"', 'Division by zero.'),
+    ('nil / 0', 'Operands must be numbers.'),
+    ('(1 / 0) < "biscotti"', 'Division by zero.'),
+    ('1 < 2 < 3', 'Operands must be numbers.'),
+    ('1 < 2 <= 3 > 4 >= 5', 'Operands must be numbers.'),
+    ('1 +\n2 *\n"biscotti"', 'Operands must be numbers.')
+]
+
+# Sources that do not parse.
+syntax_errors = [
+    '',
+    '1 2',
+    '1 + 2 )',
+    '1 +',
+    '(1 + 2',
+    '(1 2)',
+    '- * 3',
+    '((true) ! false)',
+    'biscotti + 1'
+]
+
+sources = values + [source for (source, _) in errors] + syntax_errors
+
+def parse(source: str) -> Expr:
+    expression = Parser(Scanner(source).scan_tokens()).parse()
+    assert expression is not None
+    return expression
+
+def check_parser(test: TestCase, parse: Callable[[Tokens, Reporter], Optional[Expr]]) -> None:
+    # Checks that a parser builds the same tree as Parser from every source,
+    # and reports the same errors.
+    for source in sources:
+        with test.subTest(source=source):
+            tokens = Scanner(source).scan_tokens()
+
+            expected_reporter = Reporter()
+            expected = Parser(tokens, reporter=expected_reporter).parse()
+
+            reporter = Reporter()
+
+            test.assertEqual(parse(tokens, reporter), expected)
+            test.assertEqual(reporter.diagnostics, expected_reporter.diagnostics)
+
+def check_evaluator(test: TestCase, evaluate: Callable[[Expr], Any]) -> None:
+    # Checks that evaluating every source that parses gives the value that
+    # Interpreter gives, of the same type, or raises the same runtime error
+    # from the same operator. Sources from the errors list must fail with
+    # their message, and no others may fail.
+    messages = dict(errors)
+
+    for source in sources:
+        expression = Parser(Scanner(source).scan_tokens()).parse()
+        if expression is None: continue
+
+        with test.subTest(source=source):
+            try:
+                expected = Interpreter().evaluate(expression)
+            except plox.error.RuntimeError as error:
+                test.assertEqual(error.message, messages.get(source))
+
+                with test.assertRaises(plox.error.RuntimeError) as raised:
+                    evaluate(expression)
+
+                test.assertIs(raised.exception.token, error.token)
+                test.assertEqual(raised.exception.message, error.message)
+            else:
+                test.assertNotIn(source, messages)
+
+                value = evaluate(expression)
+
+                test.assertEqual(value, expected)
+                test.assertIs(type(value), type(expected))
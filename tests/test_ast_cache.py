@@ -0,0 +1,44 @@
+import os
+
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+from corpus import parse
+
+from plox.ast_cache import cache_path, load, store
+
+class TestAstCache(TestCase):
+    def test_store_and_load(self) -> None:
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'biscotti.lox')
+            source = '(1 + 2) * "crumb"'
+
+            self.assertIsNone(load(path, source))
+
+            store(path, source, parse(source))
+
+            self.assertTrue(os.path.exists(cache_path(path)))
+            self.assertEqual(load(path, source), parse(source))
+
+    def test_stale(self) -> None:
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'biscotti.lox')
+
+            store(path, '1 + 2', parse('1 + 2'))
+
+            self.assertIsNone(load(path, '1 + 3'))
+
+    def test_corrupt(self) -> None:
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'biscotti.lox')
+            source = '1 + 2'
+
+            store(path, source, parse(source))
+
+            with open(cache_path(path), 'r+b') as file:
+                file.truncate(os.path.getsize(cache_path(path)) - 1)
+
+            self.assertIsNone(load(path, source))
+
+if __name__ == '__main__':
+    main()
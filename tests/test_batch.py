@@ -0,0 +1,43 @@
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from unittest import TestCase, main
+
+from plox.batch import evaluate_many
+from plox.error import Diagnostic
+
+class TestBatch(TestCase):
+    def test_results(self) -> None:
+        output = StringIO()
+
+        with redirect_stdout(output), redirect_stderr(output):
+            results = evaluate_many([
+                '(1 + 2) * 3',
+                '"bis" + "cotti"',
+                '1 +\n-"biscotti"',
+                '(1 + 2',
+                'bis@cotti',
+                '!nil'
+            ])
+
+        self.assertEqual(output.getvalue(), '')
+
+        self.assertEqual([result.text for result in results[:2]], ['9', 'biscotti'])
+        self.assertEqual(results[5].value, True)
+
+        self.assertEqual(results[2].errors, [Diagnostic(2, '', 'Operand must be a number.', runtime=True)])
+        self.assertEqual(results[3].errors, [Diagnostic(1, ' at end', "Expect ')' after expression.")])
+
+        self.assertEqual(results[4].errors, [
+            Diagnostic(1, '', "Unexpected character '@'."),
+            Diagnostic(1, " at 'bis'", 'Expect expression.')
+        ])
+
+        self.assertEqual([result.ok for result in results], [True, True, False, False, False, True])
+
+    def test_error_state(self) -> None:
+        # Errors in one source do not leak into the next.
+        results = evaluate_many(['(1 + 2', '-nil', '1 + 2'])
+        self.assertEqual([len(result.errors) for result in results], [1, 1, 0])
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,24 @@
+from unittest import TestCase, main
+
+from corpus import check_evaluator, parse
+
+from plox.closure_compiler import ClosureCompiler
+from plox.interpreter import Interpreter
+
+class TestEvaluation(TestCase):
+    def test_matches_interpreter(self) -> None:
+        check_evaluator(self, lambda expression: ClosureCompiler().compile(expression)())
+
+    def test_long_chains(self) -> None:
+        for source in [
+            ' + '.join(['1'] * 200),
+            ' - '.join(['-1'] * 200),
+            ' + '.join(['"bis"'] * 200),
+            '!' * 200 + '1'
+        ]:
+            with self.subTest(source=source[:8]):
+                expression = parse(source)
+                self.assertEqual(ClosureCompiler().compile(expression)(), Interpreter().evaluate(expression))
+
+if __name__ == '__main__':
+    main()
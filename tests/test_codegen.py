@@ -0,0 +1,40 @@
+from unittest import TestCase, main
+
+import plox.error
+
+from corpus import check_evaluator, parse
+
+from plox.codegen import CodeGenerator
+from plox.interpreter import Interpreter
+
+class TestEvaluation(TestCase):
+    def test_matches_interpreter(self) -> None:
+        check_evaluator(self, lambda expression: CodeGenerator().compile(expression)())
+
+    def test_long_chains(self) -> None:
+        # Operators become statements, not nested expressions, so chains past
+        # the 200 nested parentheses Python's parser allows still compile.
+        for source in [
+            ' + '.join(['1'] * 200),
+            ' - '.join(['-1'] * 200),
+            ' + '.join(['"bis"'] * 200),
+            '!' * 200 + '1'
+        ]:
+            with self.subTest(source=source[:8]):
+                expression = parse(source)
+                self.assertEqual(CodeGenerator().compile(expression)(), Interpreter().evaluate(expression))
+
+class TestCache(TestCase):
+    def test_shared_code(self) -> None:
+        first = CodeGenerator().compile(parse('1 - "biscotti"'))
+        second = CodeGenerator().compile(parse('\n\n1 - "biscotti"'))
+
+        self.assertIs(first.__code__, second.__code__)
+
+        with self.assertRaises(plox.error.RuntimeError) as context:
+            second()
+
+        self.assertEqual(context.exception.token.line, 3)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+import os
+import sys
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+import plox.error
+import plox.lox
+
+from plox.error import Diagnostic, Reporter
+from plox.interpreter import Interpreter
+from plox.parser import Parser
+from plox.scanner import Scanner
+
+def run(source: str) -> Reporter:
+    reporter = Reporter()
+    expression = Parser(Scanner(source, reporter).scan_tokens(), reporter=reporter).parse()
+
+    # Evaluates without printing, since threads cannot each redirect output.
+    if expression is not None and not reporter.had_error:
+        try:
+            Interpreter(reporter).evaluate(expression)
+        except plox.error.RuntimeError as error:
+            reporter.runtime_error(error)
+
+    return reporter
+
+class TestReporter(TestCase):
+    def test_collects(self) -> None:
+        reporter = run('bis@cotti')
+
+        self.assertEqual(reporter.diagnostics, [
+            Diagnostic(1, '', "Unexpected character '@'."),
+            Diagnostic(1, " at 'bis'", 'Expect expression.')
+        ])
+
+        self.assertEqual(reporter.exit_code, 65)
+
+    def test_runtime_error(self) -> None:
+        reporter = run('1 +\n-"biscotti"')
+
+        self.assertEqual(reporter.diagnostics, [Diagnostic(2, '', 'Operand must be a number.', runtime=True)])
+        self.assertFalse(reporter.had_error)
+        self.assertEqual(reporter.exit_code, 70)
+
+    def test_flush(self) -> None:
+        output = StringIO()
+        errors = StringIO()
+
+        reporter = run('(1 + 2')
+        reporter.runtime_error(plox.error.RuntimeError(Scanner('-').scan_tokens()[0], 'Biscotti.'))
+
+        with redirect_stdout(output), redirect_stderr(errors):
+            reporter.flush()
+            reporter.flush()
+
+        self.assertEqual(output.getvalue(), "[line 1] Error at end: Expect ')' after expression.\n")
+        self.assertEqual(errors.getvalue(), 'Biscotti.\n[line 1]\n')
+
+    def test_concurrent_sessions(self) -> None:
+        # Runs on many threads at once, through plox.lox as a host would.
+        # Each run keeps its own errors and exit code, and every value and
+        # error is printed whole.
+        sources = ['-nil', '1 + 2', '(1 + 2', 'bis@cotti', '1 - nil', '"bis" + "cotti"'] * 500
+        expected = {source: run(source) for source in sources}
+
+        output = StringIO()
+        errors = StringIO()
+
+        plox.lox.cache.clear()
+
+        # Switch threads as often as possible, so that runs interleave.
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+        try:
+            with redirect_stdout(output), redirect_stderr(errors):
+                with ThreadPoolExecutor(8) as executor:
+                    reporters = list(executor.map(plox.lox.run, sources))
+
+                plox.lox.output.flush()
+        finally:
+            sys.setswitchinterval(interval)
+
+        self.assertEqual(
+            [(reporter.diagnostics, reporter.exit_code) for reporter in reporters],
+            [(expected[source].diagnostics, expected[source].exit_code) for source in sources]
+        )
+
+        self.assertEqual(sorted(output.getvalue().splitlines()), sorted(
+            ['3', 'biscotti', "[line 1] Error at end: Expect ')' after expression."] * 500 +
+            ["[line 1] Error: Unexpected character '@'.", "[line 1] Error at 'bis': Expect expression."] * 500
+        ))
+
+        self.assertEqual(sorted(errors.getvalue().split('\n[line 1]\n')), sorted(
+            ['Operand must be a number.', 'Operands must be numbers.'] * 500 + ['']
+        ))
+
+class TestExitCode(TestCase):
+    def test_runtime_error(self) -> None:
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'biscotti.lox')
+
+            with open(path, 'w') as file:
+                file.write('-"biscotti"')
+
+            with redirect_stdout(StringIO()), redirect_stderr(StringIO()):
+                with self.assertRaises(SystemExit) as raised:
+                    plox.lox.run_file(path)
+
+        self.assertEqual(raised.exception.code, 70)
+
+if __name__ == '__main__':
+    main()
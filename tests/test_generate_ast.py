@@ -0,0 +1,19 @@
+from unittest import TestCase, main
+
+import plox.expressions
+
+from plox.generate_ast import expressions, generate
+
+class TestGeneration(TestCase):
+    def test_module_is_current(self) -> None:
+        # If this fails, regenerate the module with:
+        #   python plox/generate_ast.py plox
+        with open(plox.expressions.__file__) as file:
+            self.assertEqual(file.read(), generate())
+
+    def test_dispatch_tags(self) -> None:
+        for (tag, name) in enumerate(expressions):
+            self.assertEqual(getattr(plox.expressions, name).tag, tag)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,173 @@
+import random
+
+from unittest import TestCase, main
+
+from plox.error import Reporter
+from plox.expressions import Binary, Literal
+from plox.incremental import Document
+from plox.parser import ParseError, Parser
+from plox.regex_scanner import RegexScanner
+
+fragments = [
+    '1', '23', '4.5', '.', '+', '-', '*', '/', '//', '!', '=', '<', '>',
+    '(', ')', '"', 'bis', 'true', 'nil', ' ', '\n', '@'
+]
+
+class TestEdits(TestCase):
+    def test_matches_full_reparse(self) -> None:
+        rng = random.Random(0)
+
+        for _ in range(50):
+            document = Document('(1 + 2) * 3 - 4 / 5 != "biscotti"\n// hazelnut\n!true == nil')
+
+            for _ in range(20):
+                offset = rng.randrange(len(document.source) + 1)
+                removed = rng.randrange(min(3, len(document.source) - offset) + 1)
+                inserted = ''.join(rng.choice(fragments) for _ in range(rng.randrange(3)))
+
+                source = document.source[:offset] + inserted + document.source[offset + removed:]
+                expression = document.edit(offset, removed, inserted)
+
+                reporter = Reporter()
+                tokens = RegexScanner(source, reporter).scan_tokens()
+
+                self.assertEqual(document.source, source)
+                self.assertEqual(document.tokens, tokens)
+                self.assertEqual(expression, Parser(tokens, reporter=reporter).parse())
+                self.assertEqual(document.diagnostics, reporter.diagnostics)
+
+    def test_tokens_added_between_tokens(self) -> None:
+        # Turning the comment into '/>' adds tokens before '!' without
+        # replacing any. The expression that ended at '!' has to go.
+        document = Document('1 + 2 != "biscotti"\n// hazelnut\n!true')
+        expression = document.edit(21, 1, '>')
+
+        self.assertIsNone(expression)
+
+    def test_spans_stay_good(self) -> None:
+        # Every span kept across edits is what its rule gives when run at
+        # its token again.
+        rng = random.Random(1)
+
+        document = Document('(1 + 2) * 3 - 4 / 5 != "biscotti"\n!true == (nil)')
+
+        for _ in range(200):
+            offset = rng.randrange(len(document.source) + 1)
+            removed = rng.randrange(min(3, len(document.source) - offset) + 1)
+            inserted = ''.join(rng.choice(fragments) for _ in range(rng.randrange(3)))
+
+            document.edit(offset, removed, inserted)
+
+            indexes = {id(token): index for (index, token) in enumerate(document.tokens)}
+
+            for span in document.spans.spans.values():
+                parser = Parser(document.tokens)
+                parser.current = indexes[id(span.start)]
+
+                try:
+                    expr = getattr(parser, span.rule)()
+                except ParseError:
+                    self.fail(f'{span.rule} no longer parses')
+
+                self.assertEqual(expr, span.expr)
+                self.assertIs(document.tokens[parser.current], span.end)
+
+            # A link is what its rule gives for the tokens up to its end.
+            for links in document.spans.links.values():
+                for link in links:
+                    start = indexes[id(link.start)]
+                    tokens = document.tokens[start : start + link.length] + [document.tokens[-1]]
+
+                    parser = Parser(tokens)
+
+                    self.assertEqual(getattr(parser, link.rule)(), link.expr)
+                    self.assertEqual(parser.current, link.length)
+                    self.assertIs(document.tokens[start + link.length], link.end)
+
+    def test_diagnostics(self) -> None:
+        # The errors of a document are those of its source parsed afresh,
+        # in the same order, however the source came about.
+        document = Document('1 + 2\n* 3')
+
+        for (offset, removed, inserted) in [(2, 0, '@'), (0, 0, '('), (5, 1, ' @ '), (0, 1, ''), (3, 1, '')]:
+            document.edit(offset, removed, inserted)
+
+            reporter = Reporter()
+            Parser(RegexScanner(document.source, reporter).scan_tokens(), reporter=reporter).parse()
+
+            with self.subTest(source=document.source):
+                self.assertEqual(document.diagnostics, reporter.diagnostics)
+                self.assertEqual(document.reporter.exit_code, reporter.exit_code)
+
+    def test_own_reporter(self) -> None:
+        reporter = Reporter()
+        document = Document('(1 + @', reporter)
+
+        self.assertIs(document.reporter, reporter)
+        self.assertEqual([diagnostic.line for diagnostic in reporter.diagnostics], [1, 1])
+
+        document.edit(5, 1, '2)')
+        self.assertEqual(reporter.diagnostics, [])
+        self.assertFalse(reporter.had_error)
+
+class TestReuse(TestCase):
+    def test_reuse_subtrees(self) -> None:
+        document = Document('(1 + 2 * 3) == (4 - 5)')
+
+        before = document.expression
+        assert isinstance(before, Binary)
+
+        # Change '5' to '6'.
+        after = document.edit(20, 1, '6')
+        assert isinstance(after, Binary)
+
+        self.assertIs(after.left, before.left)
+        self.assertIsNot(after.right, before.right)
+
+    def test_reuse_after_edit(self) -> None:
+        document = Document('1 + 2 == (4 - 5)')
+
+        before = document.expression
+        assert isinstance(before, Binary)
+
+        # Change '1' to '7'.
+        after = document.edit(0, 1, '7')
+        assert isinstance(after, Binary)
+
+        self.assertIsNot(after.left, before.left)
+        self.assertIs(after.right, before.right)
+
+    def test_reuse_across_lines(self) -> None:
+        # Adding a line before an expression moves it down without
+        # rebuilding it.
+        document = Document('1 + 2 == (4 - 5)')
+
+        before = document.expression
+        assert isinstance(before, Binary)
+
+        after = document.edit(5, 0, '\n\n')
+        assert isinstance(after, Binary)
+
+        self.assertIs(after.right, before.right)
+        self.assertEqual(after, Parser(RegexScanner(document.source).scan_tokens()).parse())
+        self.assertEqual(after.operator.line, 3)
+        self.assertEqual([token.line for token in document.tokens], [1, 1, 1, 3, 3, 3, 3, 3, 3, 3])
+
+    def test_reuse_chain(self) -> None:
+        # Changing the last operand of a long chain keeps the chain before
+        # it. The operator before the operand is scanned again, in case the
+        # edit grew into it.
+        source = ' + '.join(['1'] * 1000)
+        document = Document(source)
+
+        before = document.expression
+        assert isinstance(before, Binary) and isinstance(before.left, Binary)
+
+        after = document.edit(len(source) - 1, 1, '2')
+        assert isinstance(after, Binary) and isinstance(after.left, Binary)
+
+        self.assertIs(after.left.left, before.left.left)
+        self.assertEqual(after.right, Literal(2.0))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+import os
+
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+from plox.mmap_scanner import MmapScanner
+from plox.regex_scanner import RegexScanner
+
+sources = [
+    b'',
+    b'1 != 2 >= 3 <= 4 // Please do not mutate the biscotti.\n5 / 6',
+    b'biscotti hazelnut 123.456 789. and or nil',
+    b'"caf\xc3\xa9 \xf0\x9f\x8d\xaa" "" "biscotti',
+    b'bis@cotti \xe2\x82\xac\n\n\n!\n=',
+    b'1 // windows\r\n2\r\n"two\r\nlines"\r\n3',
+    b'1 // old mac\r2\r"two\rlines"\r\r3 "\r',
+]
+
+class TestMmapScanner(TestCase):
+    def test_matches_text_mode(self) -> None:
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'biscotti.lox')
+
+            for source in sources:
+                with open(path, 'wb') as file:
+                    file.write(source)
+
+                with self.subTest(source=source):
+                    with open(path) as text:
+                        expected = RegexScanner(text.read())
+                        expected_tokens = expected.scan_tokens()
+
+                    with open(path, 'rb') as binary:
+                        scanner = MmapScanner(binary)
+                        tokens = list(scanner.scan_tokens())
+
+                    self.assertEqual(tokens, expected_tokens)
+                    self.assertEqual(scanner.reporter.diagnostics, expected.reporter.diagnostics)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+from unittest import TestCase, main
+
+from plox.ast_printer import AstPrinter
+from plox.expressions import Binary, Expr, Literal
+from plox.node_table import NodeTable
+from plox.parser import Parser
+from plox.scanner import Scanner
+
+def parse(source: str, nodes: NodeTable) -> Expr:
+    expression = Parser(Scanner(source).scan_tokens(), nodes).parse()
+    assert expression is not None
+    return expression
+
+class TestSharing(TestCase):
+    def test_shared_subtrees(self) -> None:
+        expression = parse('(1 + 2) * (1 + 2)', NodeTable())
+
+        assert isinstance(expression, Binary)
+        self.assertIs(expression.left, expression.right)
+
+    def test_shared_trees(self) -> None:
+        nodes = NodeTable()
+
+        first = parse('-(1 + 2) == "biscotti"', nodes)
+        second = parse('-(1 + 2) == "biscotti"', nodes)
+
+        self.assertIs(first, second)
+
+    def test_distinct_literals(self) -> None:
+        nodes = NodeTable()
+
+        expression = parse('1 == true', nodes)
+        assert isinstance(expression, Binary)
+
+        self.assertIsNot(expression.left, expression.right)
+        self.assertIsNot(nodes.intern(Literal(0.0)), nodes.intern(Literal(-0.0)))
+        self.assertEqual(AstPrinter().print(expression), '(== 1.0 True)')
+
+    def test_operator_lines(self) -> None:
+        # Runtime errors report the line of the operator, so subtrees with
+        # operators on different lines cannot be shared.
+        expression = parse('(1 + 2) *\n(1 + 2)', NodeTable())
+
+        assert isinstance(expression, Binary)
+        self.assertIsNot(expression.left, expression.right)
+
+        expression = parse('(1 + 2) * (1 +\n2)', NodeTable())
+
+        assert isinstance(expression, Binary)
+        self.assertIs(expression.left, expression.right)
+
+class TestHashing(TestCase):
+    def test_structural_hash(self) -> None:
+        first = parse('-(1 + 2) == "biscotti"', NodeTable())
+        second = parse('-(1 + 2) == "biscotti"', NodeTable())
+        third = parse('-(1 + 2) == "hazelnut"', NodeTable())
+
+        self.assertEqual(hash(first), hash(second))
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, third)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+from unittest import TestCase, main
+
+import plox.error
+
+from corpus import check_evaluator, parse
+
+from plox.expressions import (
+    Binary,
+    Literal,
+    Unary
+)
+
+from plox.interpreter import Interpreter
+from plox.optimizer import ConstantFolder, NodeCounter
+
+from plox.token import (
+    Token,
+    TokenType as TT
+)
+
+class TestFolding(TestCase):
+    def test_same_value(self) -> None:
+        check_evaluator(self, lambda expression: Interpreter().evaluate(ConstantFolder().fold(expression)))
+
+    def test_fold_constants(self) -> None:
+        folded = ConstantFolder().fold(parse('(1 + 2) * 3 - 4 / 2'))
+        self.assertEqual(folded, Literal(7))
+
+    def test_fold_around_errors(self) -> None:
+        folded = ConstantFolder().fold(parse('((1 + 2)) + -"biscotti"'))
+
+        expected = Binary(
+            Literal(3),
+            Token(TT.PLUS, '+', None, 1),
+            Unary(Token(TT.MINUS, '-', None, 1), Literal('biscotti'))
+        )
+
+        self.assertEqual(folded, expected)
+
+    def test_error_line(self) -> None:
+        folded = ConstantFolder().fold(parse('(2 * 3) /\n(1 - 1)'))
+
+        with self.assertRaises(plox.error.RuntimeError) as context:
+            Interpreter().evaluate(folded)
+
+        self.assertEqual(context.exception.message, 'Division by zero.')
+        self.assertEqual(context.exception.token.line, 1)
+
+    def test_node_count(self) -> None:
+        expression = parse('(1 + 2) * "biscotti"')
+        folded = ConstantFolder().fold(expression)
+
+        self.assertEqual(NodeCounter().count(expression), 6)
+        self.assertEqual(NodeCounter().count(folded), 3)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+import os
+import tempfile
+
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from typing import List
+from unittest import TestCase, main
+
+import plox.lox
+
+from plox.parallel import run_files
+
+scripts = [
+    '(1 + 2) * 3',
+    '(1 + 2',
+    '"biscotti" + "!"',
+    'bis@cotti'
+]
+
+def write_scripts(directory: str) -> List[str]:
+    paths = []
+
+    for (index, script) in enumerate(scripts):
+        path = os.path.join(directory, f'{index}.lox')
+
+        with open(path, 'w') as file:
+            file.write(script)
+
+        paths.append(path)
+
+    return paths
+
+class TestParallel(TestCase):
+    def test_outcomes(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            paths = write_scripts(directory)
+            outcomes = run_files(paths, 2)
+
+        self.assertEqual([outcome.path for outcome in outcomes], paths)
+        self.assertEqual([outcome.exit_code for outcome in outcomes], [0, 65, 0, 65])
+
+        self.assertEqual(outcomes[0].output, '9\n')
+        self.assertEqual(outcomes[1].output, "[line 1] Error at end: Expect ')' after expression.\n")
+
+        # An error in an earlier script does not leak into later ones.
+        self.assertEqual(outcomes[2].output, 'biscotti!\n')
+
+    def test_profiles(self) -> None:
+        # Each script is profiled on its own, even when a worker runs more
+        # than one, and plox merges the profiles into its own.
+        with tempfile.TemporaryDirectory() as directory:
+            paths = write_scripts(directory)
+            outcomes = run_files(paths, 1, ['--profile=json'])
+
+            profile = plox.lox.start_profile()
+
+            try:
+                with redirect_stdout(StringIO()), redirect_stderr(StringIO()):
+                    with self.assertRaises(SystemExit):
+                        plox.lox.run_files(paths, ['--profile=json'])
+            finally:
+                plox.lox.profile = None
+                plox.lox.interpreter = None
+
+        operators = [
+            {name: timing.count for (name, timing) in outcome.profile.operators.items()}
+            for outcome in outcomes if outcome.profile is not None
+        ]
+
+        self.assertEqual(operators, [{'PLUS': 1, 'STAR': 1}, {}, {'PLUS': 1}, {}])
+        self.assertEqual(profile.operators['PLUS'].count, 2)
+        self.assertEqual(profile.phases['evaluate'].count, 2)
+
+    def test_missing_file(self) -> None:
+        outcomes = run_files(['/nonexistent/biscotti.lox'], 1)
+
+        self.assertEqual(outcomes[0].exit_code, 66)
+        self.assertIn('Could not read', outcomes[0].errors)
+
+    def test_failed_script(self) -> None:
+        # A script that plox fails on does not take the rest of the batch
+        # down with it.
+        with tempfile.TemporaryDirectory() as directory:
+            paths = write_scripts(directory)
+
+            with open(paths[1], 'wb') as file:
+                file.write(b'\xff\xfe1')
+
+            outcomes = run_files(paths, 1)
+
+        self.assertEqual([outcome.exit_code for outcome in outcomes], [0, 70, 0, 65])
+        self.assertIn('Could not run', outcomes[1].errors)
+        self.assertEqual(outcomes[2].output, 'biscotti!\n')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+from io import StringIO
+from unittest import TestCase, main
+
+from corpus import check_parser, sources
+
+from plox.node_table import NodeTable
+from plox.parser import Parser
+from plox.pratt_parser import PrattParser
+from plox.regex_scanner import RegexScanner
+from plox.stream_scanner import StreamScanner
+
+class TestPrattParser(TestCase):
+    def test_same_as_parser(self) -> None:
+        check_parser(self, lambda tokens, reporter: PrattParser(tokens, reporter=reporter).parse())
+
+    def test_token_stream(self) -> None:
+        for source in sources:
+            with self.subTest(source=source):
+                expected = Parser(RegexScanner(source).scan_tokens()).parse()
+                expression = PrattParser(StreamScanner(StringIO(source)).scan_tokens()).parse()
+
+                self.assertEqual(expression, expected)
+
+    def test_interning(self) -> None:
+        tokens = RegexScanner('(1 + 2) * (1 + 2)').scan_tokens()
+        expression = PrattParser(tokens, NodeTable()).parse()
+
+        self.assertIs(expression.left.expr, expression.right.expr) # type: ignore
+
+if __name__ == '__main__':
+    main()
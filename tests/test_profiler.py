@@ -0,0 +1,139 @@
+import json
+import os
+import sys
+import tempfile
+
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from unittest import TestCase, main
+
+from corpus import check_evaluator, parse
+
+import plox.lox
+
+from plox.profiler import Profile, ProfilingInterpreter
+from plox.scanner import Scanner
+from plox.stack_parser import StackParser
+
+def interpret(profile: Profile, source: str) -> object:
+    with redirect_stdout(StringIO()), redirect_stderr(StringIO()):
+        return ProfilingInterpreter(profile).interpret(parse(source))
+
+class TestProfiler(TestCase):
+    def test_counts(self) -> None:
+        profile = Profile()
+
+        self.assertEqual(interpret(profile, '(1 + 2) * -3 == -9'), 'true')
+
+        counts = {name: timing.count for (name, timing) in profile.nodes.items()}
+        self.assertEqual(counts, {'Binary': 3, 'Grouping': 1, 'Literal': 4, 'Unary': 2})
+
+        counts = {name: timing.count for (name, timing) in profile.operators.items()}
+        self.assertEqual(counts, {'PLUS': 1, 'MINUS': 2, 'STAR': 1, 'EQUAL_EQUAL': 1})
+
+        self.assertEqual(profile.failures, {})
+
+    def test_failures(self) -> None:
+        profile = Profile()
+
+        self.assertIsNone(interpret(profile, '1 + -"biscotti"'))
+        self.assertIsNone(interpret(profile, '-nil'))
+        self.assertIsNone(interpret(profile, '1 + "biscotti"'))
+
+        self.assertEqual(profile.failures, {
+            ('MINUS', 'Operand must be a number.'): 2,
+            ('PLUS', 'Operands must be two numbers or two strings.'): 1
+        })
+
+    def test_divisions_by_zero(self) -> None:
+        # Dividing by zero passes the type check, so it is counted apart
+        # from the failures.
+        profile = Profile()
+
+        self.assertIsNone(interpret(profile, '1 / (2 - 2)'))
+        self.assertIsNone(interpret(profile, '"biscotti" / 2'))
+
+        self.assertEqual(profile.divisions_by_zero, 1)
+        self.assertEqual(profile.failures, {('SLASH', 'Operands must be numbers.'): 1})
+
+    def test_same_as_interpreter(self) -> None:
+        check_evaluator(self, ProfilingInterpreter(Profile()).evaluate)
+
+    def test_deep_nesting(self) -> None:
+        depth = sys.getrecursionlimit() * 5
+        profile = Profile()
+
+        source = '- ' * depth + '(' * depth + '1' + ')' * depth
+        expression = StackParser(Scanner(source).scan_tokens()).parse()
+        assert expression is not None
+
+        self.assertEqual(ProfilingInterpreter(profile).evaluate(expression), 1)
+        self.assertEqual(profile.nodes['Grouping'].count, depth)
+        self.assertEqual(profile.operators['MINUS'].count, depth)
+
+    def test_deep_script(self) -> None:
+        # Profiling a script too deep for the recursive parser and
+        # interpreter works with the stack parser.
+        depth = sys.getrecursionlimit() * 5
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'deep.lox')
+
+            with open(path, 'w') as file:
+                file.write('(' * depth + '1' + ')' * depth)
+
+            output = StringIO()
+            saved = (plox.lox.parser_name, plox.lox.interpreter)
+
+            try:
+                with redirect_stdout(output), redirect_stderr(StringIO()):
+                    plox.lox.set_option('--profile=json')
+                    plox.lox.set_option('--parser=stack')
+                    plox.lox.run_file(path)
+                    plox.lox.output.flush()
+
+                profile = plox.lox.profile
+                assert profile is not None
+            finally:
+                plox.lox.parser_name, plox.lox.interpreter = saved
+                plox.lox.profile = None
+
+        self.assertEqual(output.getvalue(), '1\n')
+        self.assertEqual(profile.nodes['Grouping'].count, depth)
+
+    def test_merge(self) -> None:
+        first = Profile()
+        second = Profile()
+
+        interpret(first, '-nil')
+        interpret(second, '1 + 2 / 0')
+        interpret(second, '-nil')
+
+        first.merge(second)
+
+        self.assertEqual(first.nodes['Unary'].count, 2)
+        self.assertEqual(first.nodes['Literal'].count, 5)
+        self.assertEqual(first.operators['SLASH'].count, 1)
+        self.assertNotIn('PLUS', first.operators)
+        self.assertEqual(first.failures, {('MINUS', 'Operand must be a number.'): 2})
+        self.assertEqual(first.divisions_by_zero, 1)
+
+    def test_reports(self) -> None:
+        profile = Profile()
+
+        with profile.phase('evaluate'):
+            interpret(profile, '-nil')
+
+        report = json.loads(profile.json())
+
+        self.assertEqual(report['phases']['evaluate']['count'], 1)
+        self.assertEqual(report['nodes']['Unary']['count'], 1)
+        self.assertEqual(report['failures'], [
+            {'operator': 'MINUS', 'message': 'Operand must be a number.', 'count': 1}
+        ])
+        self.assertEqual(report['divisions_by_zero'], 0)
+
+        self.assertIn('Operand must be a number.', profile.text())
+
+if __name__ == '__main__':
+    main()
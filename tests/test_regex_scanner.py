@@ -0,0 +1,53 @@
+from unittest import TestCase, main
+
+from plox.error import Diagnostic
+from plox.regex_scanner import RegexScanner
+from plox.scanner import Scanner
+
+from plox.token import (
+    Token,
+    TokenType as TT
+)
+
+sources = [
+    '',
+    '(){},.-+;*/ ! != = == < <= > >=',
+    'and class else false for fun if nil or print return super this true var while',
+    'biscotti _crumb hazel2nut',
+    '123 45.67 8. .9 10.11.12',
+    '"hazelnut" "two\nlines" 1',
+    '1 // Please do not mutate the biscotti.\n2 / 3',
+    'bis@cotti\n#\t\r\n$',
+    '1\n"biscotti\n\n',
+    'é 1 ٣'
+]
+
+def scan(engine: type, source: str) -> tuple:
+    scanner = engine(source)
+    tokens = scanner.scan_tokens()
+
+    return (tokens, scanner.reporter.diagnostics)
+
+class TestEquivalence(TestCase):
+    def test_matches_scanner(self) -> None:
+        for source in sources:
+            with self.subTest(source=source):
+                self.assertEqual(
+                    scan(RegexScanner, source),
+                    scan(Scanner, source)
+                )
+
+class TestError(TestCase):
+    def test_unterminated_string(self) -> None:
+        tokens, errors = scan(RegexScanner, 'var\n"bis\ncotti')
+
+        expected = [
+            Token(TT.VAR, 'var', None, 1),
+            Token(TT.EOF, '', None, 3)
+        ]
+
+        self.assertEqual(tokens, expected)
+        self.assertEqual(errors, [Diagnostic(3, '', 'Unterminated string.')])
+
+if __name__ == '__main__':
+    main()
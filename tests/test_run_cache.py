@@ -0,0 +1,70 @@
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from unittest import TestCase, main
+
+import plox.lox
+
+from plox.run_cache import RunCache
+
+def run(source: str) -> tuple:
+    output = StringIO()
+    errors = StringIO()
+
+    with redirect_stdout(output), redirect_stderr(errors):
+        plox.lox.run(source)
+        plox.lox.output.flush()
+
+    return (output.getvalue(), errors.getvalue())
+
+class TestCache(TestCase):
+    def test_eviction(self) -> None:
+        cache = RunCache(2)
+
+        cache.put('1', [], None)
+        cache.put('2', [], None)
+        self.assertIsNotNone(cache.get('1'))
+        cache.put('3', [], None)
+
+        self.assertIsNone(cache.get('2'))
+        self.assertIsNotNone(cache.get(' 1\t'))
+        self.assertEqual(len(cache), 2)
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+    def test_disabled(self) -> None:
+        cache = RunCache(0)
+        cache.put('1', [], None)
+
+        self.assertIsNone(cache.get('1'))
+        self.assertEqual(len(cache), 0)
+
+class TestRun(TestCase):
+    def setUp(self) -> None:
+        plox.lox.cache = RunCache()
+
+    def test_cached_value(self) -> None:
+        self.assertEqual(run('(1 + 2) * 3'), ('9\n', ''))
+        self.assertEqual(run('(1 + 2) * 3 '), ('9\n', ''))
+
+        entry = plox.lox.cache.get('(1 + 2) * 3')
+
+        assert entry is not None
+        self.assertEqual(entry.text, '9')
+        self.assertEqual(plox.lox.cache.hits, 2)
+
+    def test_runtime_error(self) -> None:
+        expected = ('', 'Operands must be numbers.\n[line 1]\n')
+
+        self.assertEqual(run('1 - "biscotti"'), expected)
+        self.assertEqual(run('1 - "biscotti"'), expected)
+        self.assertEqual(plox.lox.cache.hits, 1)
+
+    def test_syntax_error(self) -> None:
+        expected = ("[line 1] Error at end: Expect ')' after expression.\n", '')
+
+        self.assertEqual(run('(1 + 2'), expected)
+        self.assertEqual(run('(1 + 2'), expected)
+
+        self.assertEqual(len(plox.lox.cache), 0)
+
+if __name__ == '__main__':
+    main()
@@ -127,5 +127,11 @@ class TestTokens(TestCase):
 
         self.assertEqual(tokens, expected)
 
+    def test_shared_lexemes(self) -> None:
+        first, second = Scanner('while while').scan_tokens()[:2]
+
+        self.assertIs(first.lexeme, second.lexeme)
+        self.assertFalse(hasattr(first, '__dict__'))
+
 if __name__ == '__main__':
     main()
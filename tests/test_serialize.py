@@ -0,0 +1,62 @@
+import sys
+
+from unittest import TestCase, main
+
+from plox.expressions import Literal
+from plox.parser import Parser
+from plox.regex_scanner import RegexScanner
+from plox.serialize import dumps, loads
+from plox.stack_parser import StackParser
+
+sources = [
+    '1',
+    'nil',
+    'true == !false',
+    '"biscotti" + "" != "crumb\\n"',
+    '"munch 🍪"',
+    '-1.5 - -2 * 3 / 4 + 5',
+    '1 + 2 < 3 * 4 == !(5 >= 6) != nil',
+    '(((1 + 2)) * (3 - -(4)))',
+    '1\n+\n2\n*\n3'
+]
+
+class TestSerialize(TestCase):
+    def test_round_trip(self) -> None:
+        for source in sources:
+            with self.subTest(source=source):
+                expression = Parser(RegexScanner(source).scan_tokens()).parse()
+                assert expression is not None
+
+                self.assertEqual(loads(dumps(expression)), expression)
+
+    def test_numbers(self) -> None:
+        for value in [0.0, -0.0, 1.0, 255.0, 256.0, -1.0, 0.5, 1e300, float('inf')]:
+            with self.subTest(value=value):
+                loaded = loads(dumps(Literal(value)))
+
+                assert isinstance(loaded, Literal)
+                self.assertEqual(str(loaded.value), str(value))
+
+    def test_deep_nesting(self) -> None:
+        depth = sys.getrecursionlimit() * 20
+        source = '- ' * depth + '(' * depth + '1' + ')' * depth
+
+        expression = StackParser(RegexScanner(source).scan_tokens()).parse()
+        assert expression is not None
+
+        data = dumps(expression)
+        self.assertEqual(dumps(loads(data)), data)
+
+    def test_corrupt(self) -> None:
+        expression = Parser(RegexScanner('(1 + "biscotti") * 2').scan_tokens()).parse()
+        assert expression is not None
+
+        data = dumps(expression)
+
+        for corrupt in [b'', b'PLOX', data[:-1], data + data[5:], b'JUNK' + data[4:], data[:5] + b'\xff']:
+            with self.subTest(corrupt=corrupt):
+                with self.assertRaises(ValueError):
+                    loads(corrupt)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+import asyncio
+import os
+import socket
+
+from tempfile import TemporaryDirectory
+from typing import List
+from unittest import TestCase, main
+
+import plox.lox
+
+from plox.protocol import (
+    Message,
+    ProtocolError,
+    decode,
+    decode_size,
+    encode,
+    header,
+    max_size
+)
+
+from plox.server import start
+
+async def request(path: str, sources: List[str]) -> List[Message]:
+    # Sends the sources one after another on one connection.
+    reader, writer = await asyncio.open_unix_connection(path)
+    responses = []
+
+    for source in sources:
+        writer.write(encode({'source': source}))
+        size = decode_size(await reader.readexactly(header.size))
+        responses.append(decode(await reader.readexactly(size)))
+
+    writer.close()
+    await writer.wait_closed()
+
+    return responses
+
+async def with_server(*clients: List[str]) -> List[List[Message]]:
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'plox.sock')
+        server = await start(path)
+
+        async with server:
+            return await asyncio.gather(*(request(path, sources) for sources in clients))
+
+class TestProtocol(TestCase):
+    def test_round_trip(self) -> None:
+        message = {'source': '"biscotti" + "🍪"'}
+        frame = encode(message)
+
+        size = decode_size(frame[:header.size])
+
+        self.assertEqual(size, len(frame) - header.size)
+        self.assertEqual(decode(frame[header.size:]), message)
+
+    def test_invalid(self) -> None:
+        with self.assertRaises(ProtocolError):
+            decode_size(header.pack(max_size + 1))
+
+        for payload in [b'biscotti', b'[1, 2]']:
+            with self.assertRaises(ProtocolError):
+                decode(payload)
+
+class TestServer(TestCase):
+    def setUp(self) -> None:
+        plox.lox.cache.clear()
+
+    def test_concurrent_clients(self) -> None:
+        clients = [
+            ['1 + 2', '"bis" + "cotti"'],
+            ['(1 +', '4 * 5'],
+            ['6 / 3', '!nil', '1 == 1'],
+        ]
+
+        results = asyncio.run(with_server(*clients))
+
+        outputs = [[response['output'] for response in responses] for responses in results]
+        exit_codes = [[response['exit_code'] for response in responses] for responses in results]
+
+        self.assertEqual(outputs, [
+            ['3\n', 'biscotti\n'],
+            ['[line 1] Error at end: Expect expression.\n', '20\n'],
+            ['2\n', 'true\n', 'true\n']
+        ])
+
+        # An error in one request does not leak into later ones.
+        self.assertEqual(exit_codes, [[0, 0], [65, 0], [0, 0, 0]])
+
+    def test_slow_request(self) -> None:
+        # A slow source runs off the event loop, so a client that asks
+        # later is answered first.
+        finished: List[str] = []
+
+        async def ask(path: str, source: str, delay: float) -> None:
+            await asyncio.sleep(delay)
+            await request(path, [source])
+            finished.append(source)
+
+        async def serve() -> None:
+            with TemporaryDirectory() as directory:
+                path = os.path.join(directory, 'plox.sock')
+                server = await start(path)
+
+                async with server:
+                    await asyncio.gather(ask(path, slow, 0), ask(path, '1 + 2', 0.05))
+
+        slow = '1 // ' + 'biscotti' * 100000
+        asyncio.run(serve())
+
+        self.assertEqual(finished, ['1 + 2', slow])
+
+    def test_runtime_error(self) -> None:
+        # Runtime errors go to the errors of the request that made them.
+        results = asyncio.run(with_server(['"biscotti" - 1', '1 + 2']))
+
+        self.assertEqual(results[0][0]['output'], '')
+        self.assertEqual(results[0][0]['errors'], 'Operands must be numbers.\n[line 1]\n')
+        self.assertEqual(results[0][0]['exit_code'], 70)
+        self.assertEqual(results[0][1]['output'], '3\n')
+
+    def test_bad_request(self) -> None:
+        async def send() -> Message:
+            with TemporaryDirectory() as directory:
+                path = os.path.join(directory, 'plox.sock')
+                server = await start(path)
+
+                async with server:
+                    reader, writer = await asyncio.open_unix_connection(path)
+                    writer.write(encode({'script': 'biscotti.lox'}))
+
+                    size = decode_size(await reader.readexactly(header.size))
+                    response = decode(await reader.readexactly(size))
+
+                    writer.close()
+                    await writer.wait_closed()
+
+                    return response
+
+        self.assertIn('error', asyncio.run(send()))
+
+class TestStart(TestCase):
+    def test_stale_socket(self) -> None:
+        # A socket that nothing listens on any more is replaced.
+        async def serve(path: str) -> List[Message]:
+            server = await start(path)
+
+            async with server:
+                return await request(path, ['1 + 2'])
+
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'plox.sock')
+
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+                stale.bind(path)
+
+            self.assertEqual(asyncio.run(serve(path))[0]['output'], '3\n')
+
+    def test_not_a_socket(self) -> None:
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'plox.sock')
+
+            with open(path, 'w') as file:
+                file.write('biscotti')
+
+            with self.assertRaises(FileExistsError):
+                asyncio.run(start(path))
+
+            with open(path) as file:
+                self.assertEqual(file.read(), 'biscotti')
+
+    def test_listening_socket(self) -> None:
+        # A second server does not take the socket of one still running.
+        async def serve(path: str) -> List[Message]:
+            server = await start(path)
+
+            async with server:
+                with self.assertRaises(FileExistsError):
+                    await start(path)
+
+                return await request(path, ['1 + 2'])
+
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'plox.sock')
+            self.assertEqual(asyncio.run(serve(path))[0]['output'], '3\n')
+
+if __name__ == '__main__':
+    main()
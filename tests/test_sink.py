@@ -0,0 +1,128 @@
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from unittest import TestCase, main
+
+import plox.lox
+
+from plox.error import Reporter
+from plox.interpreter import Interpreter
+from plox.parser import Parser
+from plox.scanner import Scanner
+from plox.sink import BufferedSink, CollectingSink
+
+class TestBufferedSink(TestCase):
+    def test_buffers(self) -> None:
+        file = StringIO()
+        sink = BufferedSink(8, file)
+
+        sink.print('1')
+        sink.print('2')
+        self.assertEqual(file.getvalue(), '')
+
+        sink.print('biscotti')
+        self.assertEqual(file.getvalue(), '1\n2\nbiscotti\n')
+
+        sink.print('3')
+        sink.flush()
+        self.assertEqual(file.getvalue(), '1\n2\nbiscotti\n3\n')
+
+    def test_order(self) -> None:
+        # Written to one file, errors land right after what was printed
+        # before them.
+        file = StringIO()
+        sink = BufferedSink(1 << 16, file, file)
+
+        sink.print('1')
+        sink.print_error('Operand must be a number.\n[line 1]')
+        sink.print('2')
+        sink.flush()
+
+        self.assertEqual(file.getvalue(), '1\nOperand must be a number.\n[line 1]\n2\n')
+
+    def test_redirect(self) -> None:
+        output = StringIO()
+        errors = StringIO()
+        sink = BufferedSink()
+
+        with redirect_stdout(output), redirect_stderr(errors):
+            sink.print('1')
+            sink.print_error('biscotti')
+            sink.print('2')
+            sink.flush()
+
+        self.assertEqual((output.getvalue(), errors.getvalue()), ('1\n2\n', 'biscotti\n'))
+
+class TestCollectingSink(TestCase):
+    def test_collects(self) -> None:
+        sink = CollectingSink()
+
+        for source in ['(1 + 2) * 3', '-"biscotti"', '(1 +', '"bis" + "cotti"']:
+            reporter = Reporter()
+            expression = Parser(Scanner(source, reporter).scan_tokens(), reporter=reporter).parse()
+
+            if expression is not None:
+                Interpreter(reporter, sink).interpret(expression)
+
+            reporter.flush(sink)
+
+        self.assertEqual(sink.entries, [
+            ('9', False),
+            ('Operand must be a number.\n[line 1]', True),
+            ('[line 1] Error at end: Expect expression.', False),
+            ('biscotti', False)
+        ])
+
+        self.assertEqual(sink.output, ['9', '[line 1] Error at end: Expect expression.', 'biscotti'])
+        self.assertEqual(sink.errors, ['Operand must be a number.\n[line 1]'])
+
+class CountingFile(StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        return super().write(text)
+
+class TestLoxOutput(TestCase):
+    def setUp(self) -> None:
+        plox.lox.output.flush()
+        plox.lox.cache.clear()
+
+    def test_batches(self) -> None:
+        # Runs leave what they print buffered, so many runs take one write.
+        file = CountingFile()
+
+        with redirect_stdout(file):
+            for number in range(100):
+                plox.lox.run(f'{number} + 1')
+
+            self.assertEqual(file.writes, 0)
+
+            plox.lox.output.flush()
+
+        self.assertEqual(file.getvalue(), ''.join(f'{number + 1}\n' for number in range(100)))
+        self.assertEqual(file.writes, 1)
+
+    def test_errors_in_order(self) -> None:
+        # A runtime error writes out what was printed before it.
+        file = StringIO()
+
+        with redirect_stdout(file), redirect_stderr(file):
+            plox.lox.run('1')
+            plox.lox.run('(2')
+            plox.lox.run('-nil')
+            plox.lox.run('3')
+
+            self.assertEqual(file.getvalue(), (
+                "1\n"
+                "[line 1] Error at end: Expect ')' after expression.\n"
+                "Operand must be a number.\n[line 1]\n"
+            ))
+
+            plox.lox.output.flush()
+
+        self.assertTrue(file.getvalue().endswith('[line 1]\n3\n'))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+import sys
+
+from unittest import TestCase, main
+
+from corpus import check_evaluator, check_parser, sources
+
+from plox.ast_printer import AstPrinter, StackPrinter
+from plox.interpreter import StackInterpreter
+from plox.parser import Parser
+from plox.scanner import Scanner
+from plox.stack_parser import StackParser
+
+class TestStackParser(TestCase):
+    def test_same_as_parser(self) -> None:
+        check_parser(self, lambda tokens, reporter: StackParser(tokens, reporter=reporter).parse())
+
+    def test_deep_nesting(self) -> None:
+        depth = sys.getrecursionlimit() * 20
+
+        source = '- ' * depth + '(' * depth + '1' + ')' * depth
+        expression = StackParser(Scanner(source).scan_tokens()).parse()
+        assert expression is not None
+
+        self.assertEqual(StackInterpreter().evaluate(expression), 1)
+
+        printed = StackPrinter().print(expression)
+        self.assertEqual(printed, '(- ' * depth + '(group ' * depth + '1.0' + ')' * depth * 2)
+
+class TestStackEvaluation(TestCase):
+    def test_same_as_recursion(self) -> None:
+        check_evaluator(self, StackInterpreter().evaluate)
+
+    def test_same_printing(self) -> None:
+        for source in sources:
+            expression = Parser(Scanner(source).scan_tokens()).parse()
+            if expression is None: continue
+
+            with self.subTest(source=source):
+                self.assertEqual(StackPrinter().print(expression), AstPrinter().print(expression))
+
+if __name__ == '__main__':
+    main()
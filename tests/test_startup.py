@@ -0,0 +1,83 @@
+import os
+import subprocess
+import sys
+
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def imported_after(code: str, cwd: str) -> set:
+    # The plox modules a fresh process has imported after running the code.
+    result = subprocess.run(
+        [sys.executable, '-c', f'{code}\nimport sys\nprint(*sys.modules)'],
+        cwd=cwd,
+        env=dict(os.environ, PYTHONPATH=root),
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    modules = result.stdout.split()
+    return {module for module in modules if module.startswith('plox.')}
+
+class TestLazyImports(TestCase):
+    def test_import(self) -> None:
+        with TemporaryDirectory() as directory:
+            imported = imported_after('import plox.lox', directory)
+
+        self.assertEqual(imported, {'plox.lox', 'plox.error', 'plox.sink', 'plox.token', 'plox.run_cache', 'plox.expressions'})
+
+    def test_no_exit_handlers(self) -> None:
+        # Importing plox registers nothing to run at exit. Running it does,
+        # so that buffered output is written.
+        code = 'import atexit\nbefore = atexit._ncallbacks()\nimport plox.lox\nprint(atexit._ncallbacks() - before)'
+
+        with TemporaryDirectory() as directory:
+            result = subprocess.run(
+                [sys.executable, '-c', code],
+                cwd=directory,
+                env=dict(os.environ, PYTHONPATH=root),
+                capture_output=True,
+                text=True,
+                check=True
+            )
+
+            with open(os.path.join(directory, 'biscotti.lox'), 'w') as file:
+                file.write('1 + 2\n')
+
+            run = subprocess.run(
+                [sys.executable, '-c', 'import sys\nimport plox.lox\nsys.argv = ["plox", "biscotti.lox"]\nplox.lox.lox()'],
+                cwd=directory,
+                env=dict(os.environ, PYTHONPATH=root),
+                capture_output=True,
+                text=True,
+                check=True
+            )
+
+        self.assertEqual(result.stdout, '0\n')
+        self.assertEqual(run.stdout, '3\n')
+
+    def test_cached_run(self) -> None:
+        with TemporaryDirectory() as directory:
+            with open(os.path.join(directory, 'biscotti.lox'), 'w') as file:
+                file.write('1 + 2\n')
+
+            run = 'import plox.lox\nplox.lox.run_file("biscotti.lox")'
+
+            first = imported_after(run, directory)
+            second = imported_after(run, directory)
+
+        self.assertIn('plox.scanner', first)
+        self.assertIn('plox.parser', first)
+
+        # With the AST cached, nothing needs scanning or parsing.
+        self.assertNotIn('plox.scanner', second)
+        self.assertNotIn('plox.parser', second)
+        self.assertIn('plox.interpreter', second)
+
+        for module in ['plox.ast_printer', 'plox.parallel', 'plox.profiler', 'plox.stats']:
+            self.assertNotIn(module, first | second)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+import json
+import tracemalloc
+
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from unittest import TestCase, main
+
+import plox.lox
+
+from plox.parser import Parser
+from plox.scanner import Scanner
+from plox.stats import RunStats
+
+class TestRunStats(TestCase):
+    def test_counts(self) -> None:
+        stats = RunStats(memory=True)
+        source = '(1 + 2) * "café"'
+
+        with stats.phase('scan'):
+            tokens = Scanner(source).scan_tokens()
+
+        stats.stop()
+
+        stats.count_source(source)
+        stats.tokens = len(tokens)
+        stats.count_nodes(Parser(tokens).parse())
+
+        report = json.loads(stats.json())
+
+        self.assertEqual((report['bytes'], report['tokens'], report['nodes']), (17, 8, 6))
+        self.assertEqual(list(report['phases']), ['scan'])
+        self.assertGreater(report['phases']['scan']['peak'], 0)
+
+    def test_without_memory(self) -> None:
+        # Phases are timed without tracing allocations unless memory is
+        # asked for, since tracing distorts the times.
+        stats = RunStats()
+        tracing = tracemalloc.is_tracing()
+
+        with stats.phase('scan'):
+            self.assertEqual(tracemalloc.is_tracing(), tracing)
+            Scanner('1 + 2').scan_tokens()
+
+        report = json.loads(stats.json())
+
+        self.assertIsNone(report['phases']['scan']['peak'])
+        self.assertGreater(report['phases']['scan']['wall'], 0)
+        self.assertTrue(stats.text().splitlines()[2].endswith(' -'))
+
+    def test_count_streamed_tokens(self) -> None:
+        stats = RunStats()
+        tokens = Scanner('1 + 2').scan_tokens()
+
+        self.assertEqual(list(stats.count_tokens(iter(tokens))), tokens)
+        self.assertEqual(stats.tokens, 4)
+
+class TestLox(TestCase):
+    def test_report_per_run(self) -> None:
+        output = StringIO()
+        errors = StringIO()
+
+        plox.lox.cache.clear()
+        plox.lox.set_option('--stats=json,memory')
+
+        tracing = tracemalloc.is_tracing()
+
+        try:
+            with redirect_stdout(output), redirect_stderr(errors):
+                plox.lox.run('1 + 2 == 3 // with stats')
+                plox.lox.run('4 / 2')
+        finally:
+            plox.lox.stats_format = None
+            plox.lox.stats_memory = False
+
+        reports = [json.loads(line) for line in errors.getvalue().splitlines()]
+
+        self.assertEqual(output.getvalue(), 'true\n2\n')
+        self.assertEqual([report['nodes'] for report in reports], [5, 3])
+        self.assertEqual(list(reports[0]['phases']), ['scan', 'parse', 'evaluate'])
+        self.assertIsNotNone(reports[0]['phases']['scan']['peak'])
+
+        # Tracing slows down every allocation, so it ends with the run.
+        self.assertEqual(tracemalloc.is_tracing(), tracing)
+
+    def test_deep_expression(self) -> None:
+        # The stack parser handles nesting of any depth, and so must the
+        # node count.
+        output = StringIO()
+        errors = StringIO()
+
+        plox.lox.cache.clear()
+        plox.lox.set_option('--parser=stack')
+        plox.lox.stats_format = 'json'
+
+        try:
+            with redirect_stdout(output), redirect_stderr(errors):
+                plox.lox.run('-' * 20000 + '1')
+        finally:
+            plox.lox.parser_name = 'default'
+            plox.lox.interpreter = None
+            plox.lox.stats_format = None
+
+        self.assertEqual(output.getvalue(), '1\n')
+        self.assertEqual(json.loads(errors.getvalue())['nodes'], 20001)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+from io import StringIO
+from unittest import TestCase, main
+
+import plox.lox
+
+from plox.error import Diagnostic, Reporter
+from plox.parser import Parser
+from plox.regex_scanner import RegexScanner
+from plox.stream_scanner import StreamScanner
+
+sources = [
+    '',
+    '1 != 2 >= 3 <= 4 // Please do not mutate the biscotti.\n5 / 6',
+    'biscotti hazelnut 123.456 789.',
+    '"one chunk\nis not enough" "" "biscotti',
+    'bis@cotti\n\n\n!\n=',
+]
+
+def scan(source: str, chunk_size: int) -> tuple:
+    scanner = StreamScanner(StringIO(source), chunk_size)
+    tokens = list(scanner.scan_tokens())
+
+    return (tokens, scanner.reporter.diagnostics)
+
+class TestChunks(TestCase):
+    def test_matches_whole_source(self) -> None:
+        for source in sources:
+            scanner = RegexScanner(source)
+            tokens = scanner.scan_tokens()
+
+            for chunk_size in range(1, 8):
+                with self.subTest(source=source, chunk_size=chunk_size):
+                    self.assertEqual(
+                        scan(source, chunk_size),
+                        (tokens, scanner.reporter.diagnostics)
+                    )
+
+    def test_long_lexemes(self) -> None:
+        # Lexemes and comments many chunks long, some left open at the end.
+        long = 'x' * 1000
+
+        for source in [
+            f'1 "{long}" 2',
+            f'1 // {long}\n2',
+            f'{long} 1{"0" * 1000}.5 ',
+            f'1 {" " * 1000}\n 2 "{long}'
+        ]:
+            scanner = RegexScanner(source)
+            tokens = scanner.scan_tokens()
+
+            for chunk_size in [1, 7, 64]:
+                with self.subTest(source=source[:8], chunk_size=chunk_size):
+                    self.assertEqual(
+                        scan(source, chunk_size),
+                        (tokens, scanner.reporter.diagnostics)
+                    )
+
+class TestParsing(TestCase):
+    def test_parse_stream(self) -> None:
+        source = '!(1 + 2) * -3 == 4 / 5 != "biscotti"'
+
+        tokens = RegexScanner(source).scan_tokens()
+        stream = StreamScanner(StringIO(source), 3).scan_tokens()
+
+        self.assertEqual(Parser(stream).parse(), Parser(tokens).parse())
+
+    def test_parse_error(self) -> None:
+        reporter = Reporter()
+
+        stream = StreamScanner(StringIO('(1 + 2'), 3, reporter).scan_tokens()
+        expression = Parser(stream, reporter=reporter).parse()
+
+        self.assertIsNone(expression)
+        self.assertEqual(reporter.diagnostics, [Diagnostic(1, ' at end', "Expect ')' after expression.")])
+
+class TestLox(TestCase):
+    def test_diagnostics_in_order(self) -> None:
+        # Streamed sources report scan errors before parse errors, as
+        # sources scanned whole do, even when a scan error comes later.
+        for source in ['(1 2) @', '1 +\n@ 2 3', 'bis@cotti', '"biscotti\n1 +']:
+            with self.subTest(source=source):
+                expected = Reporter()
+                plox.lox.run_source(source, expected)
+
+                reporter = Reporter()
+                plox.lox.run_tokens(StreamScanner(StringIO(source), 2, reporter).scan_tokens(), reporter)
+
+                self.assertEqual(reporter.diagnostics, expected.diagnostics)
+                self.assertEqual(reporter.exit_code, expected.exit_code)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+from unittest import TestCase, main
+
+from plox.parser import Parser
+from plox.scanner import Scanner
+from plox.token_buffer import BufferScanner
+
+from plox.token import TokenType as TT
+
+source = '''\
+// Please do not mutate the biscotti.
+var biscotti = "hazel
+nut";
+(1.5 + 2) * -3 >= 4 != !true
+'''
+
+class TestBuffer(TestCase):
+    def test_matches_scanner(self) -> None:
+        buffer = BufferScanner(source).scan_buffer()
+        tokens = Scanner(source).scan_tokens()
+
+        self.assertEqual(len(buffer), len(tokens))
+        self.assertEqual(list(buffer), tokens)
+
+    def test_random_access(self) -> None:
+        buffer = BufferScanner(source).scan_buffer()
+
+        self.assertEqual(buffer.type(3), TT.STRING)
+        self.assertEqual(buffer.lexeme(3), '"hazel\nnut"')
+        self.assertEqual(buffer.literal(3), 'hazel\nnut')
+        self.assertEqual(buffer.line(3), 3)
+
+        self.assertEqual(buffer[-1].type, TT.EOF)
+        self.assertEqual(buffer[-1].line, 5)
+
+    def test_reuses_tokens(self) -> None:
+        # Going back and forth between two tokens, as the parser does, builds
+        # each of them once.
+        buffer = BufferScanner(source).scan_buffer()
+
+        previous = buffer[3]
+        current = buffer[4]
+
+        self.assertIs(buffer[3], previous)
+        self.assertIs(buffer[4], current)
+
+        buffer[5]
+        self.assertIs(buffer[4], current)
+
+class TestParsing(TestCase):
+    def test_parse_buffer(self) -> None:
+        expression = '!(1 + 2) * -3 == 4 / 5 != "biscotti"'
+
+        buffer = BufferScanner(expression).scan_buffer()
+        tokens = Scanner(expression).scan_tokens()
+
+        self.assertEqual(Parser(buffer).parse(), Parser(tokens).parse())
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+from unittest import TestCase, main, skipIf
+
+from corpus import parse
+
+import plox.vectorized
+
+from plox.interpreter import Interpreter
+
+@skipIf(plox.vectorized.numpy is None, 'NumPy is not installed.')
+class TestVectorized(TestCase):
+    def assert_matches_rows(self, template: str, rows: list) -> None:
+        # Each row gives the source text of every literal in the template, so
+        # that literal positions and placeholders line up.
+        expression = parse(template.format(*rows[0]))
+
+        columns = {}
+        for position in range(len(rows[0])):
+            values = [parse(row[position]).accept(Interpreter()) for row in rows]
+            columns[position] = values
+
+        result = plox.vectorized.evaluate(expression, columns)
+
+        for (row, texts) in enumerate(rows):
+            scalar = parse(template.format(*texts))
+
+            try:
+                expected = Interpreter().evaluate(scalar)
+            except plox.error.RuntimeError as error:
+                self.assertIsNotNone(result.errors[row])
+                self.assertEqual(result.errors[row].message, error.message)
+                self.assertEqual(result.errors[row].token, error.token)
+                continue
+
+            self.assertIsNone(result.errors[row])
+            self.assertEqual(result.value(row), expected)
+            self.assertIs(type(result.value(row)), type(expected))
+
+    def test_numbers(self) -> None:
+        self.assert_matches_rows('({} + {}) * -{} - {} / {} >= {}', [
+            ('1', '2', '2', '3', '4', '1'),
+            ('5', '2', '6', '7', '0', '1'),
+            ('0', '2', '0', '0', '1', '1')
+        ])
+
+    def test_mixed_types(self) -> None:
+        self.assert_matches_rows('!({} + {}) == ({} < {})', [
+            ('1', '2', '3', '3'),
+            ('"bis"', '"cotti"', '4', '3'),
+            ('"bis"', '1', '2', '3'),
+            ('nil', 'nil', '"biscotti"', '3'),
+            ('true', '1', '2', '3')
+        ])
+
+    def test_first_error_wins(self) -> None:
+        self.assert_matches_rows('-{} + ({} / {})', [
+            ('"biscotti"', '1', '0'),
+            ('1', '1', '0'),
+            ('1', '1', '2')
+        ])
+
+    def test_constant_operands(self) -> None:
+        result = plox.vectorized.evaluate(parse('1 + 2'), {0: [1.0, 2.0, 3.0]})
+
+        self.assertEqual(result.values.tolist(), [3.0, 4.0, 5.0])
+        self.assertFalse(result.failed.any())
+
+if __name__ == '__main__':
+    main()